@@ -0,0 +1,71 @@
+# coding: utf-8
+"""Compares the JSON codecs of `coinbase.wallet.codec` that are installed.
+
+For each codec, times decoding pages of transactions as the API returns them,
+encoding request bodies, and fetching a whole paginated listing through a
+client using the codec (against canned responses, as in `pagination.py`).
+`Response.json()`, which the client used before, is included as a baseline.
+
+    python benchmarks/json_codecs.py [pages] [items-per-page]
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import timeit
+
+import requests
+
+from coinbase.wallet.codec import available_codecs
+from coinbase.wallet.codec import get_codec
+
+# Found next to this script.
+from pagination import CannedClient
+from pagination import make_pages
+
+REQUEST_BODY = {
+    'type': 'send',
+    'to': '1AUJ8z5RuHRTqD1eikyfUUetzGmdWLGkpT',
+    'amount': '0.1',
+    'currency': 'BTC',
+    'description': 'Sample transaction for you',
+    'idem': '9316dd16-0c05',
+}
+
+
+def best_of(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def decode_with_requests(pages):
+    for page in pages:
+        response = requests.Response()
+        response._content = page
+        response.encoding = 'utf-8'
+        response.json()
+
+
+def main(argv):
+    page_count = int(argv[1]) if len(argv) > 1 else 20
+    per_page = int(argv[2]) if len(argv) > 2 else 100
+    pages = make_pages(page_count, per_page)
+    size = sum(len(page) for page in pages) / 1024 / 1024
+    print('%d pages of %d transactions (%.1f MB)' % (page_count, per_page, size))
+
+    print('%-10s %12s %12s %12s' % ('codec', 'decode', 'encode', 'listing'))
+    print('%-10s %9.1f ms' % ('requests', best_of(lambda: decode_with_requests(pages), 3) * 1000))
+    for name in available_codecs():
+        codec = get_codec(name)
+        decode = best_of(lambda: [codec.loads(page) for page in pages], 3)
+        encode = best_of(lambda: codec.dumps(REQUEST_BODY), 10000)
+        client = CannedClient(pages)
+        client.json_codec = codec
+        listing = best_of(lambda: client.get_transactions('acct'), 3)
+        print('%-10s %9.1f ms %9.1f us %9.1f ms' % (
+            name, decode * 1000, encode * 1e6, listing * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
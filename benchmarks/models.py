@@ -0,0 +1,105 @@
+# coding: utf-8
+"""Measures the cost of turning decoded JSON into models.
+
+Builds a listing of transactions, as `Client.get_transactions` would from a
+decoded response, with both the current `new_api_object` and the previous
+implementation, which computed a set of keys for every dict and built each
+model through `__init__` and one `__setitem__` per key; with the lazy models
+of `new_lazy_api_object`, reading the fields most code uses; and with the
+compact models of `coinbase.wallet.compact`. On Python 3, the memory taken by
+the models is reported too.
+
+    python benchmarks/models.py [transactions]
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import sys
+import timeit
+
+import six
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+from coinbase.wallet import model
+from coinbase.wallet.compact import new_compact_object
+from coinbase.wallet.model import APIObject
+from coinbase.wallet.model import Transaction
+from coinbase.wallet.model import new_api_object
+from coinbase.wallet.model import new_lazy_api_object
+
+# Found next to this script.
+from pagination import make_transaction
+
+
+def legacy_new_api_object(client, obj, cls=None, **kwargs):
+    if isinstance(obj, dict):
+        if not cls:
+            resource = obj.get('resource', None)
+            cls = model._resource_to_model.get(resource, None)
+        if not cls:
+            obj_keys = set(six.iterkeys(obj))
+            for keys, candidate in six.iteritems(model._obj_keys_to_model):
+                if keys <= obj_keys:
+                    cls = candidate
+                    break
+        cls = cls or APIObject
+        result = cls(client, **kwargs)
+        for k, v in six.iteritems(obj):
+            result[k] = legacy_new_api_object(client, v)
+        return result
+    if isinstance(obj, list):
+        return [legacy_new_api_object(client, v, cls) for v in obj]
+    return obj
+
+
+def read_lazily(client, data):
+    transactions = new_lazy_api_object(client, data)
+    for tx in transactions:
+        tx.id, tx.status, tx.amount.amount, tx.created_at
+    return transactions
+
+
+def measure_memory(build, client, data):
+    """Returns the bytes allocated by `build(client, data)`, or None."""
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        models = build(client, data)  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+    data = [make_transaction(i) for i in range(count)]
+    client = object()
+    builders = [
+        ('legacy', legacy_new_api_object),
+        ('current', new_api_object),
+        ('lazy', read_lazily),
+        ('compact', new_compact_object),
+    ]
+    for name, build in builders:
+        transactions = build(client, data)
+        # Compact models name the model they stand for.
+        assert getattr(transactions[0], 'model', type(transactions[0])) is Transaction
+        assert transactions[0].amount.currency == 'BTC'
+        del transactions
+        best = min(timeit.repeat(lambda: build(client, data), number=1, repeat=5))
+        line = '%-8s %d transactions: %.1f ms' % (name, count, best * 1000)
+        memory = measure_memory(build, client, data)
+        if memory is not None:
+            line += ', %.1f MB' % (memory / 1024 / 1024)
+        print(line)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
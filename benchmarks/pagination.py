@@ -0,0 +1,115 @@
+# coding: utf-8
+"""Measures the cost of fetching and modelling a long paginated listing.
+
+The network is replaced by canned responses, so the numbers only reflect the
+client-side work: decoding each page, merging the pages and building models.
+The previous recursive implementation of `Client._get`, which re-serialized the
+merged pages into the last response and decoded it again, is included as a
+baseline.
+
+    python benchmarks/pagination.py [pages] [items-per-page]
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import sys
+import timeit
+
+import requests
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.model import Transaction
+
+
+def make_transaction(i):
+    return {
+        'id': 'tx-%08d' % i,
+        'type': 'send',
+        'status': 'completed',
+        'amount': {'amount': '-0.00100000', 'currency': 'BTC'},
+        'native_amount': {'amount': '-0.01', 'currency': 'USD'},
+        'description': None,
+        'created_at': '2015-03-11T13:13:35-07:00',
+        'updated_at': '2015-03-26T15:55:43-07:00',
+        'resource': 'transaction',
+        'resource_path': '/v2/accounts/acct/transactions/tx-%08d' % i,
+        'network': {'status': 'confirmed', 'hash': 'a' * 64, 'confirmations': 12},
+        'to': {'resource': 'bitcoin_address', 'address': '1AUJ8z5RuHRTqD1eikyfUUetzGmdWLGkpT'},
+        'details': {'title': 'Sent bitcoin', 'subtitle': 'to User 2'},
+    }
+
+
+def make_pages(page_count, per_page):
+    pages = []
+    for p in range(page_count):
+        items = [make_transaction(p * per_page + i) for i in range(per_page)]
+        next_uri = None
+        if p + 1 < page_count:
+            next_uri = '/v2/accounts/acct/transactions?starting_after=%s' % items[-1]['id']
+        body = {'pagination': {'next_uri': next_uri, 'limit': per_page}, 'data': items}
+        pages.append(json.dumps(body).encode('utf-8'))
+    return pages
+
+
+class CannedClient(Client):
+    """Serves pre-encoded pages instead of talking to the network."""
+
+    def __init__(self, pages):
+        super(CannedClient, self).__init__('key', 'secret')
+        self._pages = pages
+        self._by_cursor = {}
+        for i, page in enumerate(pages[:-1]):
+            cursor = json.loads(page.decode('utf-8'))['data'][-1]['id']
+            self._by_cursor[cursor] = i + 1
+
+    def _request(self, method, *relative_path_parts, **kwargs):
+        params = kwargs.get('params') or {}
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self._create_api_uri(*relative_path_parts)
+        response._content = self._pages[self._by_cursor.get(params.get('starting_after'), 0)]
+        return response
+
+
+class LegacyClient(CannedClient):
+    """Reproduces the original recursive `_get`, for comparison."""
+
+    def _get(self, *args, **kwargs):
+        prev_data = kwargs.pop('prev_data', [])
+        resp = self._request('get', *args, **kwargs)
+        resp_content = resp._content.decode('utf-8')
+        content = json.loads(resp_content)
+        page_info = content['pagination']
+        if not page_info['next_uri']:
+            content['data'].extend(prev_data)
+            resp._content = json.dumps(content).encode('utf-8')
+            return resp
+        prev_data.extend(content['data'])
+        kwargs.update({
+            'prev_data': prev_data,
+            'params': {'starting_after': page_info['next_uri'].split('=')[-1]},
+        })
+        return self._get(*args, **kwargs)
+
+    def _make_api_object(self, response, model_type=None, blob=None):
+        return super(LegacyClient, self)._make_api_object(
+            response, model_type, response.json())
+
+
+def main(argv):
+    page_count = int(argv[1]) if len(argv) > 1 else 50
+    per_page = int(argv[2]) if len(argv) > 2 else 100
+    pages = make_pages(page_count, per_page)
+    for name, client in [('legacy', LegacyClient(pages)), ('current', CannedClient(pages))]:
+        listing = client.get_transactions('acct')
+        assert len(listing.data) == page_count * per_page
+        assert isinstance(listing.data[0], Transaction)
+        best = min(timeit.repeat(lambda: client.get_transactions('acct'), number=1, repeat=5))
+        print('%-8s %d pages x %d items: %.1f ms' % (name, page_count, per_page, best * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
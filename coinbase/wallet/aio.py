@@ -0,0 +1,699 @@
+# coding: utf-8
+"""asyncio support for the Coinbase API.
+
+Requires Python 3.6+ and `aiohttp`, which can be installed along with this
+library with `pip install coinbase[async]`.
+"""
+import asyncio
+import collections
+import heapq
+import inspect
+import time
+import traceback
+import weakref
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.client import OAuthClient
+from coinbase.wallet.compat import urlsplit
+from coinbase.wallet.error import build_api_error
+from coinbase.wallet.model import APIObject
+from coinbase.wallet.pagination import Paginator
+from coinbase.wallet.pagination import RETRYABLE_PAGE_ERRORS
+from coinbase.wallet.pagination import next_cursor
+from coinbase.wallet.pagination import page_items
+from coinbase.wallet.sync import prepare_sync
+from coinbase.wallet.util import encode_params
+from coinbase.wallet.util import endpoint_group
+
+
+class AsyncPaginator(Paginator):
+    """asyncio counterpart of `Paginator`, to be iterated with `async for`.
+
+    Supports the same options; with `prefetch`, upcoming pages are requested by a
+    background task instead of a thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncPaginator, self).__init__(*args, **kwargs)
+        self._prefetch_task = None
+
+    def __next__(self):
+        raise TypeError('Use `async for` to iterate over an AsyncPaginator.')
+
+    next = __next__
+
+    def __aiter__(self):
+        return self
+
+    def __await__(self):
+        # `AsyncClient.get_*(..., iterator=True)` returns the paginator; awaiting
+        # it, like the result of any other method of the client, gives it back.
+        return self._itself().__await__()
+
+    async def _itself(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        super(AsyncPaginator, self).close()
+        self._cancel_prefetch()
+
+    def __del__(self):
+        self._cancel_prefetch()
+
+    def _cancel_prefetch(self):
+        task = getattr(self, '_prefetch_task', None)
+        if task is not None and not task.done():
+            try:
+                task.cancel()
+            except RuntimeError:
+                # Its event loop is closed.
+                pass
+
+    async def __anext__(self):
+        if self._item_budget_spent():
+            self.close()
+            raise StopAsyncIteration
+        while not self._items:
+            if not self._can_fetch():
+                raise StopAsyncIteration
+            response, blob = await self._next_page()
+            self._add_page_items(await self.client._make_api_object(
+                response, self.model_type, blob, raw=self.raw))
+        return self._pop_item()
+
+    async def iter_pages(self):
+        while self._can_fetch():
+            page = await self._next_page()
+            self.cursor = self._next_cursor
+            yield page
+
+    async def _next_page(self):
+        if self.prefetch:
+            response, blob = await self._next_prefetched_page()
+        else:
+            response, blob = await self._fetch_page(self.cursor)
+        self._record_page(blob)
+        return response, blob
+
+    async def _fetch_page(self, cursor):
+        params = self._page_params(cursor)
+        attempt = 0
+        while True:
+            try:
+                response = await self.client._request(
+                    'get', *self.relative_path_parts, params=params, **self.request_kwargs)
+                return response, self.client._decode_response(response)
+            except RETRYABLE_PAGE_ERRORS:
+                if attempt >= self.page_retries or self._closed.is_set():
+                    raise
+            await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+    async def _next_prefetched_page(self):
+        if self._prefetched is None:
+            self._prefetched = asyncio.Queue(maxsize=self.prefetch)
+            # Like the thread of a `Paginator`, the task only holds a weak
+            # reference to the paginator, so that it also stops once the paginator
+            # is dropped without being closed.
+            self._prefetch_task = asyncio.ensure_future(_prefetch_pages(
+                weakref.ref(self), self._prefetched, self._closed, self.cursor,
+                self.pages_fetched, self.max_pages))
+        page, error = await self._prefetched.get()
+        if error is not None:
+            # The background task has stopped; the next call starts a new one
+            # from the last page that was received.
+            self._prefetched = None
+            raise error
+        return page
+
+
+async def _prefetch_pages(paginator_ref, prefetched, closed, cursor, pages, max_pages):
+    """Runs as the background task of an `AsyncPaginator`, queueing pages ahead
+    of its consumer until the paginator is closed or garbage collected.
+    """
+    while True:
+        paginator = paginator_ref()
+        if paginator is None or closed.is_set():
+            return
+        try:
+            page = await paginator._fetch_page(cursor)
+        except Exception as e:
+            # The frames of the traceback would keep the paginator alive.
+            traceback.clear_frames(e.__traceback__)
+            del paginator
+            await _put_prefetched(paginator_ref, prefetched, closed, (None, e))
+            return
+        del paginator
+        if not await _put_prefetched(paginator_ref, prefetched, closed, (page, None)):
+            return
+        pages += 1
+        cursor = next_cursor(page[1])
+        if cursor is None or (max_pages is not None and pages >= max_pages):
+            return
+
+
+async def _put_prefetched(paginator_ref, prefetched, closed, item):
+    """Queues `item`, waiting for room as long as the paginator is in use.
+    Returns whether it was queued.
+    """
+    while not closed.is_set() and paginator_ref() is not None:
+        try:
+            await asyncio.wait_for(prefetched.put(item), 0.1)
+            return True
+        except asyncio.TimeoutError:
+            pass
+    return False
+
+
+class _AdaptiveSlot(object):
+    """Holds a slot of an `AdaptiveConcurrencyLimit` for the duration of an
+    `async with` block, reporting how the block went when it ends.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.token = None
+
+    async def __aenter__(self):
+        self.token = self.limit.try_acquire()
+        if self.token is not None:
+            return self
+        waiters = _SlotWaiters.get(self.limit)
+        async with waiters.condition:
+            waiters.waiting += 1
+            try:
+                while True:
+                    self.token = self.limit.try_acquire()
+                    if self.token is not None:
+                        return self
+                    await waiters.condition.wait()
+            finally:
+                waiters.waiting -= 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Cancellation (not an Exception subclass) says nothing about the API.
+        self.limit.release(self.token, exc if isinstance(exc, Exception) else None)
+
+
+class _SlotWaiters(object):
+    """The tasks of one event loop waiting for a slot of an
+    `AdaptiveConcurrencyLimit`, woken up whenever a slot is freed or the limit
+    changes.
+    """
+
+    # For each limit, the waiters of each event loop.
+    _by_limit = weakref.WeakKeyDictionary()
+
+    def __init__(self, loop):
+        self._loop = weakref.ref(loop)
+        self.condition = asyncio.Condition()
+        self.waiting = 0
+
+    @classmethod
+    def get(cls, limit):
+        """Returns the waiters of `limit` on the running event loop."""
+        by_loop = cls._by_limit.get(limit, None)
+        if by_loop is None:
+            by_loop = cls._by_limit[limit] = weakref.WeakKeyDictionary()
+            limit.add_release_callback(
+                lambda: [waiters.notify() for waiters in list(by_loop.values())])
+        loop = asyncio.get_event_loop()
+        waiters = by_loop.get(loop, None)
+        if waiters is None:
+            waiters = by_loop[loop] = cls(loop)
+        return waiters
+
+    def notify(self):
+        # Called by `release`, from any thread: a `Client` may share the limit.
+        loop = self._loop()
+        if not self.waiting or loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._notify)
+        except RuntimeError:
+            # The event loop is closed.
+            pass
+
+    def _notify(self):
+        asyncio.ensure_future(self._notify_all())
+
+    async def _notify_all(self):
+        async with self.condition:
+            self.condition.notify_all()
+
+
+class _AsyncSingleFlight(object):
+    """asyncio counterpart of `coinbase.wallet.coalesce.SingleFlight`. The call
+    runs in a task of its own, so that it goes on if the caller that started
+    it is cancelled while others wait for it.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    async def do(self, key, coro_fn):
+        task = self._tasks.get(key, None)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(coro_fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def __len__(self):
+        return len(self._tasks)
+
+
+class AsyncClient(Client):
+    """asyncio client for the Coinbase API.
+
+    Offers the same methods as `coinbase.wallet.client.Client`, as coroutines:
+    `await client.get_accounts()`. The `iter_*` methods return asynchronous
+    iterators, to be used with `async for`; list methods called with
+    `iterator=True` return the same iterators, which can also be awaited like
+    any other result (`async for a in await client.get_accounts(iterator=True)`).
+    Responses are parsed into the same models; model methods that call the API
+    (`account.get_transactions()`, `buy.commit()`, ...) must be awaited as well.
+
+    Requests are signed by the same `auth` classes as the synchronous client and
+    sent with aiohttp, over a pool of at most `max_connections` connections
+    (further requests wait for a free connection; 0 means no limit). Call `close`
+    when done with the client, or use it as an asynchronous context manager.
+    """
+
+    MAX_CONNECTIONS = 100
+
+    paginator_class = AsyncPaginator
+
+    def __init__(self, api_key, api_secret, base_api_uri=None, api_version=None,
+                 max_connections=None, **options):
+        super(AsyncClient, self).__init__(
+            api_key, api_secret, base_api_uri, api_version, **options)
+        if max_connections is not None:
+            self.MAX_CONNECTIONS = max_connections
+
+    def _build_session(self, auth_class, *args, **kwargs):
+        """Sets up request signing. The aiohttp session itself is only created on
+        first use, so that it belongs to the running event loop.
+        """
+        if aiohttp is None:  # pragma: no cover
+            raise ImportError(
+                'AsyncClient requires aiohttp; install it with `pip install coinbase[async]`.')
+        self.auth = auth_class(*args, **kwargs)
+        return None
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS, ssl=None if self.VERIFY_SSL else False)
+            kwargs = {}
+            if self.timeout is not None:
+                kwargs['timeout'] = aiohttp.ClientTimeout(total=self.timeout)
+            self.session = aiohttp.ClientSession(connector=connector, **kwargs)
+        return self.session
+
+    async def close(self):
+        """Closes the underlying connection pool."""
+        for task in getattr(self, '_background_tasks', ()):
+            task.cancel()
+        if self.session is not None:
+            await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(self, method, *relative_path_parts, **kwargs):
+        """Internal helper for creating HTTP requests to the Coinbase API.
+
+        The request is prepared and signed exactly as the synchronous client
+        would, and the aiohttp response is turned into a `requests.Response`, so
+        that error handling and model parsing are shared between both clients.
+        """
+        raw = self._pop_raw(kwargs)
+        uri = self._create_api_uri(*relative_path_parts)
+        params = kwargs.get('params', None)
+        validator_key, validated = self._validated(method, uri, params)
+        data = kwargs.get('data', None)
+        retry_policy = self.retry_policy
+        if retry_policy is not None and not retry_policy.allows(method, data):
+            retry_policy = None
+        if data and isinstance(data, dict):
+            data = encode_params(data, codec=self.json_codec)
+        group = endpoint_group(relative_path_parts)
+        started = time.time()
+        attempt = 1
+        send = self._send_hedged if method == 'get' and self.hedging is not None else self._send
+        while True:
+            try:
+                response = await send(
+                    method, uri, group, params=params, data=data, validated=validated)
+                return self._mark_raw(self._revalidate(validator_key, validated, response), raw)
+            except Exception as e:
+                delay = retry_policy and retry_policy.next_delay(e, attempt, time.time() - started)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method, uri, group, params=None, data=None, validated=None):
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(group)
+        try:
+            response = await self._send_once(method, uri, group, params, data, validated)
+        except BaseException as e:
+            if breaker is not None:
+                breaker.after_request(group, e)
+            raise
+        if breaker is not None:
+            breaker.after_request(group)
+        return response
+
+    async def _send_once(self, method, uri, group, params, data, validated):
+        if self.rate_limiter is not None:
+            await asyncio.sleep(self.rate_limiter.reserve(group))
+        headers = self._default_headers()
+        if validated is not None:
+            headers.update(validated.conditional_headers())
+        # Signed only now, so that the signature's timestamp is current.
+        request = requests.Request(
+            method.upper(), uri, params=params, data=data,
+            headers=headers, auth=self.auth).prepare()
+        try:
+            async with self._get_session().request(
+                    request.method, yarl.URL(request.url, encoded=True),
+                    data=request.body, headers=dict(request.headers)) as resp:
+                content = await resp.read()
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = request.url
+        response.request = request
+        response._content = content
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(group, response)
+        return self._handle_response(response, validated)
+
+    async def _send_hedged(self, method, uri, group, **kwargs):
+        # See `Client._send_hedged`; here, the request that loses the race is
+        # cancelled.
+        async def attempt():
+            started = time.time()
+            response = await self._send(method, uri, group, **kwargs)
+            self.hedging.record(group, time.time() - started)
+            return response
+
+        tasks = [asyncio.ensure_future(attempt())]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=self.hedging.delay(group))
+            if not done:
+                tasks.append(asyncio.ensure_future(attempt()))
+            first_error = None
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get(self, *args, **kwargs):
+        mode = self._raw_mode(self._pop_raw(kwargs))
+        keep_bodies = mode == 'bytes'
+        cache_key = self._cache_key(args, kwargs.get('params', None))
+        if cache_key is not None:
+            response = self._cached_response(cache_key)
+            if response is not None:
+                return self._mark_raw(response, mode)
+        if not self.coalesce_gets:
+            response = await self._get_pages(cache_key, keep_bodies, *args, **kwargs)
+        else:
+            response = await self._single_flight().do(
+                self._flight_key(args, dict(kwargs, raw=mode)),
+                lambda: self._get_pages(cache_key, keep_bodies, *args, **kwargs))
+        return self._mark_raw(response, mode)
+
+    async def _get_pages(self, cache_key, keep_bodies, *args, **kwargs):
+        # See `Client._get_pages`.
+        pages = AsyncPaginator(self, None, *args, page_retries=0, **kwargs).iter_pages()
+        response, first_blob = await pages.__anext__()
+        blob = first_blob
+        bodies = [self._body(response, first_blob)] if keep_bodies else None
+        async for response, page_blob in pages:
+            if blob is first_blob:
+                blob = dict(first_blob, data=list(first_blob['data']))
+            blob['data'].extend(page_blob['data'])
+            blob['pagination'] = page_blob['pagination']
+            response._coinbase_blob = blob
+            if bodies is not None:
+                bodies.append(self._body(response, page_blob))
+        if bodies is not None:
+            response._coinbase_bodies = bodies
+        if cache_key is not None and blob is not None:
+            self.cache.set(cache_key, {'url': response.url, 'blob': blob})
+        return response
+
+    def _single_flight(self):
+        return self.__dict__.setdefault('_in_flight', _AsyncSingleFlight())
+
+    async def _get_final(self, *args, **kwargs):
+        # See `Client._get_final`.
+        request_kwargs = dict(kwargs)
+        raw = self._pop_raw(request_kwargs)
+        cache = self.resource_cache
+        if (cache is None or request_kwargs.get('params', None) or
+                request_kwargs.get('data', None)):
+            return await self._get(*args, **kwargs)
+        resource_path = urlsplit(self._create_api_uri(*args)).path
+        entry = cache.get(resource_path)
+        if entry is not None:
+            return self._mark_raw(self._stored_response(entry), raw)
+        response = await self._get(*args, **kwargs)
+        self._store_final(resource_path, response)
+        return response
+
+    async def _get_price(self, price_type, params):
+        # See `Client._get_price`; here, stale quotes are refreshed in a task.
+        kwargs = {'params': params}
+        raw = self._pop_raw(kwargs)
+        params = kwargs['params']
+        currency_pair = params.get('currency_pair', 'BTC-USD')
+        cache = self.price_cache
+
+        def fetch():
+            return self._get('v2', 'prices', currency_pair, price_type, params=params)
+
+        if cache is None:
+            return await self._make_api_object(fetch(), APIObject, raw=raw)
+        key = cache.key(currency_pair, price_type, params)
+        response, age = cache.lookup(key)
+        if response is None:
+            response = await fetch()
+            cache.store(key, response)
+            response.headers['Age'] = '0'
+        elif age > cache.max_age and cache.claim_refresh(key):
+            self._start_background(self._refresh_price(key, fetch))
+        return await self._make_api_object(response, APIObject, raw=raw)
+
+    async def _refresh_price(self, key, fetch):
+        try:
+            self.price_cache.store(key, await fetch())
+        except Exception:
+            # Keep serving the stale quote until it expires.
+            pass
+        finally:
+            self.price_cache.release(key)
+
+    def _start_background(self, coro):
+        """Runs `coro` in a task that is kept alive until it completes, or is
+        cancelled when the client is closed.
+        """
+        tasks = self.__dict__.setdefault('_background_tasks', set())
+        task = asyncio.ensure_future(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _make_api_object(self, response, model_type=None, blob=None, raw=None):
+        if inspect.isawaitable(response):
+            response = await response
+        return super(AsyncClient, self)._make_api_object(response, model_type, blob, raw)
+
+    async def _update_api_object(self, obj, data):
+        data = await data
+        obj.update(data)
+        return data
+
+    async def _iter_new_api_objects(self, cursor_store, model_type, *args, **kwargs):
+        # See `coinbase.wallet.sync.iter_new_items`, which this mirrors.
+        cursor_store, key, params = prepare_sync(cursor_store, args, kwargs.pop('params', None))
+        raw = params.pop('raw', None)
+        cursor = cursor_store.get(key)
+        if cursor is None:
+            newest = None
+            paginator = AsyncPaginator(self, model_type, *args, params=params, **kwargs)
+            async for response, blob in paginator.iter_pages():
+                if newest is None and blob['data']:
+                    newest = blob['data'][0].get('id', None)
+                page = await self._make_api_object(response, model_type, blob, raw=raw)
+                for item in page_items(page):
+                    yield item
+            if newest is not None:
+                cursor_store.set(key, newest)
+            return
+
+        while True:
+            response = await self._request(
+                'get', *args, params=dict(params, ending_before=cursor), **kwargs)
+            blob = self._decode_response(response)
+            page = await self._make_api_object(response, model_type, blob, raw=raw)
+            data = blob['data']
+            if not data:
+                return
+            for item in reversed(page_items(page)):
+                yield item
+            cursor = data[0].get('id', cursor)
+            cursor_store.set(key, cursor)
+            if len(data) < params['limit']:
+                return
+
+    async def _get_by_ids(self, get_one, ids, max_workers=8, **params):
+        # See `Client._get_by_ids`, which this mirrors.
+        ids = list(ids)
+        unique_ids = list(collections.OrderedDict.fromkeys(ids))
+        slot = self._batch_slots(max_workers)
+
+        async def call(id_):
+            async with slot():
+                return await get_one(id_, **params)
+
+        results = await asyncio.gather(*map(call, unique_ids), return_exceptions=True)
+        by_id = dict(zip(unique_ids, results))
+        return [by_id[id_] for id_ in ids]
+
+    def _batch_slots(self, max_workers):
+        """Returns a factory of async context managers which, between them, let at
+        most `max_workers` tasks through at once, or as many as the client's
+        `concurrency_limit` allows.
+        """
+        if self.concurrency_limit is None:
+            semaphore = asyncio.Semaphore(max_workers)
+            return lambda: semaphore
+        return lambda: _AdaptiveSlot(self.concurrency_limit)
+
+    async def delete_account(self, account_id, **params):
+        """https://developers.coinbase.com/api/v2#delete-account"""
+        await self._delete('v2', 'accounts', account_id, data=params)
+        return None
+
+    async def get_for_accounts(self, listing, accounts=None, max_workers=8, **params):
+        """See `Client.get_for_accounts`; at most `max_workers` of the requests are
+        in flight at once.
+        """
+        method = getattr(self, 'get_%s' % self._check_account_listing(listing))
+        return_exceptions = params.pop('return_exceptions', False)
+        account_ids = await self._account_ids(accounts)
+        slot = self._batch_slots(max_workers)
+
+        async def call(account_id):
+            async with slot():
+                return await method(account_id, **params)
+
+        results = await asyncio.gather(
+            *[call(account_id) for account_id in account_ids],
+            return_exceptions=return_exceptions)
+        return collections.OrderedDict(zip(account_ids, results))
+
+    async def iter_for_accounts(self, listing, accounts=None, max_workers=8, **params):
+        """See `Client.iter_for_accounts`."""
+        method = getattr(self, 'iter_%s' % self._check_account_listing(listing))
+        params = self._merge_raw(params)
+        account_ids = await self._account_ids(accounts)
+        iterators = [method(account_id, **params) for account_id in account_ids]
+        sign = 1 if params.get('order', 'desc') == 'asc' else -1
+        slot = self._batch_slots(max_workers)
+
+        async def first(index):
+            async with slot():
+                return await self._next_entry(iterators, index, sign)
+
+        heap = [entry for entry in await asyncio.gather(*map(first, range(len(iterators))))
+                if entry is not None]
+        heapq.heapify(heap)
+        while heap:
+            _, index, item = heap[0]
+            yield item
+            entry = await self._next_entry(iterators, index, sign)
+            if entry is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, entry)
+
+    async def _next_entry(self, iterators, index, sign):
+        try:
+            item = await iterators[index].__anext__()
+        except StopAsyncIteration:
+            return None
+        return sign * self._created_at_key(item), index, item
+
+    async def _account_ids(self, accounts):
+        if accounts is None:
+            return [account['id'] async for account in self.iter_accounts(raw=False)]
+        return super(AsyncClient, self)._account_ids(accounts)
+
+
+class AsyncOAuthClient(AsyncClient, OAuthClient):
+    """asyncio counterpart of `coinbase.wallet.client.OAuthClient`."""
+
+    def __init__(self, access_token, refresh_token, base_api_uri=None, api_version=None,
+                 max_connections=None, **options):
+        OAuthClient.__init__(
+            self, access_token, refresh_token, base_api_uri, api_version, **options)
+        if max_connections is not None:
+            self.MAX_CONNECTIONS = max_connections
+
+    async def revoke(self):
+        """https://developers.coinbase.com/docs/wallet/coinbase-connect#revoking-an-access-token"""
+        await self._post('oauth', 'revoke', data={'token': self.access_token})
+        return None
+
+    async def refresh(self):
+        """Attempt to refresh the current access token / refresh token pair.
+
+        See `coinbase.wallet.client.OAuthClient.refresh`.
+        """
+        params = {
+            'grant_type': 'refresh_token',
+            'refresh_token': self.refresh_token
+        }
+        response = await self._post('oauth', 'token', params=params)
+        blob = self._decode_response(response) or {}
+        self.access_token = blob.get('access_token', None)
+        self.refresh_token = blob.get('refresh_token', None)
+        if not (self.access_token and self.refresh_token):
+            raise build_api_error(response, blob, codec=self.json_codec)
+        return blob
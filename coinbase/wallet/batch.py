@@ -0,0 +1,227 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import heapq
+import sys
+import threading
+import time
+
+import requests
+import six
+from six.moves import queue
+
+from coinbase.wallet.error import APIError
+from coinbase.wallet.error import CircuitOpenError
+from coinbase.wallet.error import RateLimitExceededError
+
+# Errors that signal an overloaded API, on which `AdaptiveConcurrencyLimit`
+# backs off. API errors with a 5xx status code count as well.
+OVERLOAD_ERRORS = (
+    RateLimitExceededError,
+    CircuitOpenError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class AdaptiveConcurrencyLimit(object):
+    """Limit on the number of requests that batch operations keep in flight at
+    once, adjusted by additive increase / multiplicative decrease (AIMD).
+
+    Each time `limit` requests in a row complete without trouble, the limit
+    grows by `increase`, up to `max_limit`. It is multiplied by `decrease`
+    (down to `min_limit`) when a request fails with one of `OVERLOAD_ERRORS`
+    or a 5xx error, or takes more than `latency_tolerance` times the usual
+    latency (a moving average of past requests) and `LATENCY_SLACK` longer.
+    Requests that were started before the last decrease do not cause another
+    one, so that a burst of failures only counts once.
+
+    `limit` and `in_flight` can be read at any time, e.g. to be reported as
+    metrics. A single instance may be shared by several clients and threads.
+    """
+
+    # Weight of each new sample in the moving average of latencies.
+    LATENCY_SMOOTHING = 0.1
+
+    # Latencies within this many seconds of the average never count as slow,
+    # however large the ratio (local jitter on very fast requests).
+    LATENCY_SLACK = 0.05
+
+    def __init__(self, initial=4, min_limit=1, max_limit=64, increase=1, decrease=0.5,
+                 latency_tolerance=2.0):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError('Expected 1 <= min_limit <= initial <= max_limit.')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.latency = None
+        self._limit = float(initial)
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._release_callbacks = []
+
+    @property
+    def limit(self):
+        """The number of requests currently allowed in flight at once."""
+        return int(self._limit)
+
+    def try_acquire(self):
+        """Takes a slot for a request if one is free, returning a token to pass
+        to `release`; otherwise returns None.
+        """
+        with self._condition:
+            if self.in_flight >= self.limit:
+                return None
+            self.in_flight += 1
+            return time.time()
+
+    def acquire(self):
+        """Blocks until a slot is free, then takes it; returns a token to pass
+        to `release`.
+        """
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+            return time.time()
+
+    def release(self, token, error=None):
+        """Frees the slot taken at `token`, adjusting the limit to the outcome
+        of the request: `error` is the exception it raised, if any.
+        """
+        now = time.time()
+        latency = now - token
+        with self._condition:
+            self.in_flight -= 1
+            overloaded = self._is_overload(error)
+            if error is None and not overloaded:
+                slow = (self.latency is not None and
+                        latency > self.latency * self.latency_tolerance and
+                        latency > self.latency + self.LATENCY_SLACK)
+                if self.latency is None:
+                    self.latency = latency
+                else:
+                    self.latency += (latency - self.latency) * self.LATENCY_SMOOTHING
+                overloaded = slow
+            if overloaded:
+                if token >= self._last_decrease:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._last_decrease = now
+                    self._successes = 0
+            elif error is None:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self._limit = min(self.max_limit, self._limit + self.increase)
+                    self._successes = 0
+            self._condition.notify_all()
+        for callback in list(self._release_callbacks):
+            callback()
+
+    def add_release_callback(self, callback):
+        """Calls `callback()`, from the releasing thread, after each `release`:
+        whenever a slot is freed or the limit changes. Used to wake up waiters
+        that cannot block on a `threading.Condition`, such as asyncio tasks.
+        """
+        self._release_callbacks.append(callback)
+
+    @staticmethod
+    def _is_overload(error):
+        if isinstance(error, APIError):
+            return isinstance(error, RateLimitExceededError) or error.status_code >= 500
+        return isinstance(error, OVERLOAD_ERRORS)
+
+
+def map_concurrently(fn, items, max_workers=8, return_exceptions=False, limit=None):
+    """Calls `fn` on each of `items` from up to `max_workers` threads at once and
+    returns the results in the order of `items`.
+
+    Given an `AdaptiveConcurrencyLimit` as `limit`, up to `limit.max_limit`
+    threads are started instead, but only as many calls as the limit currently
+    allows run at once.
+
+    If `return_exceptions` is true, an exception raised by a call is returned in
+    place of its result. Otherwise no new calls are started after the first
+    failure, and that exception is raised once the calls in progress have
+    finished.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    failures = []
+    pending = queue.Queue()
+    for index in range(len(items)):
+        pending.put(index)
+
+    def call(item):
+        if limit is None:
+            return fn(item)
+        token = limit.acquire()
+        try:
+            result = fn(item)
+        except Exception as e:
+            limit.release(token, e)
+            raise
+        limit.release(token)
+        return result
+
+    def work():
+        while not (failures and not return_exceptions):
+            try:
+                index = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[index] = call(items[index])
+            except Exception as e:
+                if return_exceptions:
+                    results[index] = e
+                else:
+                    failures.append(sys.exc_info())
+
+    if limit is not None:
+        max_workers = limit.max_limit
+    threads = [threading.Thread(target=work) for _ in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if failures:
+        six.reraise(*failures[0])
+    return results
+
+
+_exhausted = object()
+
+
+def iter_merged(iterators, key, reverse=False, max_workers=8, limit=None):
+    """Merges `iterators`, each already sorted by `key`, into one sorted stream.
+
+    The first item of every iterator is requested concurrently (from up to
+    `max_workers` threads, or as `limit` allows; see `map_concurrently`), since
+    for paginated listings that means fetching a page from each; after that,
+    items are pulled from whichever iterator holds the next one in order.
+    """
+    iterators = list(iterators)
+    sign = -1 if reverse else 1
+    heap = []
+    firsts = map_concurrently(
+        lambda it: next(it, _exhausted), iterators, max_workers, limit=limit)
+    for index, item in enumerate(firsts):
+        if item is not _exhausted:
+            heap.append((sign * key(item), index, item))
+    heapq.heapify(heap)
+    while heap:
+        _, index, item = heap[0]
+        yield item
+        item = next(iterators[index], _exhausted)
+        if item is _exhausted:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (sign * key(item), index, item))
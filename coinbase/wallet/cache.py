@@ -0,0 +1,468 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import json
+import math
+import sqlite3
+import threading
+import time
+import uuid
+
+import requests
+
+# Default number of seconds for which the responses of each endpoint group are
+# cached. Groups that are not listed are never cached.
+DEFAULT_TTLS = {
+    'currencies': 3600,
+    'exchange-rates': 60,
+    'merchants': 3600,
+    'payment-methods': 300,
+    'time': 1,
+}
+
+# Endpoint groups whose responses are the same for every user, and can thus be
+# shared between clients.
+PUBLIC_GROUPS = frozenset(['currencies', 'exchange-rates', 'merchants', 'prices', 'time'])
+
+
+class CacheBackend(object):
+    """Storage for `ResponseCache`. Values are JSON-serializable, so any
+    key-value store can be used by implementing these methods.
+    """
+
+    def get(self, key):
+        """Returns the value stored under `key`, or None if there is none or it
+        has expired."""
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        """Stores `value` under `key` for `ttl` seconds."""
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix):
+        """Removes every value whose key starts with `prefix`."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process backend holding up to `max_entries` values; the least
+    recently used one is evicted to make room for a new one.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            # Mark as most recently used.
+            del self._entries[key]
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.time() + ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResponseCache(object):
+    """Cache of the decoded responses of rarely changing endpoints, such as
+    `get_currencies` or `get_payment_methods`.
+
+    `ttls` maps endpoint groups (see `coinbase.wallet.util.endpoint_group`) to
+    the number of seconds their responses are kept for, overriding
+    `DEFAULT_TTLS`; a TTL of 0 or None disables caching for a group. Responses
+    are stored in `backend`, an in-memory LRU `MemoryCacheBackend` of
+    `max_entries` entries by default.
+
+    Responses of `PUBLIC_GROUPS` are shared by all clients using the cache;
+    others are only served back to the client that fetched them.
+    """
+
+    def __init__(self, ttls=None, backend=None, max_entries=1024):
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.backend = backend if backend is not None else MemoryCacheBackend(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, client, group, path, params=None):
+        """Returns the key under which a GET request's response is cached, or
+        None if responses of `group` are not cached.
+        """
+        if not self.ttls.get(group, None):
+            return None
+        scope = 'public' if group in PUBLIC_GROUPS else _client_scope(client)
+        query = json.dumps(params or {}, sort_keys=True)
+        return '%s|%s|%s|%s' % (group, scope, path, query)
+
+    def get(self, key):
+        """Returns the cached value for `key`, counting a hit or a miss."""
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value):
+        group = key.split('|', 1)[0]
+        self.backend.set(key, value, self.ttls[group])
+
+    def invalidate(self, group=None):
+        """Drops the cached responses of `group`, or of every group."""
+        groups = [group] if group is not None else list(self.ttls)
+        for group in groups:
+            self.backend.delete_prefix('%s|' % group)
+
+    def stats(self):
+        """Returns the hit and miss counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+def _client_scope(client):
+    scope = getattr(client, '_cache_scope', None)
+    if scope is None:
+        scope = client._cache_scope = uuid.uuid4().hex
+    return scope
+
+
+class Validated(collections.namedtuple('Validated', 'etag last_modified blob size')):
+    """Validators and decoded body of a response held by `ValidatorCache`."""
+
+    __slots__ = ()
+
+    def conditional_headers(self):
+        """Returns the headers that make a request conditional on this response."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ValidatorCache(object):
+    """Remembers the `ETag` and `Last-Modified` validators of GET responses,
+    along with their decoded bodies, so that later requests for the same URL
+    can be made conditional: when the API answers 304 Not Modified, the body
+    decoded the first time is used again.
+
+    At most `max_entries` responses, with bodies totalling at most `max_bytes`,
+    are kept; the least recently used ones are evicted first. `hits` counts
+    the 304 responses, `misses` the conditional requests that returned new
+    data.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, client, uri, params=None):
+        """Returns the key of a GET request in the cache."""
+        query = json.dumps(params or {}, sort_keys=True)
+        return '%s|%s|%s' % (_client_scope(client), uri, query)
+
+    def get(self, key):
+        """Returns the `Validated` entry of `key`, or None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def set(self, key, response, blob):
+        """Stores the validators and decoded body of `response`, if it has any
+        validators and is small enough.
+        """
+        etag = response.headers.get('ETag', None)
+        last_modified = response.headers.get('Last-Modified', None)
+        size = len(response.content or b'')
+        if not (etag or last_modified) or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self._entries[key] = Validated(etag, last_modified, blob, size)
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def record(self, not_modified):
+        """Counts the outcome of a conditional request."""
+        with self._lock:
+            if not_modified:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        """Returns the hit and miss counters, and the number and total size of
+        the stored responses."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'bytes': self.size}
+
+
+class PriceCache(object):
+    """Stale-while-revalidate cache of the quotes returned by `get_buy_price`,
+    `get_sell_price` and `get_spot_price`, keyed by currency pair and price
+    type.
+
+    Quotes younger than `max_age` seconds are served without a request. Older
+    ones are still served right away, while a single background request
+    refreshes them; once older than `max_stale` seconds (never, if None), they
+    are refetched before returning. A failed background refresh leaves the
+    stale quote in place.
+
+    The age of a served quote, in whole seconds, is given by the `Age` header
+    of its response, e.g. `client.get_spot_price().response.headers['Age']`.
+    """
+
+    def __init__(self, max_age=5, max_stale=60, max_entries=1024):
+        if max_stale is not None and max_stale < max_age:
+            raise ValueError('`max_stale` must be at least `max_age`.')
+        self.max_age = max_age
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def key(self, currency_pair, price_type, params=None):
+        """Returns the key of a quote in the cache."""
+        query = json.dumps(params or {}, sort_keys=True)
+        return '%s|%s|%s' % (currency_pair, price_type, query)
+
+    def lookup(self, key):
+        """Returns the cached response for `key` and its age in seconds, or
+        `(None, None)` if there is none that may still be served.
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+        if entry is None:
+            return None, None
+        url, blob, fetched_at = entry
+        age = max(0.0, time.time() - fetched_at)
+        if self.max_stale is not None and age > self.max_stale:
+            return None, None
+        return _response(url, blob, age), age
+
+    def store(self, key, response):
+        """Caches the decoded body of `response` under `key`."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (response.url, response._coinbase_blob, time.time())
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def claim_refresh(self, key):
+        """Returns whether the caller should refresh `key`: True unless another
+        refresh of it is already running. A claim is ended by `release`.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def get(self, key, fetch):
+        """Returns the response for `key`, calling `fetch` to get a new one
+        when there is no usable quote, or in a background thread when the quote
+        is stale.
+        """
+        response, age = self.lookup(key)
+        if response is None:
+            response = fetch()
+            self.store(key, response)
+            response.headers['Age'] = '0'
+            return response
+        if age > self.max_age and self.claim_refresh(key):
+            thread = threading.Thread(target=self._refresh, args=(key, fetch))
+            thread.daemon = True
+            thread.start()
+        return response
+
+    def _refresh(self, key, fetch):
+        try:
+            self.store(key, fetch())
+        except Exception:
+            # Keep serving the stale quote until it expires.
+            pass
+        finally:
+            self.release(key)
+
+
+def _response(url, blob, age):
+    """Returns a cached body as a `requests.Response` with an `Age` header."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers['Age'] = str(int(age))
+    response._content = b''
+    response._coinbase_blob = blob
+    return response
+
+
+# Statuses in which each type of resource no longer changes.
+TERMINAL_STATUSES = {
+    'transaction': frozenset(['completed', 'failed', 'expired', 'canceled']),
+    'buy': frozenset(['completed', 'canceled']),
+    'sell': frozenset(['completed', 'canceled']),
+    'deposit': frozenset(['completed', 'canceled']),
+    'withdrawal': frozenset(['completed', 'canceled']),
+    'report': frozenset(['completed']),
+}
+
+
+def is_terminal(data):
+    """Whether the decoded resource `data` is in a state it cannot leave."""
+    if not isinstance(data, dict):
+        return False
+    statuses = TERMINAL_STATUSES.get(data.get('resource', None), ())
+    return data.get('status', None) in statuses
+
+
+class ResourceCache(object):
+    """Persistent cache of resources that no longer change, such as completed
+    transactions, committed buys and sells, or finished reports (see
+    `TERMINAL_STATUSES`), keyed by their `resource_path`.
+
+    The resources are kept in the SQLite database at `path`, which any number
+    of threads and processes on the host can share. Beyond `max_entries`
+    resources, or `max_bytes` bytes of them, the least recently used ones are
+    evicted.
+
+    Resource paths do not identify the user, so a database should only be
+    shared by clients acting on behalf of the same user.
+    """
+
+    # Seconds to wait for another process to release the database.
+    LOCK_TIMEOUT = 30
+    # Seconds within which reading a resource again does not update its last
+    # access time, so that most cache hits do not write to the database.
+    ACCESS_RESOLUTION = 60
+    # Once a limit is exceeded, resources are evicted until the cache is back
+    # below this fraction of it, rather than one at a time.
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, path, max_entries=100000, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS resources ('
+                'path TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                'size INTEGER NOT NULL, accessed REAL NOT NULL)')
+            db.execute(
+                'CREATE INDEX IF NOT EXISTS resources_accessed ON resources (accessed)')
+            # Running totals, so that inserts need not count the resources.
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS totals ('
+                'id INTEGER PRIMARY KEY CHECK (id = 0), '
+                'entries INTEGER NOT NULL, size INTEGER NOT NULL)')
+            db.execute(
+                'CREATE TRIGGER IF NOT EXISTS resources_insert AFTER INSERT ON resources '
+                'BEGIN UPDATE totals SET entries = entries + 1, size = size + NEW.size; END')
+            db.execute(
+                'CREATE TRIGGER IF NOT EXISTS resources_delete AFTER DELETE ON resources '
+                'BEGIN UPDATE totals SET entries = entries - 1, size = size - OLD.size; END')
+            db.execute(
+                'INSERT OR IGNORE INTO totals (id, entries, size) '
+                'SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM resources')
+
+    def _connection(self):
+        """Returns this thread's connection to the database; connections cannot
+        be shared between threads.
+        """
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=self.LOCK_TIMEOUT)
+            # Readers do not block the writer, nor the other way around.
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def get(self, resource_path):
+        """Returns the value stored for `resource_path`, or None."""
+        with self._connection() as db:
+            row = db.execute(
+                'SELECT value, accessed FROM resources WHERE path = ?',
+                (resource_path,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[1] >= self.ACCESS_RESOLUTION:
+                db.execute('UPDATE resources SET accessed = ? WHERE path = ?',
+                           (now, resource_path))
+        return json.loads(row[0])
+
+    def set(self, resource_path, value):
+        """Stores the JSON-serializable `value` for `resource_path`."""
+        encoded = json.dumps(value)
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+        with self._connection() as db:
+            # Not INSERT OR REPLACE, which does not fire the delete trigger.
+            db.execute('DELETE FROM resources WHERE path = ?', (resource_path,))
+            db.execute(
+                'INSERT INTO resources (path, value, size, accessed) VALUES (?, ?, ?, ?)',
+                (resource_path, encoded, size, time.time()))
+            count, total = db.execute('SELECT entries, size FROM totals').fetchone()
+            if count <= self.max_entries and total <= self.max_bytes:
+                return
+            max_entries = math.ceil(self.max_entries * self.EVICTION_TARGET)
+            max_bytes = math.ceil(self.max_bytes * self.EVICTION_TARGET)
+            evicted = []
+            rows = db.execute('SELECT path, size FROM resources ORDER BY accessed')
+            for path, size in rows:
+                if count <= max_entries and total <= max_bytes:
+                    break
+                evicted.append((path,))
+                count -= 1
+                total -= size
+            db.executemany('DELETE FROM resources WHERE path = ?', evicted)
+
+    def __len__(self):
+        with self._connection() as db:
+            return db.execute('SELECT entries FROM totals').fetchone()[0]
@@ -0,0 +1,113 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+import time
+
+import requests
+
+from coinbase.wallet.error import APIError
+from coinbase.wallet.error import CircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+# Errors that count as failures of the API itself, rather than of the request.
+FAILURE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class _Circuit(object):
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker(object):
+    """Stops sending requests to a group of endpoints (see
+    `coinbase.wallet.util.endpoint_group`) that is failing.
+
+    After `failure_threshold` consecutive failures (5xx responses, connection
+    errors and timeouts) the circuit of the group opens: requests to it fail
+    immediately with `CircuitOpenError`. After `reset_timeout` seconds, it lets
+    up to `half_open_requests` requests through as probes; the circuit closes
+    again if a probe succeeds, and reopens if one fails. Other groups are not
+    affected.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, half_open_requests=1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, group):
+        """Returns the state of the circuit of `group`: 'closed', 'open' or
+        'half-open'.
+        """
+        with self._lock:
+            circuit = self._circuits.get(group, None)
+            return circuit.state if circuit is not None else CLOSED
+
+    def before_request(self, group):
+        """Raises CircuitOpenError if a request to `group` may not be sent now."""
+        with self._lock:
+            circuit = self._circuits.get(group, None)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            retry_in = circuit.opened_at + self.reset_timeout - time.time()
+            if circuit.state == OPEN and retry_in <= 0:
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_requests:
+                circuit.probes += 1
+                return
+            raise CircuitOpenError(group, max(0.0, retry_in))
+
+    def after_request(self, group, error=None):
+        """Records the outcome of a request to `group` that was let through:
+        success if `error` is None or an error response other than a 5xx,
+        failure for 5xx responses and `FAILURE_ERRORS`. Other errors (such as
+        the request being cancelled) are not counted either way.
+        """
+        if error is None or isinstance(error, APIError) and error.status_code < 500:
+            failed = False
+        elif isinstance(error, APIError) or isinstance(error, FAILURE_ERRORS):
+            failed = True
+        else:
+            failed = None
+        with self._lock:
+            circuit = self._circuits.get(group, None)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[group] = _Circuit()
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed:
+                    self._open(circuit)
+                elif failed is False:
+                    circuit.state = CLOSED
+                    circuit.failures = 0
+            elif circuit.state == CLOSED:
+                if failed:
+                    circuit.failures += 1
+                    if circuit.failures >= self.failure_threshold:
+                        self._open(circuit)
+                elif failed is False:
+                    circuit.failures = 0
+
+    def _open(self, circuit):
+        circuit.state = OPEN
+        circuit.opened_at = time.time()
+        circuit.failures = 0
+        circuit.probes = 0
@@ -5,17 +5,32 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import base64
+import collections
+import copy
+import functools
 import json
 import os
 import requests
+import requests.adapters
 import six
+import sys
+import threading
+import time
 import warnings
+from six.moves import queue
 
 from coinbase.wallet.auth import HMACAuth
 from coinbase.wallet.auth import OAuth2Auth
+from coinbase.wallet.batch import iter_merged
+from coinbase.wallet.batch import map_concurrently
 from coinbase.wallet.compat import imap
+from coinbase.wallet.cache import is_terminal
+from coinbase.wallet.codec import default_codec
+from coinbase.wallet.coalesce import SingleFlight
+from coinbase.wallet.compact import new_compact_object
 from coinbase.wallet.compat import quote
 from coinbase.wallet.compat import urljoin
+from coinbase.wallet.compat import urlsplit
 from coinbase.wallet.error import build_api_error
 from coinbase.wallet.model import APIObject
 from coinbase.wallet.model import Account
@@ -34,8 +49,13 @@ from coinbase.wallet.model import Report
 from coinbase.wallet.model import User
 from coinbase.wallet.model import Withdrawal
 from coinbase.wallet.model import new_api_object
+from coinbase.wallet.model import new_lazy_api_object
+from coinbase.wallet.pagination import Paginator
+from coinbase.wallet.sync import iter_new_items
 from coinbase.wallet.util import check_uri_security
 from coinbase.wallet.util import encode_params
+from coinbase.wallet.util import endpoint_group
+from coinbase.wallet.util import parse_timestamp
 
 from Crypto.Hash import SHA256
 from Crypto.PublicKey import RSA
@@ -47,6 +67,10 @@ COINBASE_CRT_PATH = os.path.join(
 COINBASE_CALLBACK_PUBLIC_KEY_PATH = os.path.join(
     os.path.dirname(os.path.realpath(__file__)), 'coinbase-callback.pub')
 
+# Listings under /v2/accounts/:account_id that `Client.get_for_accounts` and
+# `Client.iter_for_accounts` can fan out over.
+ACCOUNT_LISTINGS = ('addresses', 'transactions', 'buys', 'sells', 'deposits', 'withdrawals')
+
 
 class Client(object):
     """API Client for the Coinbase API.
@@ -61,6 +85,56 @@ class Client(object):
 
     Full API docs, including descriptions of each API and its paramters, are
     available here: https://developers.coinbase.com/api
+
+    A single client may be shared by any number of threads. Connections are
+    pooled: `pool_maxsize` sets how many connections are kept open to the API
+    host (size it to the number of threads sharing the client), `pool_connections`
+    how many per-host pools are cached, and `pool_block` whether a thread should
+    wait for a free connection, rather than open a throwaway one, once
+    `pool_maxsize` connections are in use.
+
+    Requests can be throttled on the client side by passing a
+    `coinbase.wallet.ratelimit.RateLimiter` as `rate_limiter`, and retried after
+    transient failures according to a `coinbase.wallet.retry.RetryPolicy` passed
+    as `retry_policy`. Passing a `coinbase.wallet.hedging.HedgingPolicy` as
+    `hedging` cuts the tail latency of GET requests by sending a duplicate of
+    any request that is slower than usual; the first response is used. With a
+    `coinbase.wallet.circuit.CircuitBreaker` as `circuit_breaker`, requests to a
+    group of endpoints that keeps failing fail fast with `CircuitOpenError`
+    instead; `timeout` bounds how long each request may take.
+
+    The batch methods (`get_for_accounts`, `get_*_by_ids`, ...) run up to
+    `max_workers` requests at once, or, given a
+    `coinbase.wallet.batch.AdaptiveConcurrencyLimit` as `concurrency_limit`, as
+    many as the API currently handles comfortably.
+
+    Responses of endpoints whose data rarely changes (`get_currencies`,
+    `get_payment_methods`, ...) can be kept in a `coinbase.wallet.cache.ResponseCache`
+    passed as `cache`. With a `coinbase.wallet.cache.ValidatorCache` as
+    `validator_cache`, GET requests are made conditional on the `ETag` and
+    `Last-Modified` headers of earlier responses, and a 304 Not Modified answer
+    reuses the body decoded before. Quotes (`get_spot_price`, ...) can be
+    served from a `coinbase.wallet.cache.PriceCache` passed as `price_cache`,
+    and resources that no longer change (completed transactions, ...) from a
+    persistent `coinbase.wallet.cache.ResourceCache` passed as `resource_cache`.
+
+    Identical GET requests made concurrently from several threads are sent
+    only once, and share the response (or error), unless `coalesce_gets` is
+    False.
+
+    With `compact_models`, responses are turned into the `__slots__`-based
+    models of `coinbase.wallet.compact`, which take far less memory. With
+    `lazy_models`, the nested values of regular models are only turned into
+    models when first accessed.
+
+    Request bodies are encoded, and responses decoded, by `json_codec`: by
+    default the fastest of the backends of `coinbase.wallet.codec` installed.
+
+    With `raw` set to 'dicts' (or True), methods return the decoded body of
+    the response, as plain dicts and lists, instead of models; with 'bytes',
+    the undecoded body, or for listings a list of the bodies of their pages.
+    Iterators yield plain dicts, or the body of each page. Any method also
+    takes `raw` for a single call: `client.get_transactions(id, raw='bytes')`.
     """
 
     VERIFY_SSL = True
@@ -68,9 +142,68 @@ class Client(object):
     BASE_API_URI = 'https://api.coinbase.com/'
     API_VERSION = '2016-02-18'
 
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    POOL_BLOCK = False
+
+    # Optional `coinbase.wallet.ratelimit.RateLimiter` applied to every request.
+    rate_limiter = None
+
+    # Optional `coinbase.wallet.retry.RetryPolicy` for failed requests.
+    retry_policy = None
+
+    # Optional `coinbase.wallet.hedging.HedgingPolicy` for GET requests.
+    hedging = None
+
+    # Optional `coinbase.wallet.circuit.CircuitBreaker` guarding every request.
+    circuit_breaker = None
+
+    # Optional `coinbase.wallet.cache.ResponseCache` for rarely changing data.
+    cache = None
+
+    # Optional `coinbase.wallet.cache.ValidatorCache` for conditional GET requests.
+    validator_cache = None
+
+    # Optional `coinbase.wallet.cache.PriceCache` for buy, sell and spot prices.
+    price_cache = None
+
+    # Optional `coinbase.wallet.cache.ResourceCache` for resources in a final state.
+    resource_cache = None
+
+    # Whether concurrent identical GET requests share a single API request.
+    coalesce_gets = True
+
+    # Whether responses are turned into `coinbase.wallet.compact` models.
+    compact_models = False
+
+    # Whether nested values are turned into models on first access only.
+    lazy_models = False
+
+    # `coinbase.wallet.codec` codec for request and response bodies.
+    json_codec = default_codec()
+
+    # What methods return instead of models: False, 'dicts' (or True) or 'bytes'.
+    raw = False
+
+    # Optional `coinbase.wallet.batch.AdaptiveConcurrencyLimit` for the batch
+    # methods (`get_for_accounts`, `get_*_by_ids`, ...), replacing `max_workers`.
+    concurrency_limit = None
+
+    # Seconds to wait for the API to respond before raising
+    # `requests.exceptions.Timeout`; None waits indefinitely.
+    timeout = None
+
     cached_callback_public_key = None
 
-    def __init__(self, api_key, api_secret, base_api_uri=None, api_version=None):
+    # Iterator class returned by the `iter_*` methods.
+    paginator_class = Paginator
+
+    def __init__(self, api_key, api_secret, base_api_uri=None, api_version=None,
+                 pool_connections=None, pool_maxsize=None, pool_block=None,
+                 rate_limiter=None, retry_policy=None, hedging=None, circuit_breaker=None,
+                 timeout=None, concurrency_limit=None, cache=None, validator_cache=None,
+                 price_cache=None, resource_cache=None, coalesce_gets=None,
+                 compact_models=None, lazy_models=None, json_codec=None, raw=None):
         if not api_key:
             raise ValueError('Missing `api_key`.')
         if not api_secret:
@@ -81,6 +214,16 @@ class Client(object):
 
         self.API_VERSION = api_version or self.API_VERSION
 
+        self._configure_pool(pool_connections, pool_maxsize, pool_block)
+        self._configure_options(
+            rate_limiter=rate_limiter, retry_policy=retry_policy, hedging=hedging,
+            circuit_breaker=circuit_breaker, timeout=timeout,
+            concurrency_limit=concurrency_limit, cache=cache,
+            validator_cache=validator_cache, price_cache=price_cache,
+            resource_cache=resource_cache, coalesce_gets=coalesce_gets,
+            compact_models=compact_models, lazy_models=lazy_models,
+            json_codec=json_codec, raw=raw)
+
         # Set up a requests session for interacting with the API.
         self.session = self._build_session(HMACAuth, api_key, api_secret, self.API_VERSION)
 
@@ -90,12 +233,39 @@ class Client(object):
         """
         session = requests.session()
         session.auth = auth_class(*args, **kwargs)
-        session.headers.update({'CB-VERSION': self.API_VERSION,
-                                'Accept': 'application/json',
-                                'Content-Type': 'application/json',
-                                'User-Agent': 'coinbase/python/2.0'})
+        session.headers.update(self._default_headers())
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=self.POOL_BLOCK)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         return session
 
+    def _configure_pool(self, pool_connections=None, pool_maxsize=None, pool_block=None):
+        """Internal helper for overriding the connection pool defaults."""
+        if pool_connections is not None:
+            self.POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            self.POOL_MAXSIZE = pool_maxsize
+        if pool_block is not None:
+            self.POOL_BLOCK = pool_block
+
+    def _configure_options(self, **options):
+        """Internal helper for overriding the class-level defaults of the given
+        options, such as `rate_limiter`, with those that are not None.
+        """
+        for name, value in six.iteritems(options):
+            if value is not None:
+                setattr(self, name, value)
+
+    def _default_headers(self):
+        """Internal helper for the headers sent along with every request."""
+        return {'CB-VERSION': self.API_VERSION,
+                'Accept': 'application/json',
+                'Content-Type': 'application/json',
+                'User-Agent': 'coinbase/python/2.0'}
+
     def _create_api_uri(self, *parts):
         """Internal helper for creating fully qualified endpoint URIs."""
         return urljoin(self.BASE_API_URI, '/'.join(imap(quote, parts)))
@@ -105,66 +275,368 @@ class Client(object):
 
         Raises an APIError if the response is not 20X. Otherwise, returns the
         response object. Not intended for direct use by API consumers.
+
+        Failed requests are retried as allowed by the client's `retry_policy`.
         """
+        raw = self._pop_raw(kwargs)
         uri = self._create_api_uri(*relative_path_parts)
+        validator_key, validated = self._validated(method, uri, kwargs.get('params', None))
+        if validated is not None:
+            headers = dict(kwargs.get('headers', None) or {})
+            headers.update(validated.conditional_headers())
+            kwargs['headers'] = headers
         data = kwargs.get('data', None)
+        retry_policy = self.retry_policy
+        if retry_policy is not None and not retry_policy.allows(method, data):
+            retry_policy = None
         if data and isinstance(data, dict):
-            kwargs['data'] = encode_params(data)
+            kwargs['data'] = encode_params(data, codec=self.json_codec)
         if self.VERIFY_SSL:
             kwargs.setdefault('verify', COINBASE_CRT_PATH)
         else:
             kwargs.setdefault('verify', False)
         kwargs.update(verify=self.VERIFY_SSL)
-        response = getattr(self.session, method)(uri, **kwargs)
-        return self._handle_response(response)
+        kwargs.setdefault('timeout', self.timeout)
+        group = endpoint_group(relative_path_parts)
+        started = time.time()
+        attempt = 1
+        send = self._send_hedged if method == 'get' and self.hedging is not None else self._send
+        while True:
+            try:
+                response = send(method, uri, group, validated=validated, **kwargs)
+                return self._mark_raw(self._revalidate(validator_key, validated, response), raw)
+            except Exception as e:
+                delay = retry_policy and retry_policy.next_delay(e, attempt, time.time() - started)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(self, method, uri, group, validated=None, **kwargs):
+        """Internal helper for sending a single request to the endpoint `group`,
+        subject to the client's circuit breaker and rate limiter.
+
+        A 304 response to a request made conditional on the `validated` response
+        is given the body of the latter.
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(group)
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(group)
+            response = getattr(self.session, method)(uri, **kwargs)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(group, response)
+            response = self._handle_response(response, validated)
+        except BaseException as e:
+            if breaker is not None:
+                breaker.after_request(group, e)
+            raise
+        if breaker is not None:
+            breaker.after_request(group)
+        return response
 
-    def _handle_response(self, response):
+    def _send_hedged(self, method, uri, group, **kwargs):
+        """Internal helper for sending a request, along with a duplicate of it if
+        it is slower than the `hedging` policy allows.
+
+        Returns the first successful response, or raises the first error if all
+        requests fail. A request that loses the race cannot be interrupted; its
+        response is discarded when it arrives. Hedges go through the rate
+        limiter like any other request.
+        """
+        outcomes = queue.Queue()
+
+        def attempt():
+            started = time.time()
+            try:
+                response = self._send(method, uri, group, **kwargs)
+            except Exception:
+                outcomes.put((None, sys.exc_info()))
+            else:
+                self.hedging.record(group, time.time() - started)
+                outcomes.put((response, None))
+
+        def launch():
+            thread = threading.Thread(target=attempt)
+            thread.daemon = True
+            thread.start()
+
+        launch()
+        try:
+            outcome = outcomes.get(timeout=self.hedging.delay(group))
+            in_flight = 0
+        except queue.Empty:
+            launch()
+            outcome = outcomes.get()
+            in_flight = 1
+        response, first_error = outcome
+        while response is None and in_flight:
+            response, _ = outcomes.get()
+            in_flight -= 1
+        if response is None:
+            six.reraise(*first_error)
+        return response
+
+    def _handle_response(self, response, validated=None):
         """Internal helper for handling API responses from the Coinbase server.
 
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
+        if response.status_code == 304 and validated is not None:
+            response._coinbase_blob = validated.blob
+            return response
         if not str(response.status_code).startswith('2'):
-            raise build_api_error(response)
+            raise build_api_error(response, codec=self.json_codec)
+        return response
+
+    def _validated(self, method, uri, params):
+        """Internal helper returning the key of a request in the client's
+        `validator_cache`, and the response held there for it, if any.
+        """
+        if method != 'get' or self.validator_cache is None:
+            return None, None
+        key = self.validator_cache.key(self, uri, params)
+        return key, self.validator_cache.get(key)
+
+    def _revalidate(self, validator_key, validated, response):
+        """Internal helper storing the validators of a GET response in the
+        client's `validator_cache`.
+        """
+        if validator_key is None:
+            return response
+        not_modified = validated is not None and response.status_code == 304
+        if validated is not None:
+            self.validator_cache.record(not_modified)
+        if not not_modified:
+            self.validator_cache.set(validator_key, response, self._decode_response(response))
         return response
 
+    def _decode_response(self, response):
+        """Internal helper for decoding the JSON body of a response.
+
+        The decoded body is cached on the response so that it is only ever parsed
+        once, no matter how many helpers need to look at it. Returns None for
+        responses without a body.
+        """
+        blob = getattr(response, '_coinbase_blob', None)
+        if blob is None and response.content:
+            blob = response._coinbase_blob = self.json_codec.loads(response.content)
+        return blob
+
     def _get(self, *args, **kwargs):
-        """Get requests can be paginated, ensure we iterate through all the pages."""
-        prev_data = kwargs.pop('prev_data', [])
-        resp = self._request('get', *args, **kwargs)
-        resp_content = resp._content
-        if not resp_content:
-            # No content so its obviously not paginated
-            return resp
-
-        # if resp._content is a bytes object, decode it so we can loads it as json
-        if isinstance(resp_content, bytes):
-            resp_content = resp_content.decode('utf-8')
-
-        # Load the json so we can use the data as python objects
-        content = json.loads(resp_content)
-        if 'pagination' not in content:
-            # Result is not paginated
-            return resp
-
-        page_info = content['pagination']
-        if not page_info['next_uri']:
-            # next_uri is None when the cursor has been iterated to the last element
-            content['data'].extend(prev_data)
-            # If resp._content was is a bytes object, only set it as a bytes object
-            if isinstance(resp_content, bytes):
-                resp._content = json.dumps(content).decode('utf-8')
-            else:
-                resp._content = json.dumps(content)
-            return resp
+        """Get requests can be paginated, ensure we iterate through all the pages.
+
+        The items of every page are merged, in order, into the decoded body of the
+        first one, which is cached on the returned (last) response so that
+        `_make_api_object` does not have to decode it again.
+
+        Unless `coalesce_gets` is False, concurrent identical calls share one
+        round of requests; calls only share it with those of the same raw mode.
+        """
+        mode = self._raw_mode(self._pop_raw(kwargs))
+        keep_bodies = mode == 'bytes'
+        cache_key = self._cache_key(args, kwargs.get('params', None))
+        if cache_key is not None:
+            response = self._cached_response(cache_key)
+            if response is not None:
+                return self._mark_raw(response, mode)
+        if not self.coalesce_gets:
+            response = self._get_pages(cache_key, keep_bodies, *args, **kwargs)
+        else:
+            response = self._single_flight().do(
+                self._flight_key(args, dict(kwargs, raw=mode)),
+                functools.partial(self._get_pages, cache_key, keep_bodies, *args, **kwargs))
+        return self._mark_raw(response, mode)
+
+    def _get_pages(self, cache_key, keep_bodies, *args, **kwargs):
+        # Only the `iter_*` paginators retry pages by default; other requests are
+        # retried by the client's `retry_policy`, if any.
+        pages = Paginator(self, None, *args, page_retries=0, **kwargs).iter_pages()
+        response, first_blob = next(pages)
+        blob = first_blob
+        bodies = [self._body(response, first_blob)] if keep_bodies else None
+        for response, page_blob in pages:
+            if blob is first_blob:
+                # Keep the first page's body intact, as it may be cached.
+                blob = dict(first_blob, data=list(first_blob['data']))
+            blob['data'].extend(page_blob['data'])
+            blob['pagination'] = page_blob['pagination']
+            response._coinbase_blob = blob
+            if bodies is not None:
+                bodies.append(self._body(response, page_blob))
+        if bodies is not None:
+            response._coinbase_bodies = bodies
+        if cache_key is not None and blob is not None:
+            self.cache.set(cache_key, {'url': response.url, 'blob': blob})
+        return response
 
-        prev_data.extend(content['data'])
-        next_page_id = page_info['next_uri'].split('=')[-1]
-        kwargs.update({
-            'prev_data': prev_data,
-            'params': {'starting_after': next_page_id}
-        })
-        return self._get(*args, **kwargs)
+    def _single_flight(self):
+        """Internal helper returning the client's `SingleFlight`, created on
+        first use.
+        """
+        single_flight = self.__dict__.get('_in_flight', None)
+        if single_flight is None:
+            single_flight = self.__dict__.setdefault('_in_flight', SingleFlight())
+        return single_flight
+
+    @staticmethod
+    def _flight_key(relative_path_parts, kwargs):
+        """Internal helper returning what identifies a GET request among those
+        in flight.
+        """
+        return '%s|%s' % ('/'.join(relative_path_parts),
+                          json.dumps(kwargs, sort_keys=True, default=str))
+
+    def _get_final(self, *args, **kwargs):
+        """Internal helper for fetching a resource that stops changing once it
+        reaches a terminal state, such as a transaction. Such resources are kept
+        in, and served from, the client's `resource_cache`, if any; requests with
+        parameters always go to the API.
+        """
+        # `_get` takes care of the `raw` option of the requests it makes.
+        request_kwargs = dict(kwargs)
+        raw = self._pop_raw(request_kwargs)
+        cache = self.resource_cache
+        if (cache is None or request_kwargs.get('params', None) or
+                request_kwargs.get('data', None)):
+            return self._get(*args, **kwargs)
+        resource_path = urlsplit(self._create_api_uri(*args)).path
+        entry = cache.get(resource_path)
+        if entry is not None:
+            return self._mark_raw(self._stored_response(entry), raw)
+        response = self._get(*args, **kwargs)
+        self._store_final(resource_path, response)
+        return response
+
+    def _store_final(self, resource_path, response):
+        blob = self._decode_response(response)
+        if blob and is_terminal(blob.get('data', None)):
+            self.resource_cache.set(resource_path, {'url': response.url, 'blob': blob})
+
+    def _cache_key(self, relative_path_parts, params):
+        """Internal helper returning the key under which the client's `cache`
+        stores the response of a GET request, or None if it is not cached.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.key(
+            self, endpoint_group(relative_path_parts), '/'.join(relative_path_parts), params)
+
+    def _cached_response(self, cache_key):
+        """Internal helper returning the response cached under `cache_key`, if
+        any, as a `requests.Response` holding the decoded body.
+        """
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            return None
+        return self._stored_response(entry)
+
+    @staticmethod
+    def _stored_response(entry):
+        """Internal helper turning a cache entry holding the url and decoded body
+        of a response back into a `requests.Response`.
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry['url']
+        response._content = b''
+        response._coinbase_blob = entry['blob']
+        return response
+
+    def _raw_mode(self, raw=None):
+        """Internal helper returning what a call returns instead of models, given
+        the `raw` option it was made with, if any: False (models), 'dicts' or
+        'bytes'.
+        """
+        if raw is None:
+            raw = self.raw
+        if raw is True:
+            return 'dicts'
+        if not raw:
+            return False
+        if raw not in ('dicts', 'bytes'):
+            raise ValueError("`raw` must be True, False, 'dicts' or 'bytes', not %r." % (raw,))
+        return raw
+
+    def _pop_raw(self, kwargs):
+        """Internal helper taking the per-call `raw` option out of the `params`
+        or `data` of a request, so that it is not sent to the API. Returns it, or
+        None if it was not given.
+        """
+        raw = None
+        for name in ('params', 'data'):
+            values = kwargs.get(name, None)
+            if isinstance(values, dict) and 'raw' in values:
+                values = dict(values)
+                raw = values.pop('raw')
+                self._raw_mode(raw)
+                kwargs[name] = values
+        return raw
+
+    @staticmethod
+    def _mark_raw(response, raw):
+        """Internal helper recording the per-call `raw` option of a request on its
+        response, for `_make_api_object`. A response shared by coalesced GETs is
+        only ever marked with the mode they all have in common.
+        """
+        if raw is not None:
+            response._coinbase_raw = raw
+        return response
+
+    def _body(self, response, blob):
+        """Internal helper returning the body of a response as bytes; encoded
+        again from `blob` for responses without one (served from a cache, or 304).
+        """
+        return response.content or self.json_codec.dumps(blob).encode('utf-8')
+
+    def _iter_api_objects(self, model_type, *args, **kwargs):
+        """Internal helper for lazily iterating over the items of a paginated
+        listing, yielding each one as an instance of `model_type`.
+
+        The `Paginator` options (`max_pages`, `max_items`, `prefetch`,
+        `page_retries`, `resume_from` and `raw`) are taken out of `params`;
+        unless given, `limit` defaults to the largest page size the API allows
+        (or to `max_items`, if smaller) to keep the number of round-trips down.
+        """
+        params = dict(kwargs.pop('params', None) or {})
+        options = ('max_pages', 'max_items', 'prefetch', 'page_retries', 'resume_from', 'raw')
+        for option in options:
+            kwargs[option] = params.pop(option, None)
+        if not params.get('limit', None):
+            params['limit'] = min(kwargs['max_items'] or Paginator.MAX_LIMIT, Paginator.MAX_LIMIT)
+        return self.paginator_class(self, model_type, *args, params=params, **kwargs)
+
+    def _iter_new_api_objects(self, cursor_store, model_type, *args, **kwargs):
+        """Internal helper for incrementally syncing a listing; see
+        `coinbase.wallet.sync.iter_new_items`.
+        """
+        return iter_new_items(self, cursor_store, model_type, *args, **kwargs)
+
+    def _get_by_ids(self, get_one, ids, max_workers=8, **params):
+        """Internal helper for the bulk getters: calls `get_one(id, **params)` once
+        for each distinct id in `ids`, from up to `max_workers` threads at once.
+
+        Returns a list holding the result for each of `ids`, in order. A request
+        that fails does not stop the others; its exception takes the place of the
+        result.
+        """
+        ids = list(ids)
+        unique_ids = list(collections.OrderedDict.fromkeys(ids))
+        results = map_concurrently(
+            lambda id_: get_one(id_, **params), unique_ids, max_workers,
+            return_exceptions=True, limit=self.concurrency_limit)
+        by_id = dict(zip(unique_ids, results))
+        return [by_id[id_] for id_ in ids]
+
+    def _update_api_object(self, obj, data):
+        """Internal helper used by models to update themselves in place with the
+        `data` returned by an API call. Returns `data`.
+        """
+        obj.update(data)
+        return data
 
     def _post(self, *args, **kwargs):
         return self._request('post', *args, **kwargs)
@@ -175,12 +647,13 @@ class Client(object):
     def _delete(self, *args, **kwargs):
         return self._request('delete', *args, **kwargs)
 
-    def _make_api_object(self, response, model_type=None):
-        blob = response.json()
+    def _make_api_object(self, response, model_type=None, blob=None, raw=None):
+        if blob is None:
+            blob = self._decode_response(response) or {}
         data = blob.get('data', None)
         # All valid responses have a "data" key.
         if data is None:
-            raise build_api_error(response, blob)
+            raise build_api_error(response, blob, codec=self.json_codec)
         # Warn the user about each warning that was returned.
         warnings_data = blob.get('warnings', None)
         for warning_blob in warnings_data or []:
@@ -189,17 +662,34 @@ class Client(object):
                 warning_blob.get('url', ''))
             warnings.warn(message, UserWarning)
 
+        if raw is None:
+            raw = getattr(response, '_coinbase_raw', None)
+        mode = self._raw_mode(raw)
+        if mode == 'dicts':
+            # The decoded body may be held by a cache, or shared by coalesced
+            # calls, so the caller gets its own copy to modify.
+            return copy.deepcopy(blob)
+        if mode == 'bytes':
+            bodies = getattr(response, '_coinbase_bodies', None) or [self._body(response, blob)]
+            return bodies if 'pagination' in blob else bodies[0]
+
         pagination = blob.get('pagination', None)
         kwargs = {
             'response': response,
             'pagination': pagination and new_api_object(None, pagination, APIObject),
             'warnings': warnings_data and new_api_object(None, warnings_data, APIObject)
         }
+        if self.compact_models:
+            build = new_compact_object
+        elif self.lazy_models:
+            build = new_lazy_api_object
+        else:
+            build = new_api_object
         if isinstance(data, dict):
-            obj = new_api_object(self, data, model_type, **kwargs)
+            obj = build(self, data, model_type, **kwargs)
         else:
             obj = APIObject(self, **kwargs)
-            obj.data = new_api_object(self, data, model_type)
+            obj.data = build(self, data, model_type)
         return obj
 
     # Data API
@@ -216,21 +706,32 @@ class Client(object):
 
     def get_buy_price(self, **params):
         """https://developers.coinbase.com/api/v2#get-buy-price"""
-        currency_pair = params.get('currency_pair', 'BTC-USD')
-        response = self._get('v2', 'prices', currency_pair, 'buy', params=params)
-        return self._make_api_object(response, APIObject)
+        return self._get_price('buy', params)
 
     def get_sell_price(self, **params):
         """https://developers.coinbase.com/api/v2#get-sell-price"""
-        currency_pair = params.get('currency_pair', 'BTC-USD')
-        response = self._get('v2', 'prices', currency_pair, 'sell', params=params)
-        return self._make_api_object(response, APIObject)
+        return self._get_price('sell', params)
 
     def get_spot_price(self, **params):
         """https://developers.coinbase.com/api/v2#get-spot-price"""
+        return self._get_price('spot', params)
+
+    def _get_price(self, price_type, params):
+        """Internal helper for fetching a quote, through the client's
+        `price_cache` if it has one.
+        """
+        kwargs = {'params': params}
+        raw = self._pop_raw(kwargs)
+        params = kwargs['params']
         currency_pair = params.get('currency_pair', 'BTC-USD')
-        response = self._get('v2', 'prices', currency_pair, 'spot', params=params)
-        return self._make_api_object(response, APIObject)
+        fetch = functools.partial(
+            self._get, 'v2', 'prices', currency_pair, price_type, params=params)
+        if self.price_cache is None:
+            response = fetch()
+        else:
+            response = self.price_cache.get(
+                self.price_cache.key(currency_pair, price_type, params), fetch)
+        return self._make_api_object(response, APIObject, raw=raw)
 
     def get_historic_prices(self, **params):
         """https://developers.coinbase.com/api/v2#get-historic-prices"""
@@ -272,9 +773,18 @@ class Client(object):
     # -----------------------------------------------------------
     def get_accounts(self, **params):
         """https://developers.coinbase.com/api/v2#list-accounts"""
+        if params.pop('iterator', False):
+            return self.iter_accounts(**params)
         response = self._get('v2', 'accounts', params=params)
         return self._make_api_object(response, Account)
 
+    def iter_accounts(self, **params):
+        """Lazily yield every account, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-accounts
+        """
+        return self._iter_api_objects(Account, 'v2', 'accounts', params=params)
+
     def get_account(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#show-an-account"""
         response = self._get('v2', 'accounts', account_id, params=params)
@@ -304,13 +814,81 @@ class Client(object):
         self._delete('v2', 'accounts', account_id, data=params)
         return None
 
+    def get_for_accounts(self, listing, accounts=None, max_workers=8, **params):
+        """Calls `get_<listing>` (e.g. `get_transactions`) for each of `accounts`
+        from up to `max_workers` threads at once, and returns the results in an
+        OrderedDict keyed by account id.
+
+        `accounts` may hold account ids or `Account` objects; by default, every
+        account of the user is included. With `return_exceptions=True`, an account
+        whose request fails maps to the raised exception instead of the error
+        being raised once the other requests have finished.
+        """
+        method = getattr(self, 'get_%s' % self._check_account_listing(listing))
+        return_exceptions = params.pop('return_exceptions', False)
+        account_ids = self._account_ids(accounts)
+        results = map_concurrently(
+            lambda account_id: method(account_id, **params),
+            account_ids, max_workers, return_exceptions, self.concurrency_limit)
+        return collections.OrderedDict(zip(account_ids, results))
+
+    def iter_for_accounts(self, listing, accounts=None, max_workers=8, **params):
+        """Lazily yields the items of `iter_<listing>` (e.g. `iter_transactions`)
+        for each of `accounts`, merged into a single stream ordered by
+        `created_at`: newest first, or oldest first with `order='asc'`.
+
+        The first page of each account's listing is requested from up to
+        `max_workers` threads at once; later pages are requested as the stream
+        reaches them. Items are merged one by one, so in raw mode they are
+        yielded as dicts, even if `raw` is 'bytes'.
+        """
+        method = getattr(self, 'iter_%s' % self._check_account_listing(listing))
+        params = self._merge_raw(params)
+        iterators = [method(account_id, **params) for account_id in self._account_ids(accounts)]
+        return iter_merged(
+            iterators, key=self._created_at_key,
+            reverse=params.get('order', 'desc') != 'asc', max_workers=max_workers,
+            limit=self.concurrency_limit)
+
+    def _check_account_listing(self, listing):
+        if listing not in ACCOUNT_LISTINGS:
+            raise ValueError('`listing` must be one of: %s.' % ', '.join(ACCOUNT_LISTINGS))
+        return listing
+
+    def _merge_raw(self, params):
+        """Internal helper for `iter_for_accounts`: page bodies cannot be merged
+        by `created_at`, so 'bytes' mode falls back to dicts.
+        """
+        if self._raw_mode(params.get('raw', None)) == 'bytes':
+            params = dict(params, raw='dicts')
+        return params
+
+    def _account_ids(self, accounts):
+        if accounts is None:
+            # The ids are needed whatever the client's raw mode.
+            accounts = self.iter_accounts(raw=False)
+        return [account['id'] if isinstance(account, dict) else account for account in accounts]
+
+    @staticmethod
+    def _created_at_key(item):
+        return parse_timestamp(item.get('created_at', None)) or 0
+
     # Notifications API
     # -----------------------------------------------------------
     def get_notifications(self, **params):
         """https://developers.coinbase.com/api/v2#list-notifications"""
+        if params.pop('iterator', False):
+            return self.iter_notifications(**params)
         response = self._get('v2', 'notifications', params=params)
         return self._make_api_object(response, Notification)
 
+    def iter_notifications(self, **params):
+        """Lazily yield every notification, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-notifications
+        """
+        return self._iter_api_objects(Notification, 'v2', 'notifications', params=params)
+
     def get_notification(self, notification_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-notification"""
         response = self._get('v2', 'notifications', notification_id, params=params)
@@ -320,9 +898,19 @@ class Client(object):
     # -----------------------------------------------------------
     def get_addresses(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#list-addresses"""
+        if params.pop('iterator', False):
+            return self.iter_addresses(account_id, **params)
         response = self._get('v2', 'accounts', account_id, 'addresses', params=params)
         return self._make_api_object(response, Address)
 
+    def iter_addresses(self, account_id, **params):
+        """Lazily yield every address, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-addresses
+        """
+        return self._iter_api_objects(
+            Address, 'v2', 'accounts', account_id, 'addresses', params=params)
+
     def get_address(self, account_id, address_id, **params):
         """https://developers.coinbase.com/api/v2#show-addresss"""
         response = self._get('v2', 'accounts', account_id, 'addresses', address_id, params=params)
@@ -330,6 +918,8 @@ class Client(object):
 
     def get_address_transactions(self, account_id, address_id, **params):
         """https://developers.coinbase.com/api/v2#list-address39s-transactions"""
+        if params.pop('iterator', False):
+            return self.iter_address_transactions(account_id, address_id, **params)
         response = self._get(
             'v2',
             'accounts',
@@ -340,6 +930,15 @@ class Client(object):
             params=params)
         return self._make_api_object(response, Transaction)
 
+    def iter_address_transactions(self, account_id, address_id, **params):
+        """Lazily yield every transaction of the address, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-address39s-transactions
+        """
+        return self._iter_api_objects(
+            Transaction, 'v2', 'accounts', account_id,
+            'addresses', address_id, 'transactions', params=params)
+
     def create_address(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#create-address"""
         response = self._post('v2', 'accounts', account_id, 'addresses', data=params)
@@ -349,15 +948,43 @@ class Client(object):
     # -----------------------------------------------------------
     def get_transactions(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#list-transactions"""
+        if params.pop('iterator', False):
+            return self.iter_transactions(account_id, **params)
         response = self._get('v2', 'accounts', account_id, 'transactions', params=params)
         return self._make_api_object(response, Transaction)
 
+    def iter_transactions(self, account_id, **params):
+        """Lazily yield every transaction, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-transactions
+        """
+        return self._iter_api_objects(
+            Transaction, 'v2', 'accounts', account_id, 'transactions', params=params)
+
+    def iter_new_transactions(self, account_id, cursor_store, **params):
+        """Lazily yield the transactions created since the last sync with this store.
+
+        See `coinbase.wallet.sync.iter_new_items`.
+        """
+        return self._iter_new_api_objects(
+            cursor_store, Transaction, 'v2', 'accounts', account_id, 'transactions',
+            params=params)
+
     def get_transaction(self, account_id, transaction_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-transaction"""
-        response = self._get(
+        response = self._get_final(
             'v2', 'accounts', account_id, 'transactions', transaction_id, params=params)
         return self._make_api_object(response, Transaction)
 
+    def get_transactions_by_ids(self, account_id, transaction_ids, max_workers=8, **params):
+        """Fetch many transactions at once; see `Client._get_by_ids`.
+
+        https://developers.coinbase.com/api/v2#show-a-transaction
+        """
+        return self._get_by_ids(
+            functools.partial(self.get_transaction, account_id), transaction_ids,
+            max_workers, **params)
+
     def send_money(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#send-money"""
         for required in ['to', 'amount', 'currency']:
@@ -410,12 +1037,21 @@ class Client(object):
     # -----------------------------------------------------------
     def get_reports(self, **params):
         """https://developers.coinbase.com/api/v2#list-all-reports"""
+        if params.pop('iterator', False):
+            return self.iter_reports(**params)
         response = self._get('v2', 'reports', data=params)
         return self._make_api_object(response, Report)
 
+    def iter_reports(self, **params):
+        """Lazily yield every report, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-all-reports
+        """
+        return self._iter_api_objects(Report, 'v2', 'reports', params=params)
+
     def get_report(self, report_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-report"""
-        response = self._get('v2', 'reports', report_id, data=params)
+        response = self._get_final('v2', 'reports', report_id, data=params)
         return self._make_api_object(response, Report)
 
     def create_report(self, **params):
@@ -429,14 +1065,41 @@ class Client(object):
     # -----------------------------------------------------------
     def get_buys(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#list-buys"""
+        if params.pop('iterator', False):
+            return self.iter_buys(account_id, **params)
         response = self._get('v2', 'accounts', account_id, 'buys', params=params)
         return self._make_api_object(response, Buy)
 
+    def iter_buys(self, account_id, **params):
+        """Lazily yield every buy, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-buys
+        """
+        return self._iter_api_objects(Buy, 'v2', 'accounts', account_id, 'buys', params=params)
+
+    def iter_new_buys(self, account_id, cursor_store, **params):
+        """Lazily yield the buys created since the last sync with this store.
+
+        See `coinbase.wallet.sync.iter_new_items`.
+        """
+        return self._iter_new_api_objects(
+            cursor_store, Buy, 'v2', 'accounts', account_id, 'buys',
+            params=params)
+
     def get_buy(self, account_id, buy_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-buy"""
-        response = self._get('v2', 'accounts', account_id, 'buys', buy_id, params=params)
+        response = self._get_final('v2', 'accounts', account_id, 'buys', buy_id, params=params)
         return self._make_api_object(response, Buy)
 
+    def get_buys_by_ids(self, account_id, buy_ids, max_workers=8, **params):
+        """Fetch many buys at once; see `Client._get_by_ids`.
+
+        https://developers.coinbase.com/api/v2#show-a-buy
+        """
+        return self._get_by_ids(
+            functools.partial(self.get_buy, account_id), buy_ids,
+            max_workers, **params)
+
     def buy(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#buy-bitcoin"""
         if 'amount' not in params and 'total' not in params:
@@ -457,15 +1120,42 @@ class Client(object):
     # -----------------------------------------------------------
     def get_sells(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#list-sells"""
+        if params.pop('iterator', False):
+            return self.iter_sells(account_id, **params)
         response = self._get('v2', 'accounts', account_id, 'sells', params=params)
         return self._make_api_object(response, Sell)
 
+    def iter_sells(self, account_id, **params):
+        """Lazily yield every sell, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-sells
+        """
+        return self._iter_api_objects(Sell, 'v2', 'accounts', account_id, 'sells', params=params)
+
+    def iter_new_sells(self, account_id, cursor_store, **params):
+        """Lazily yield the sells created since the last sync with this store.
+
+        See `coinbase.wallet.sync.iter_new_items`.
+        """
+        return self._iter_new_api_objects(
+            cursor_store, Sell, 'v2', 'accounts', account_id, 'sells',
+            params=params)
+
     def get_sell(self, account_id, sell_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-sell"""
-        response = self._get(
+        response = self._get_final(
             'v2', 'accounts', account_id, 'sells', sell_id, params=params)
         return self._make_api_object(response, Sell)
 
+    def get_sells_by_ids(self, account_id, sell_ids, max_workers=8, **params):
+        """Fetch many sells at once; see `Client._get_by_ids`.
+
+        https://developers.coinbase.com/api/v2#show-a-sell
+        """
+        return self._get_by_ids(
+            functools.partial(self.get_sell, account_id), sell_ids,
+            max_workers, **params)
+
     def sell(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#sell-bitcoin"""
         if 'amount' not in params and 'total' not in params:
@@ -486,15 +1176,43 @@ class Client(object):
     # -----------------------------------------------------------
     def get_deposits(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#list-deposits"""
+        if params.pop('iterator', False):
+            return self.iter_deposits(account_id, **params)
         response = self._get('v2', 'accounts', account_id, 'deposits', params=params)
         return self._make_api_object(response, Deposit)
 
+    def iter_deposits(self, account_id, **params):
+        """Lazily yield every deposit, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-deposits
+        """
+        return self._iter_api_objects(
+            Deposit, 'v2', 'accounts', account_id, 'deposits', params=params)
+
+    def iter_new_deposits(self, account_id, cursor_store, **params):
+        """Lazily yield the deposits created since the last sync with this store.
+
+        See `coinbase.wallet.sync.iter_new_items`.
+        """
+        return self._iter_new_api_objects(
+            cursor_store, Deposit, 'v2', 'accounts', account_id, 'deposits',
+            params=params)
+
     def get_deposit(self, account_id, deposit_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-deposit"""
-        response = self._get(
+        response = self._get_final(
             'v2', 'accounts', account_id, 'deposits', deposit_id, params=params)
         return self._make_api_object(response, Deposit)
 
+    def get_deposits_by_ids(self, account_id, deposit_ids, max_workers=8, **params):
+        """Fetch many deposits at once; see `Client._get_by_ids`.
+
+        https://developers.coinbase.com/api/v2#show-a-deposit
+        """
+        return self._get_by_ids(
+            functools.partial(self.get_deposit, account_id), deposit_ids,
+            max_workers, **params)
+
     def deposit(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#deposit-funds"""
         for required in ['payment_method', 'amount', 'currency']:
@@ -514,15 +1232,43 @@ class Client(object):
     # -----------------------------------------------------------
     def get_withdrawals(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#list-withdrawals"""
+        if params.pop('iterator', False):
+            return self.iter_withdrawals(account_id, **params)
         response = self._get('v2', 'accounts', account_id, 'withdrawals', params=params)
         return self._make_api_object(response, Withdrawal)
 
+    def iter_withdrawals(self, account_id, **params):
+        """Lazily yield every withdrawal, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-withdrawals
+        """
+        return self._iter_api_objects(
+            Withdrawal, 'v2', 'accounts', account_id, 'withdrawals', params=params)
+
+    def iter_new_withdrawals(self, account_id, cursor_store, **params):
+        """Lazily yield the withdrawals created since the last sync with this store.
+
+        See `coinbase.wallet.sync.iter_new_items`.
+        """
+        return self._iter_new_api_objects(
+            cursor_store, Withdrawal, 'v2', 'accounts', account_id, 'withdrawals',
+            params=params)
+
     def get_withdrawal(self, account_id, withdrawal_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-withdrawal"""
-        response = self._get(
+        response = self._get_final(
             'v2', 'accounts', account_id, 'withdrawals', withdrawal_id, params=params)
         return self._make_api_object(response, Withdrawal)
 
+    def get_withdrawals_by_ids(self, account_id, withdrawal_ids, max_workers=8, **params):
+        """Fetch many withdrawals at once; see `Client._get_by_ids`.
+
+        https://developers.coinbase.com/api/v2#show-a-withdrawal
+        """
+        return self._get_by_ids(
+            functools.partial(self.get_withdrawal, account_id), withdrawal_ids,
+            max_workers, **params)
+
     def withdraw(self, account_id, **params):
         """https://developers.coinbase.com/api/v2#withdraw-funds"""
         for required in ['payment_method', 'amount', 'currency']:
@@ -542,9 +1288,18 @@ class Client(object):
     # -----------------------------------------------------------
     def get_payment_methods(self, **params):
         """https://developers.coinbase.com/api/v2#list-payment-methods"""
+        if params.pop('iterator', False):
+            return self.iter_payment_methods(**params)
         response = self._get('v2', 'payment-methods', params=params)
         return self._make_api_object(response, PaymentMethod)
 
+    def iter_payment_methods(self, **params):
+        """Lazily yield every payment method, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-payment-methods
+        """
+        return self._iter_api_objects(PaymentMethod, 'v2', 'payment-methods', params=params)
+
     def get_payment_method(self, payment_method_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-payment-method"""
         response = self._get('v2', 'payment-methods', payment_method_id, params=params)
@@ -561,14 +1316,30 @@ class Client(object):
     # -----------------------------------------------------------
     def get_orders(self, **params):
         """https://developers.coinbase.com/api/v2#list-orders"""
+        if params.pop('iterator', False):
+            return self.iter_orders(**params)
         response = self._get('v2', 'orders', params=params)
         return self._make_api_object(response, Order)
 
+    def iter_orders(self, **params):
+        """Lazily yield every order, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-orders
+        """
+        return self._iter_api_objects(Order, 'v2', 'orders', params=params)
+
     def get_order(self, order_id, **params):
         """https://developers.coinbase.com/api/v2#show-an-order"""
         response = self._get('v2', 'orders', order_id, params=params)
         return self._make_api_object(response, Order)
 
+    def get_orders_by_ids(self, order_ids, max_workers=8, **params):
+        """Fetch many orders at once; see `Client._get_by_ids`.
+
+        https://developers.coinbase.com/api/v2#show-an-order
+        """
+        return self._get_by_ids(self.get_order, order_ids, max_workers, **params)
+
     def create_order(self, **params):
         """https://developers.coinbase.com/api/v2#create-an-order"""
         for required in ['amount', 'currency', 'name']:
@@ -589,9 +1360,18 @@ class Client(object):
     # -----------------------------------------------------------
     def get_checkouts(self, **params):
         """https://developers.coinbase.com/api/v2#list-checkouts"""
+        if params.pop('iterator', False):
+            return self.iter_checkouts(**params)
         response = self._get('v2', 'checkouts', params=params)
         return self._make_api_object(response, Checkout)
 
+    def iter_checkouts(self, **params):
+        """Lazily yield every checkout, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-checkouts
+        """
+        return self._iter_api_objects(Checkout, 'v2', 'checkouts', params=params)
+
     def get_checkout(self, checkout_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-checkout"""
         response = self._get('v2', 'checkouts', checkout_id, params=params)
@@ -607,9 +1387,19 @@ class Client(object):
 
     def get_checkout_orders(self, checkout_id, **params):
         """https://developers.coinbase.com/api/v2#list-checkout39s-orders"""
+        if params.pop('iterator', False):
+            return self.iter_checkout_orders(checkout_id, **params)
         response = self._get('v2', 'checkouts', checkout_id, 'orders', params=params)
         return self._make_api_object(response, Order)
 
+    def iter_checkout_orders(self, checkout_id, **params):
+        """Lazily yield every order for the checkout, fetching one page at a time.
+
+        https://developers.coinbase.com/api/v2#list-checkout39s-orders
+        """
+        return self._iter_api_objects(
+            Order, 'v2', 'checkouts', checkout_id, 'orders', params=params)
+
     def create_checkout_order(self, checkout_id, **params):
         """https://developers.coinbase.com/api/v2#create-a-new-order-for-a-checkout"""
         response = self._post('v2', 'checkouts', checkout_id, 'orders', data=params)
@@ -633,7 +1423,12 @@ class Client(object):
 
 
 class OAuthClient(Client):
-    def __init__(self, access_token, refresh_token, base_api_uri=None, api_version=None):
+    def __init__(self, access_token, refresh_token, base_api_uri=None, api_version=None,
+                 pool_connections=None, pool_maxsize=None, pool_block=None,
+                 rate_limiter=None, retry_policy=None, hedging=None, circuit_breaker=None,
+                 timeout=None, concurrency_limit=None, cache=None, validator_cache=None,
+                 price_cache=None, resource_cache=None, coalesce_gets=None,
+                 compact_models=None, lazy_models=None, json_codec=None, raw=None):
         if not access_token:
             raise ValueError("Missing `access_token`.")
         if not refresh_token:
@@ -647,6 +1442,16 @@ class OAuthClient(Client):
 
         self.API_VERSION = api_version or self.API_VERSION
 
+        self._configure_pool(pool_connections, pool_maxsize, pool_block)
+        self._configure_options(
+            rate_limiter=rate_limiter, retry_policy=retry_policy, hedging=hedging,
+            circuit_breaker=circuit_breaker, timeout=timeout,
+            concurrency_limit=concurrency_limit, cache=cache,
+            validator_cache=validator_cache, price_cache=price_cache,
+            resource_cache=resource_cache, coalesce_gets=coalesce_gets,
+            compact_models=compact_models, lazy_models=lazy_models,
+            json_codec=json_codec, raw=raw)
+
         # Set up a requests session for interacting with the API.
         self.session = self._build_session(OAuth2Auth, lambda: self.access_token, self.API_VERSION)
 
@@ -668,9 +1473,9 @@ class OAuthClient(Client):
         }
         response = self._post('oauth', 'token', params=params)
         response = self._handle_response(response)
-        blob = response.json()
+        blob = self._decode_response(response) or {}
         self.access_token = blob.get('access_token', None)
         self.refresh_token = blob.get('refresh_token', None)
         if not (self.access_token and self.refresh_token):
-            raise build_api_error(response, blob)
+            raise build_api_error(response, blob, codec=self.json_codec)
         return blob
@@ -0,0 +1,117 @@
+# coding: utf-8
+"""JSON codecs used to encode request bodies and decode responses.
+
+`default_codec` picks the fastest backend that is installed: orjson, ujson or
+pysimdjson (for decoding), in that order, and the standard library's `json`
+module otherwise. A codec only needs `dumps`, returning text, and `loads`,
+accepting bytes or text, so any object with those can be given to the client as
+its `json_codec`.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+
+class JSONCodec(object):
+    """Codec backed by the standard library's `json` module; the base class of
+    the other codecs.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def __repr__(self):  # pragma: no cover
+        return '<%s %s>' % (type(self).__name__, self.name)
+
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    name = 'ujson'
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, escape_forward_slashes=False)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+class SimdjsonCodec(JSONCodec):
+    """Decodes with pysimdjson; encodes with the standard library, as pysimdjson
+    does not have an encoder of its own.
+    """
+
+    name = 'simdjson'
+
+    def loads(self, data):
+        return simdjson.loads(data)
+
+
+# Codecs in order of preference, with the module each needs.
+_CODECS = [
+    (OrjsonCodec, lambda: orjson),
+    (UjsonCodec, lambda: ujson),
+    (SimdjsonCodec, lambda: simdjson),
+    (JSONCodec, lambda: json),
+]
+
+_default = None
+
+
+def available_codecs():
+    """Returns the names of the codecs that can be used, fastest first."""
+    return [cls.name for cls, module in _CODECS if module() is not None]
+
+
+def get_codec(name):
+    """Returns the codec called `name` ('orjson', 'ujson', 'simdjson' or 'json').
+
+    Raises ValueError if there is no such codec, or its backend is not installed.
+    """
+    for cls, module in _CODECS:
+        if cls.name == name:
+            if module() is None:
+                raise ValueError('JSON codec %r is not installed.' % name)
+            return cls()
+    raise ValueError('Unknown JSON codec %r.' % name)
+
+
+def default_codec():
+    """Returns the fastest codec available."""
+    global _default
+    if _default is None:
+        _default = get_codec(available_codecs()[0])
+    return _default
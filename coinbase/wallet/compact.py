@@ -0,0 +1,362 @@
+# coding: utf-8
+"""Compact models: `__slots__`-based counterparts of the dict-backed models of
+`coinbase.wallet.model`, for holding large numbers of objects in memory.
+
+Each compact model keeps the fields it knows about in slots, and any others in
+an overflow dict that is only created when needed. The fields of the models in
+`FIELDS` are fixed; objects without a model of their own (the `to`, `network`
+or `details` of a transaction, ...) get a class with a slot for each of their
+keys. Fields are read and written with dot-notation, or as items, like those of
+`APIObject`; `to_dict` converts a compact model to plain dicts and lists.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import threading
+
+import six
+
+from coinbase.wallet import model
+from coinbase.wallet.compat import urlsplit
+from coinbase.wallet.model import APIObject
+from coinbase.wallet.model import Account
+from coinbase.wallet.model import Address
+from coinbase.wallet.model import Money
+from coinbase.wallet.model import Transaction
+from coinbase.wallet.model import Transfer
+
+# Fields kept in slots by the compact counterpart of each model (and of its
+# subclasses), besides `resource_path`, which every compact model has a slot for.
+FIELDS = {
+    Money: ('amount', 'currency'),
+    Account: (
+        'id', 'name', 'primary', 'type', 'currency', 'balance', 'native_balance',
+        'created_at', 'updated_at', 'resource'),
+    Address: ('id', 'address', 'name', 'network', 'created_at', 'updated_at', 'resource'),
+    Transaction: (
+        'id', 'type', 'status', 'amount', 'native_amount', 'description', 'created_at',
+        'updated_at', 'resource', 'network', 'to', 'from', 'details'),
+    Transfer: (
+        'id', 'status', 'payment_method', 'transaction', 'amount', 'total', 'subtotal', 'fee',
+        'created_at', 'updated_at', 'resource', 'committed', 'instant', 'payout_at'),
+}
+
+# Most classes created for the key sets of objects without a model; objects with
+# other key sets keep all their fields in the overflow dict.
+MAX_SHAPES = 512
+
+_IDENTIFIER = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+
+_set = object.__setattr__
+_get = object.__getattribute__
+
+
+class CompactObject(object):
+    """Base class of the compact models; the counterpart of `APIObject`.
+
+    Compact models are not dicts: use `to_dict` to serialize one, e.g. to JSON.
+    """
+
+    # `_meta` holds the response, pagination and warnings of top-level models.
+    __slots__ = ('_api_client', '_meta', '_extra', '_resource_path')
+
+    # The dict-backed model this class stands for.
+    model = APIObject
+
+    # The `(key, slot name)` of each field kept in a slot, and the same as a dict.
+    _field_slots = (('resource_path', '_resource_path'),)
+    _slot_for = dict(_field_slots)
+
+    @property
+    def api_client(self):
+        return self._optional('_api_client')
+
+    @property
+    def response(self):
+        return (self._optional('_meta') or (None, None, None))[0]
+
+    @property
+    def pagination(self):
+        return (self._optional('_meta') or (None, None, None))[1]
+
+    @property
+    def warnings(self):
+        return (self._optional('_meta') or (None, None, None))[2]
+
+    @property
+    def resource_path(self):
+        # The path of the response the model was built from, if any, like
+        # `APIObject.resource_path`; otherwise that of its `resource_path` field.
+        response = self.response
+        if response is not None:
+            return urlsplit(response.url).path
+        return self._optional('_resource_path')
+
+    def _optional(self, name):
+        try:
+            return _get(self, name)
+        except AttributeError:
+            return None
+
+    def refresh(self, **params):
+        url = getattr(self, 'resource_path', None)
+        if not url:
+            raise ValueError("Unable to refresh: missing 'resource_path' attribute.")
+        response = self.api_client._get(url, data=params)
+        data = self.api_client._make_api_object(response, type(self), raw=False)
+        return self.api_client._update_api_object(self, data)
+
+    def __getattr__(self, name):
+        # Only called for unset fields, and names that are not fields.
+        extra = self._optional('_extra')
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        # As with `APIObject`, attributes that start with '_' are not fields.
+        if name.startswith('_'):
+            return _set(self, name, value)
+        self[name] = value
+
+    def __delattr__(self, name):
+        if name.startswith('_'):
+            return object.__delattr__(self, name)
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    # Mapping interface, mirroring that of `APIObject`.
+    def __getitem__(self, key):
+        if isinstance(key, (int, slice)):
+            data = self.get('data', None)
+            if isinstance(data, list):
+                return data[key]
+        slot = self._slot_for.get(key, None)
+        if slot is not None:
+            try:
+                return _get(self, slot)
+            except AttributeError:
+                raise KeyError(key)
+        extra = self._optional('_extra')
+        if extra is None or key not in extra:
+            raise KeyError(key)
+        return extra[key]
+
+    def __setitem__(self, key, value):
+        slot = self._slot_for.get(key, None)
+        if slot is not None:
+            return _set(self, slot, value)
+        extra = self._optional('_extra')
+        if extra is None:
+            extra = {}
+            _set(self, '_extra', extra)
+        extra[key] = value
+
+    def __delitem__(self, key):
+        slot = self._slot_for.get(key, None)
+        if slot is not None:
+            try:
+                return object.__delattr__(self, slot)
+            except AttributeError:
+                raise KeyError(key)
+        extra = self._optional('_extra')
+        if extra is None or key not in extra:
+            raise KeyError(key)
+        del extra[key]
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = []
+        for key, slot in self._field_slots:
+            try:
+                _get(self, slot)
+            except AttributeError:
+                continue
+            keys.append(key)
+        keys.extend(self._optional('_extra') or ())
+        return keys
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def update(self, other=(), **kwargs):
+        if hasattr(other, 'keys'):
+            other = [(key, other[key]) for key in other.keys()]
+        for key, value in other:
+            self[key] = value
+        for key, value in six.iteritems(kwargs):
+            self[key] = value
+
+    def to_dict(self):
+        """Returns the fields of the model as plain dicts and lists."""
+        return dict((key, _plain(value)) for key, value in self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, CompactObject):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __dir__(self):  # pragma: no cover
+        return self.keys()
+
+    def __str__(self):
+        try:
+            return json.dumps(self.to_dict(), sort_keys=True, indent=2)
+        except TypeError:
+            return '(invalid JSON)'
+
+    def __repr__(self):  # pragma: no cover
+        return '<{} @ {}> {}'.format(type(self).__name__, hex(id(self)), str(self))
+
+
+def _plain(value):
+    if isinstance(value, CompactObject):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+class _CompactMoney(CompactObject):
+    __slots__ = ()
+
+    def __str__(self):
+        # See `Money.__str__`.
+        currency_str = '%s %s' % (self.get('currency', None), self.get('amount', None))
+        if set(self.keys()) > set(('amount', 'currency')):
+            return '{} {}'.format(currency_str, super(_CompactMoney, self).__str__())
+        return currency_str
+
+
+def _make_class(cls, fields):
+    """Creates the compact counterpart of the model class `cls`, with a slot for
+    each of `fields` and the same public methods.
+    """
+    namespace = {'model': cls}
+    for klass in reversed(cls.__mro__[:cls.__mro__.index(APIObject)]):
+        for name, value in six.iteritems(vars(klass)):
+            if not name.startswith('_') and callable(value):
+                namespace[name] = value
+    base = _CompactMoney if issubclass(cls, Money) else CompactObject
+    # Fields named like an attribute of the class stay in the overflow dict.
+    fields = tuple(
+        f for f in fields
+        if _IDENTIFIER.match(f) and f not in namespace and not hasattr(base, f))
+    namespace['__slots__'] = fields
+    namespace['_field_slots'] = CompactObject._field_slots + tuple((f, f) for f in fields)
+    namespace['_slot_for'] = dict(namespace['_field_slots'])
+    return type(str('Compact' + cls.__name__), (base,), namespace)
+
+
+_compact_models = {}
+_shapes = {}
+_lock = threading.Lock()
+
+
+def compact_model(cls):
+    """Returns the compact counterpart of the model class `cls`, keeping the
+    fields listed in `FIELDS` in slots.
+    """
+    if issubclass(cls, CompactObject):
+        return cls
+    compact = _compact_models.get(cls, None)
+    if compact is None:
+        fields = next((FIELDS[c] for c in cls.__mro__ if c in FIELDS), ())
+        with _lock:
+            compact = _compact_models.setdefault(cls, _make_class(cls, fields))
+    return compact
+
+
+def _shape_model(obj):
+    """Returns a compact `APIObject` class with a slot for each key of `obj`."""
+    shape = tuple(obj)
+    compact = _shapes.get(shape, None)
+    if compact is None:
+        if len(_shapes) >= MAX_SHAPES:
+            return compact_model(APIObject)
+        with _lock:
+            compact = _shapes.setdefault(shape, _make_class(APIObject, shape))
+    return compact
+
+
+def _model_for(obj, cls=None):
+    cls = cls or model._model_for(obj)
+    if cls is APIObject:
+        return _shape_model(obj)
+    return compact_model(cls)
+
+
+def new_compact_object(client, obj, cls=None, response=None, pagination=None, warnings=None):
+    """Compact counterpart of `coinbase.wallet.model.new_api_object`."""
+    if isinstance(obj, dict):
+        result = _build(client, obj, _model_for(obj, cls))
+        if response is not None or pagination is not None or warnings is not None:
+            _set(result, '_meta', (response, pagination, warnings))
+        return result
+    if isinstance(obj, list):
+        return [new_compact_object(client, v, cls) for v in obj]
+    return obj
+
+
+def _build(client, obj, compact):
+    result = object.__new__(compact)
+    if client is not None:
+        _set(result, '_api_client', client)
+    slot_for = compact._slot_for
+    extra = None
+    for key, value in obj.items():
+        if type(value) not in model._SCALAR_TYPES:
+            value = _convert(client, value)
+        slot = slot_for.get(key, None)
+        if slot is not None:
+            _set(result, slot, value)
+        else:
+            if extra is None:
+                extra = {}
+            extra[key] = value
+    if extra is not None:
+        _set(result, '_extra', extra)
+    return result
+
+
+def _convert(client, value):
+    if type(value) is dict:
+        return _build(client, value, _model_for(value))
+    if isinstance(value, list):
+        return [_convert(client, v) for v in value]
+    return new_compact_object(client, value)
@@ -4,7 +4,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from requests.compat import json
+from coinbase.wallet.codec import default_codec
 
 
 class CoinbaseError(Exception):
@@ -93,13 +93,26 @@ class ServiceUnavailableError(APIError):
     pass
 
 
-def build_api_error(response, blob=None):
+class CircuitOpenError(CoinbaseError):
+    """Raised without contacting the API when requests to a group of endpoints
+    have been failing; see `coinbase.wallet.circuit.CircuitBreaker`."""
+
+    def __init__(self, group, retry_in):
+        self.group = group
+        self.retry_in = retry_in
+
+    def __str__(self):  # pragma: no cover
+        return 'CircuitOpenError(group=%s): retry in %.1f seconds' % (self.group, self.retry_in)
+
+
+def build_api_error(response, blob=None, codec=None):
     """Helper method for creating errors and attaching HTTP response/request
-    details to them.
+    details to them. The body of the response is decoded with `codec`, unless
+    `blob` is given.
     """
     try:
-        blob = blob or response.json()
-    except json.JSONDecodeError:
+        blob = blob or (codec or default_codec()).loads(response.content)
+    except ValueError:
         blob = {}
     error_list = blob.get('errors', None)
     error = (error_list[0] if error_list else {})
@@ -0,0 +1,53 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import math
+import threading
+
+
+class HedgingPolicy(object):
+    """Decides when a slow GET request gets a duplicate ("hedge") sent alongside
+    it.
+
+    The hedge goes out once the request has taken longer than the `percentile`th
+    percentile of the latencies recently observed for its endpoint group (the
+    last `window` successful requests), bounded by `min_delay` and `max_delay`.
+    Until `min_samples` latencies have been recorded for a group,
+    `initial_delay` is used instead.
+
+    With the default 95th percentile, about one request in twenty is hedged.
+    """
+
+    def __init__(self, percentile=95, window=200, min_samples=20, min_delay=0.01,
+                 max_delay=5.0, initial_delay=1.0):
+        if not 0 < percentile <= 100:
+            raise ValueError('`percentile` must be between 0 and 100.')
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def delay(self, group):
+        """Returns how long a request to `group` may take before it is hedged."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(group, ()))
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        index = int(math.ceil(self.percentile / 100 * len(latencies))) - 1
+        return min(self.max_delay, max(self.min_delay, latencies[max(0, index)]))
+
+    def record(self, group, latency):
+        """Records the latency, in seconds, of a successful request to `group`."""
+        with self._lock:
+            latencies = self._latencies.get(group, None)
+            if latencies is None:
+                latencies = self._latencies[group] = collections.deque(maxlen=self.window)
+            latencies.append(latency)
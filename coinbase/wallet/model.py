@@ -11,26 +11,124 @@ from coinbase.wallet.compat import urlsplit
 
 
 def new_api_object(client, obj, cls=None, **kwargs):
+    """Turns decoded JSON into models: each dict becomes an instance of `cls`
+    (for the top-level one), of the model registered for its `resource`, of the
+    model whose keys it has (see `_obj_keys_to_model`), or else of `APIObject`.
+    Any `kwargs` are passed to the constructor of the top-level model.
+    """
     if isinstance(obj, dict):
-        if not cls:
-            resource = obj.get('resource', None)
-            cls = _resource_to_model.get(resource, None)
-        if not cls:
-            obj_keys = set(six.iterkeys(obj))
-            for keys, model in six.iteritems(_obj_keys_to_model):
-                if keys <= obj_keys:
-                    cls = model
-                    break
-        cls = cls or APIObject
-        result = cls(client, **kwargs)
-        for k, v in six.iteritems(obj):
-            result[k] = new_api_object(client, v)
+        cls = cls or _model_for(obj)
+        result = cls(client, **kwargs) if kwargs else _empty_model(cls, client)
+        dict.update(result, {k: _convert(client, v) for k, v in obj.items()})
         return result
     if isinstance(obj, list):
         return [new_api_object(client, v, cls) for v in obj]
     return obj
 
 
+def new_lazy_api_object(client, obj, cls=None, **kwargs):
+    """Like `new_api_object`, but leaves the nested values of each model as
+    decoded JSON until they are first accessed (as attributes, items or with
+    `get`), at which point they are turned into models and kept as such.
+    """
+    if isinstance(obj, dict):
+        cls = cls or _model_for(obj)
+        result = cls(client, **kwargs) if kwargs else _empty_model(cls, client)
+        dict.update(result, obj)
+        result.__dict__['_lazy'] = True
+        return result
+    if isinstance(obj, list):
+        return [new_lazy_api_object(client, v, cls) for v in obj]
+    return obj
+
+
+# Types of the JSON values that `new_lazy_api_object` leaves for later.
+_JSON_CONTAINERS = frozenset((dict, list))
+
+
+class _HydratedList(list):
+    """List whose items have been turned into (lazy) models."""
+
+    __slots__ = ()
+
+
+def _lazy_convert(client, value):
+    if type(value) is list:
+        return _HydratedList(_lazy_convert(client, v) for v in value)
+    return new_lazy_api_object(client, value)
+
+
+# Types of the JSON values that are used as they are.
+_SCALAR_TYPES = frozenset(six.string_types + six.integer_types + (float, bool, type(None)))
+
+
+def _convert(client, value):
+    # Nested values are by far the most common, so they skip the checks of
+    # `new_api_object`.
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    if value_type is dict:
+        result = _empty_model(_model_for(value), client)
+        dict.update(result, {k: _convert(client, v) for k, v in value.items()})
+        return result
+    return new_api_object(client, value)
+
+
+def _model_for(obj):
+    """Returns the model class for the dict `obj`."""
+    resource = obj.get('resource', None)
+    if resource is not None:
+        cls = _resource_to_model.get(resource, None)
+        if cls is not None:
+            return cls
+    for keys, model in _keys_dispatch():
+        for key in keys:
+            if key not in obj:
+                break
+        else:
+            return model
+    return APIObject
+
+
+_keys_dispatch_cache = [None, {}, ()]
+
+
+def _keys_dispatch():
+    """Returns `_obj_keys_to_model` as a tuple of `(keys, model)` pairs, which
+    is rebuilt whenever `_obj_keys_to_model` is replaced or modified.
+    """
+    source, snapshot, dispatch = _keys_dispatch_cache
+    # The mapping holds a handful of entries, so comparing it to a copy is
+    # cheap, and catches changes made in place.
+    if source is not _obj_keys_to_model or source != snapshot:
+        snapshot = dict(_obj_keys_to_model)
+        dispatch = tuple((tuple(keys), model) for keys, model in six.iteritems(snapshot))
+        _keys_dispatch_cache[:] = [_obj_keys_to_model, snapshot, dispatch]
+    return dispatch
+
+
+_default_init_classes = {}
+
+
+def _empty_model(cls, client):
+    """Returns an empty instance of `cls`, as `cls(client)` would. Unless `cls`
+    overrides `__init__`, the call is skipped: the instance only needs its
+    client, all other attributes keep their class-level defaults.
+    """
+    default_init = _default_init_classes.get(cls, None)
+    if default_init is None:
+        default_init = _default_init_classes[cls] = (
+            six.get_unbound_function(cls.__init__) is
+            six.get_unbound_function(APIObject.__init__))
+    if not default_init:
+        return cls(client)
+    result = dict.__new__(cls)
+    if client is not None:
+        result.__dict__['_APIObject__api_client'] = client
+    return result
+
+
 class APIObject(dict):
     """Generic class used to represent a JSON response from the Coinbase API.
 
@@ -45,6 +143,10 @@ class APIObject(dict):
     __pagination = None
     __warnings = None
 
+    # Whether nested values are turned into models on first access rather than
+    # up front; see `new_lazy_api_object`.
+    _lazy = False
+
     def __init__(self, api_client, response=None, pagination=None, warnings=None):
         self.__api_client = api_client
         if response:
@@ -78,19 +180,21 @@ class APIObject(dict):
         if not url:
             raise ValueError("Unable to refresh: missing 'resource_path' attribute.")
         response = self.api_client._get(url, data=params)
-        data = self.api_client._make_api_object(response, type(self))
-        self.update(data)
-        return data
+        data = self.api_client._make_api_object(response, type(self), raw=False)
+        return self.api_client._update_api_object(self, data)
 
     # The following three method definitions allow dot-notation access to member
     # objects for convenience.
     def __getattr__(self, *args, **kwargs):
         try:
-            return dict.__getitem__(self, *args, **kwargs)
+            value = dict.__getitem__(self, *args, **kwargs)
         except KeyError as key_error:
             attribute_error = AttributeError(*key_error.args)
             attribute_error.message = getattr(key_error, 'message', '')
             raise attribute_error
+        if self._lazy and type(value) in _JSON_CONTAINERS:
+            return self._hydrate(args[0], value)
+        return value
 
     def __delattr__(self, *args, **kwargs):
         try:
@@ -117,7 +221,22 @@ class APIObject(dict):
         data = getattr(self, 'data', None)
         if isinstance(data, list) and isinstance(key, (int, slice)):
             return data[key]
-        return dict.__getitem__(self, key)
+        value = dict.__getitem__(self, key)
+        if self._lazy and type(value) in _JSON_CONTAINERS:
+            return self._hydrate(key, value)
+        return value
+
+    def get(self, key, default=None):
+        if not self._lazy or key not in self:
+            return dict.get(self, key, default)
+        return self._hydrate(key, dict.__getitem__(self, key))
+
+    def _hydrate(self, key, value):
+        # Turns a value left as decoded JSON into models, once.
+        if type(value) in _JSON_CONTAINERS:
+            value = _lazy_convert(self.api_client, value)
+            dict.__setitem__(self, key, value)
+        return value
 
     def __dir__(self):  # pragma: no cover
         # This makes tab completion work in interactive shells like IPython for all
@@ -141,14 +260,12 @@ class Account(APIObject):
     def set_primary(self, **params):
         """https://developers.coinbase.com/api/v2#set-account-as-primary"""
         data = self.api_client.set_primary_account(self.id, **params)
-        self.update(data)
-        return data
+        return self.api_client._update_api_object(self, data)
 
     def modify(self, **params):
         """https://developers.coinbase.com/api#modify-an-account"""
         data = self.api_client.update_account(self.id, **params)
-        self.update(data)
-        return data
+        return self.api_client._update_api_object(self, data)
 
     def delete(self, **params):
         """https://developers.coinbase.com/api#delete-an-account"""
@@ -160,6 +277,10 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-addresses"""
         return self.api_client.get_addresses(self.id, **params)
 
+    def iter_addresses(self, **params):
+        """https://developers.coinbase.com/api/v2#list-addresses"""
+        return self.api_client.iter_addresses(self.id, **params)
+
     def get_address(self, address_id, **params):
         """https://developers.coinbase.com/api/v2#show-addresss"""
         return self.api_client.get_address(self.id, address_id, **params)
@@ -168,6 +289,10 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-address39s-transactions"""
         return self.api_client.get_address_transactions(self.id, address_id, **params)
 
+    def iter_address_transactions(self, address_id, **params):
+        """https://developers.coinbase.com/api/v2#list-address39s-transactions"""
+        return self.api_client.iter_address_transactions(self.id, address_id, **params)
+
     def create_address(self, **params):
         """https://developers.coinbase.com/api/v2#show-addresss"""
         return self.api_client.create_address(self.id, **params)
@@ -178,6 +303,14 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-transactions"""
         return self.api_client.get_transactions(self.id, **params)
 
+    def iter_transactions(self, **params):
+        """https://developers.coinbase.com/api/v2#list-transactions"""
+        return self.api_client.iter_transactions(self.id, **params)
+
+    def iter_new_transactions(self, cursor_store, **params):
+        """https://developers.coinbase.com/api/v2#list-transactions"""
+        return self.api_client.iter_new_transactions(self.id, cursor_store, **params)
+
     def get_transaction(self, transaction_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-transaction"""
         return self.api_client.get_transaction(self.id, transaction_id, **params)
@@ -200,6 +333,10 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-all-reports"""
         return self.api_client.get_reports(**params)
 
+    def iter_reports(self, **params):
+        """https://developers.coinbase.com/api/v2#list-all-reports"""
+        return self.api_client.iter_reports(**params)
+
     def get_report(self, report_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-report"""
         return self.api_client.get_report(report_id, **params)
@@ -214,6 +351,14 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-buys"""
         return self.api_client.get_buys(self.id, **params)
 
+    def iter_buys(self, **params):
+        """https://developers.coinbase.com/api/v2#list-buys"""
+        return self.api_client.iter_buys(self.id, **params)
+
+    def iter_new_buys(self, cursor_store, **params):
+        """https://developers.coinbase.com/api/v2#list-buys"""
+        return self.api_client.iter_new_buys(self.id, cursor_store, **params)
+
     def get_buy(self, buy_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-buy"""
         return self.api_client.get_buy(self.id, buy_id, **params)
@@ -232,6 +377,14 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-sells"""
         return self.api_client.get_sells(self.id, **params)
 
+    def iter_sells(self, **params):
+        """https://developers.coinbase.com/api/v2#list-sells"""
+        return self.api_client.iter_sells(self.id, **params)
+
+    def iter_new_sells(self, cursor_store, **params):
+        """https://developers.coinbase.com/api/v2#list-sells"""
+        return self.api_client.iter_new_sells(self.id, cursor_store, **params)
+
     def get_sell(self, sell_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-sell"""
         return self.api_client.get_sell(self.id, sell_id, **params)
@@ -250,6 +403,14 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-deposits"""
         return self.api_client.get_deposits(self.id, **params)
 
+    def iter_deposits(self, **params):
+        """https://developers.coinbase.com/api/v2#list-deposits"""
+        return self.api_client.iter_deposits(self.id, **params)
+
+    def iter_new_deposits(self, cursor_store, **params):
+        """https://developers.coinbase.com/api/v2#list-deposits"""
+        return self.api_client.iter_new_deposits(self.id, cursor_store, **params)
+
     def get_deposit(self, deposit_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-deposit"""
         return self.api_client.get_deposit(self.id, deposit_id, **params)
@@ -268,6 +429,14 @@ class Account(APIObject):
         """https://developers.coinbase.com/api/v2#list-withdrawals"""
         return self.api_client.get_withdrawals(self.id, **params)
 
+    def iter_withdrawals(self, **params):
+        """https://developers.coinbase.com/api/v2#list-withdrawals"""
+        return self.api_client.iter_withdrawals(self.id, **params)
+
+    def iter_new_withdrawals(self, cursor_store, **params):
+        """https://developers.coinbase.com/api/v2#list-withdrawals"""
+        return self.api_client.iter_new_withdrawals(self.id, cursor_store, **params)
+
     def get_withdrawal(self, withdrawal_id, **params):
         """https://developers.coinbase.com/api/v2#show-a-withdrawal"""
         return self.api_client.get_withdrawal(self.id, withdrawal_id, **params)
@@ -294,6 +463,10 @@ class Checkout(APIObject):
         """https://developers.coinbase.com/api/v2#list-checkout39s-orders"""
         return self.api_client.get_checkout_orders(self.id, **params)
 
+    def iter_orders(self, **params):
+        """https://developers.coinbase.com/api/v2#list-checkout39s-orders"""
+        return self.api_client.iter_checkout_orders(self.id, **params)
+
     def create_order(self, **params):
         """https://developers.coinbase.com/api/v2#create-a-new-order-for-a-checkout"""
         return self.api_client.create_checkout_order(self.id, **params)
@@ -319,8 +492,7 @@ class Money(APIObject):
 class Order(APIObject):
     def refund(self, **params):
         data = self.api_client.refund_order(self.id, **params)
-        self.update(data)
-        return data
+        return self.api_client._update_api_object(self, data)
 
 
 class PaymentMethod(APIObject):
@@ -351,9 +523,8 @@ class Report(APIObject):
 class Transfer(APIObject):
     def commit(self, **params):
         response = self.api_client._post(self.resource_path, 'commit')
-        data = self.api_client._make_api_object(response, type(self))
-        self.update(data)
-        return data
+        data = self.api_client._make_api_object(response, type(self), raw=False)
+        return self.api_client._update_api_object(self, data)
 
 
 class Buy(Transfer):
@@ -380,8 +551,7 @@ class CurrentUser(User):
     def modify(self, **params):
         """https://developers.coinbase.com/api/v2#update-current-user"""
         data = self.api_client.update_current_user(**params)
-        self.update(data)
-        return data
+        return self.api_client._update_api_object(self, data)
 
 
 # The following dicts are used to automatically parse API responses into the
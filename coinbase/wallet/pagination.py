@@ -0,0 +1,309 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import json
+import sys
+import threading
+import time
+import traceback
+import weakref
+
+import requests
+import six
+from six.moves import queue
+
+from coinbase.wallet.compat import parse_qs
+from coinbase.wallet.compat import urlsplit
+from coinbase.wallet.error import BadGatewayError
+from coinbase.wallet.error import InternalServerError
+from coinbase.wallet.error import ServiceUnavailableError
+
+# Drops the local variables of the frames of a traceback (Python 3.4+).
+_clear_frames = getattr(traceback, 'clear_frames', lambda tb: None)
+
+# Errors after which requesting the same page again may well succeed.
+RETRYABLE_PAGE_ERRORS = (
+    InternalServerError,
+    BadGatewayError,
+    ServiceUnavailableError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
+
+def next_cursor(blob):
+    """Returns the `starting_after` cursor of the page following `blob`, or None
+    if `blob` is the last page of a listing (or is not paginated at all).
+    """
+    if not isinstance(blob, dict):
+        return None
+    page_info = blob.get('pagination', None) or {}
+    next_uri = page_info.get('next_uri', None)
+    if not next_uri:
+        # next_uri is None when the cursor has been iterated to the last element
+        return None
+    query = parse_qs(urlsplit(next_uri).query)
+    return (query.get('starting_after', None) or [None])[0]
+
+
+def page_items(page):
+    """Returns the items of a page of a listing, as returned by the client's
+    `_make_api_object`: its data, or in 'bytes' raw mode, its body alone.
+    """
+    if isinstance(page, list):
+        return page
+    return page['data']
+
+
+class Paginator(object):
+    """Iterator over the items of a cursor-paginated API listing.
+
+    Pages are requested one at a time, only once the items of the previous page
+    have been consumed, so memory use stays proportional to a single page. Each
+    item is yielded as an instance of `model_type`.
+
+    With `raw` set to 'dicts' (or True), items are yielded as plain dicts; with
+    'bytes', the body of each page is yielded instead of its items. By default,
+    the client's `raw` option applies.
+
+    Iteration stops early once `max_pages` pages have been requested or
+    `max_items` items have been yielded. At any point, `cursor` holds the
+    `starting_after` value needed to carry on from the last item that was
+    yielded, or None once the whole listing has been consumed.
+
+    With `prefetch` set to a positive number, pages are requested on a background
+    thread which stays up to that many pages ahead of the consumer, so that the
+    network round-trip for the next page overlaps with the processing of the
+    current one. Call `close` (or use the paginator as a context manager) when
+    abandoning such an iteration early.
+
+    A page that fails with a transient error (see `RETRYABLE_PAGE_ERRORS`) is
+    requested again up to `page_retries` times (by default, twice; or not at
+    all if the client has a `retry_policy` of its own). If it still fails, the
+    error is raised without losing the position: iterating again carries on from
+    the last page that was received. `get_state` returns a JSON-serializable
+    snapshot of the position which can be passed back as `resume_from`, e.g. by
+    another process after a crash.
+
+    Not intended for direct use by API consumers; see the `iter_*` methods of
+    `coinbase.wallet.client.Client`.
+    """
+
+    # The largest page size accepted by the API.
+    MAX_LIMIT = 100
+
+    # Default number of times a failed page is requested again, and the delay
+    # before the first retry (in seconds; doubled after each one).
+    PAGE_RETRIES = 2
+    RETRY_BACKOFF = 0.25
+
+    def __init__(self, client, model_type, *relative_path_parts, **kwargs):
+        self.client = client
+        self.model_type = model_type
+        self.relative_path_parts = relative_path_parts
+        self.params = dict(kwargs.pop('params', None) or {})
+        if self.params.get('limit', None):
+            self.params['limit'] = min(int(self.params['limit']), self.MAX_LIMIT)
+        self.cursor = self.params.pop('starting_after', None)
+        self.max_pages = kwargs.pop('max_pages', None)
+        self.max_items = kwargs.pop('max_items', None)
+        self.prefetch = kwargs.pop('prefetch', None) or 0
+        self.page_retries = kwargs.pop('page_retries', None)
+        if self.page_retries is None:
+            # A client with a retry policy already retries each request.
+            has_policy = getattr(client, 'retry_policy', None) is not None
+            self.page_retries = 0 if has_policy else self.PAGE_RETRIES
+        self.raw = kwargs.pop('raw', None)
+        resume_from = kwargs.pop('resume_from', None)
+        self.request_kwargs = kwargs
+        self.pages_fetched = 0
+        self.items_yielded = 0
+        self._items = collections.deque()
+        self._next_cursor = None
+        self._last_page = False
+        self._prefetched = None
+        self._closed = threading.Event()
+        if resume_from is not None:
+            self._restore_state(resume_from)
+
+    @property
+    def has_more(self):
+        """Whether the listing has items that have not been yielded yet."""
+        return bool(self._items) or not self._last_page
+
+    def __iter__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_state(self):
+        """Returns a JSON-serializable snapshot of the iteration position."""
+        return {
+            'path': list(self.relative_path_parts),
+            'cursor': self.cursor,
+            'done': not self.has_more,
+            'pages_fetched': self.pages_fetched,
+            'items_yielded': self.items_yielded,
+        }
+
+    def _restore_state(self, state):
+        if isinstance(state, six.string_types):
+            state = json.loads(state)
+        if list(state['path']) != list(self.relative_path_parts):
+            raise ValueError(
+                'Cannot resume an iteration over /%s from one over /%s.' % (
+                    '/'.join(self.relative_path_parts), '/'.join(state['path'])))
+        self.cursor = state['cursor']
+        self._last_page = state['done']
+        self.pages_fetched = state['pages_fetched']
+        self.items_yielded = state['items_yielded']
+
+    def close(self):
+        """Ends the iteration, stopping the prefetching thread if there is one."""
+        self._closed.set()
+
+    def __next__(self):
+        if self._item_budget_spent():
+            self.close()
+            raise StopIteration
+        while not self._items:
+            if not self._can_fetch():
+                raise StopIteration
+            response, blob = self._next_page()
+            self._add_page_items(
+                self.client._make_api_object(response, self.model_type, blob, raw=self.raw))
+        return self._pop_item()
+
+    next = __next__  # Python 2
+
+    def iter_pages(self):
+        """Yields a `(response, blob)` pair for each remaining page, where `blob` is
+        the decoded JSON body. `max_items` does not apply to whole pages.
+        """
+        while self._can_fetch():
+            page = self._next_page()
+            self.cursor = self._next_cursor
+            yield page
+
+    def _item_budget_spent(self):
+        return self.max_items is not None and self.items_yielded >= self.max_items
+
+    def _can_fetch(self):
+        if self._last_page or self._closed.is_set():
+            return False
+        return self.max_pages is None or self.pages_fetched < self.max_pages
+
+    def _record_page(self, blob):
+        self.pages_fetched += 1
+        self._next_cursor = next_cursor(blob)
+        self._last_page = self._next_cursor is None
+
+    def _add_page_items(self, page):
+        self._items.extend(page_items(page))
+        if not self._items:
+            self.cursor = self._next_cursor
+
+    def _pop_item(self):
+        item = self._items.popleft()
+        self.items_yielded += 1
+        if self._items:
+            self.cursor = item.get('id', self.cursor)
+        else:
+            self.cursor = self._next_cursor
+        return item
+
+    def _page_params(self, cursor):
+        params = dict(self.params)
+        if cursor is not None:
+            params['starting_after'] = cursor
+        return params
+
+    def _next_page(self):
+        if self.prefetch:
+            response, blob = self._next_prefetched_page()
+        else:
+            response, blob = self._fetch_page(self.cursor)
+        self._record_page(blob)
+        return response, blob
+
+    def _fetch_page(self, cursor):
+        params = self._page_params(cursor)
+        attempt = 0
+        while True:
+            try:
+                response = self.client._request(
+                    'get', *self.relative_path_parts, params=params, **self.request_kwargs)
+                return response, self.client._decode_response(response)
+            except RETRYABLE_PAGE_ERRORS:
+                if attempt >= self.page_retries or self._closed.is_set():
+                    raise
+            time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+    def _next_prefetched_page(self):
+        if self._prefetched is None:
+            self._prefetched = queue.Queue(maxsize=self.prefetch)
+            # The thread only holds a weak reference to the paginator, so that it
+            # also stops once the paginator is dropped without being closed, e.g.
+            # after breaking out of a `for` loop.
+            thread = threading.Thread(
+                target=_prefetch_pages, name='coinbase-prefetch', args=(
+                    weakref.ref(self), self._prefetched, self._closed, self.cursor,
+                    self.pages_fetched, self.max_pages))
+            thread.daemon = True
+            thread.start()
+        page, exc_info = self._prefetched.get()
+        if exc_info is not None:
+            # The background thread has stopped; the next call starts a new one
+            # from the last page that was received.
+            self._prefetched = None
+            six.reraise(*exc_info)
+        return page
+
+
+def _prefetch_pages(paginator_ref, prefetched, closed, cursor, pages, max_pages):
+    """Runs on the background thread of a `Paginator`, queueing pages ahead of
+    its consumer until the paginator is closed or garbage collected.
+    """
+    while True:
+        paginator = paginator_ref()
+        if paginator is None or closed.is_set():
+            return
+        try:
+            page = paginator._fetch_page(cursor)
+        except Exception:
+            exc_info = sys.exc_info()
+            # The frames of the traceback would keep the paginator alive.
+            _clear_frames(exc_info[2])
+            del paginator
+            _put_prefetched(paginator_ref, prefetched, closed, (None, exc_info))
+            return
+        del paginator
+        if not _put_prefetched(paginator_ref, prefetched, closed, (page, None)):
+            return
+        pages += 1
+        cursor = next_cursor(page[1])
+        if cursor is None or (max_pages is not None and pages >= max_pages):
+            return
+
+
+def _put_prefetched(paginator_ref, prefetched, closed, item):
+    """Queues `item`, waiting for room as long as the paginator is in use.
+    Returns whether it was queued.
+    """
+    while not closed.is_set() and paginator_ref() is not None:
+        try:
+            prefetched.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
@@ -0,0 +1,158 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import email.utils
+import threading
+import time
+
+import six
+
+
+def retry_after(response, default=None):
+    """Returns the number of seconds a `Retry-After` header of `response` asks
+    the client to wait (given either in seconds or as an HTTP date), or
+    `default` if there is no such header.
+    """
+    value = response.headers.get('Retry-After', None)
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        parsed = email.utils.parsedate_tz(value)
+        if parsed is None:
+            return default
+        return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+
+class TokenBucket(object):
+    """Token bucket allowing `rate` requests per second on average, in bursts of
+    at most `burst` requests.
+
+    The rate adapts to the API's responses: it is halved on each 429 response
+    (and requests are held back for as long as `Retry-After` asks), lowered to
+    what the `X-RateLimit-Remaining` / `X-RateLimit-Reset` headers allow until
+    the end of the current window, and otherwise raised by `rate / 20` after
+    each successful response, back up to the configured rate.
+    """
+
+    # The rate never drops below this fraction of the configured one.
+    MIN_RATE_FACTOR = 0.05
+
+    # Default pause after a 429 response without a `Retry-After` header.
+    DEFAULT_RETRY_AFTER = 1.0
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError('`rate` must be positive.')
+        self.max_rate = self.rate = float(rate)
+        self.burst = float(burst or max(1.0, rate))
+        self.tokens = self.burst
+        self.blocked_until = 0.0
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token for one request and returns how many seconds the caller
+        must wait before sending it. Callers that find the bucket empty queue up
+        behind each other, rather than all retrying at once.
+        """
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def update(self, response):
+        """Adapts the rate to the status and headers of an API response."""
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            min_rate = self.max_rate * self.MIN_RATE_FACTOR
+            if response.status_code == 429:
+                self.rate = max(min_rate, self.rate / 2)
+                pause = retry_after(response, self.DEFAULT_RETRY_AFTER)
+                self.blocked_until = max(self.blocked_until, now + pause)
+                self.tokens = min(self.tokens, 0.0)
+                return
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+            remaining, reset_in = self._window(response, now)
+            if remaining is not None:
+                self.tokens = min(self.tokens, remaining)
+                if remaining <= 0 and reset_in:
+                    self.blocked_until = max(self.blocked_until, now + reset_in)
+                elif reset_in:
+                    self.rate = max(min_rate, min(self.rate, remaining / reset_in))
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _window(self, response, now):
+        """Reads the requests left in the current rate limit window, and the
+        seconds until it resets, from the response headers (None when absent).
+        """
+        headers = response.headers
+        try:
+            remaining = float(headers['X-RateLimit-Remaining'])
+        except (KeyError, TypeError, ValueError):
+            return None, None
+        try:
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return remaining, None
+        # The reset time is sent either as a timestamp or as a number of seconds.
+        reset_in = reset - now if reset > 1e9 else reset
+        return remaining, max(0.0, reset_in) or None
+
+
+class RateLimiter(object):
+    """Client-side rate limiting of API requests, by endpoint group.
+
+    `limits` maps endpoint groups (see `coinbase.wallet.util.endpoint_group`,
+    e.g. 'accounts' or 'prices') to a request rate per second, or to a
+    `(rate, burst)` pair. Requests to other groups share one bucket limited by
+    `default` (same format), or are not limited at all if it is None.
+
+    A single limiter can be shared by several clients using the same API key,
+    in which case they share the budget.
+    """
+
+    def __init__(self, limits=None, default=None):
+        self.buckets = {}
+        for group, limit in six.iteritems(limits or {}):
+            self.buckets[group] = self._make_bucket(limit)
+        self.default_bucket = default and self._make_bucket(default)
+
+    @staticmethod
+    def _make_bucket(limit):
+        if isinstance(limit, (tuple, list)):
+            return TokenBucket(*limit)
+        return TokenBucket(limit)
+
+    def bucket(self, group):
+        """Returns the bucket limiting requests to `group`, if any."""
+        return self.buckets.get(group, self.default_bucket)
+
+    def reserve(self, group):
+        """Takes a token for a request to `group`; returns the seconds to wait
+        before sending it.
+        """
+        bucket = self.bucket(group)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, group):
+        """Blocks until a request to `group` may be sent."""
+        wait = self.reserve(group)
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, group, response):
+        """Adapts the limit of `group` to an API response."""
+        bucket = self.bucket(group)
+        if bucket is not None:
+            bucket.update(response)
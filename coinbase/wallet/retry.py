@@ -0,0 +1,81 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import random
+
+import requests
+
+from coinbase.wallet.error import APIError
+from coinbase.wallet.error import BadGatewayError
+from coinbase.wallet.error import InternalServerError
+from coinbase.wallet.error import RateLimitExceededError
+from coinbase.wallet.error import ServiceUnavailableError
+from coinbase.wallet.ratelimit import retry_after
+
+# Errors after which sending the same request again may well succeed.
+RETRYABLE_ERRORS = (
+    InternalServerError,
+    BadGatewayError,
+    ServiceUnavailableError,
+    RateLimitExceededError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class RetryPolicy(object):
+    """Decides whether, and when, a failed API request is sent again.
+
+    A request is attempted at most `max_attempts` times. The delay before
+    retry number `n` is `backoff * 2 ** (n - 1)` seconds, capped at
+    `max_backoff`, of which a random fraction of up to `jitter` is taken off
+    so that clients which failed together do not retry in lockstep. When the
+    API sends a `Retry-After` header, the delay is at least that long. No retry
+    is attempted past `deadline` seconds after the first attempt.
+
+    Only errors that are instances of `retryable` are retried, and only for
+    requests that are safe to repeat: GET requests, and POST requests carrying
+    an idempotency key (`idem`), such as `send_money(..., idem='...')`.
+    """
+
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30, jitter=1.0,
+                 deadline=None, retryable=RETRYABLE_ERRORS):
+        if max_attempts < 1:
+            raise ValueError('`max_attempts` must be at least 1.')
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retryable = tuple(retryable)
+
+    def allows(self, method, data=None):
+        """Whether a request with this method and data may be retried at all."""
+        method = method.lower()
+        if method == 'get':
+            return True
+        return method == 'post' and isinstance(data, dict) and bool(data.get('idem', None))
+
+    def backoff_delay(self, attempt):
+        """Returns the delay before retrying a request after its `attempt`-th
+        attempt failed.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def next_delay(self, error, attempt, elapsed):
+        """Returns how long to wait before sending the request again, after its
+        `attempt`-th attempt failed with `error`, `elapsed` seconds after the
+        first one started; or None if it should not be retried.
+        """
+        if attempt >= self.max_attempts or not isinstance(error, self.retryable):
+            return None
+        delay = self.backoff_delay(attempt)
+        if isinstance(error, APIError):
+            delay = max(delay, retry_after(error.response, 0))
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
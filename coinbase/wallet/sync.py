@@ -0,0 +1,195 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+
+import six
+
+from coinbase.wallet.pagination import Paginator
+from coinbase.wallet.pagination import page_items
+
+
+class CursorStore(object):
+    """Interface for persisting the cursors used by incremental syncs.
+
+    A cursor store maps a key (identifying an account and endpoint) to the id of
+    the newest item seen at that endpoint. Subclasses must implement `get` and
+    `set`; both may be called from several threads.
+    """
+
+    def get(self, key):
+        """Returns the cursor stored under `key`, or None."""
+        raise NotImplementedError
+
+    def set(self, key, cursor):
+        """Stores `cursor` under `key`, replacing any previous value."""
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Forgets the cursor stored under `key`, forcing a full sync next time."""
+        raise NotImplementedError
+
+
+class MemoryCursorStore(CursorStore):
+    """Keeps cursors in memory; mostly useful for tests and short-lived jobs."""
+
+    def __init__(self):
+        self._cursors = {}
+
+    def get(self, key):
+        return self._cursors.get(key, None)
+
+    def set(self, key, cursor):
+        self._cursors[key] = cursor
+
+    def delete(self, key):
+        self._cursors.pop(key, None)
+
+
+class FileCursorStore(CursorStore):
+    """Keeps cursors in a JSON file, which is rewritten atomically on each update."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError):
+            return {}
+        except ValueError:
+            # A truncated or corrupt file (e.g. left by a crash before files were
+            # replaced atomically) only costs a full sync of each listing.
+            return {}
+
+    def _dump(self, cursors):
+        tmp_path = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            json.dump(cursors, f, sort_keys=True)
+        if six.PY3:
+            # Atomically replaces an existing file, on Windows too.
+            os.replace(tmp_path, self.path)
+        else:  # pragma: no cover
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+
+    def get(self, key):
+        with self._lock:
+            return self._load().get(key, None)
+
+    def set(self, key, cursor):
+        with self._lock:
+            cursors = self._load()
+            cursors[key] = cursor
+            self._dump(cursors)
+
+    def delete(self, key):
+        with self._lock:
+            cursors = self._load()
+            if cursors.pop(key, None) is not None:
+                self._dump(cursors)
+
+
+class SQLiteCursorStore(CursorStore):
+    """Keeps cursors in a SQLite database; safe to share between processes."""
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cursors (key TEXT PRIMARY KEY, cursor TEXT)')
+
+    @contextlib.contextmanager
+    def _connect(self):
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            with conn:
+                yield conn
+
+    def get(self, key):
+        with self._connect() as conn:
+            row = conn.execute('SELECT cursor FROM cursors WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, cursor):
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO cursors (key, cursor) VALUES (?, ?)', (key, cursor))
+
+    def delete(self, key):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cursors WHERE key = ?', (key,))
+
+
+def prepare_sync(cursor_store, relative_path_parts, params):
+    """Returns the `(cursor_store, key, params)` to use for an incremental sync of
+    the listing at `relative_path_parts`. A path may be given as `cursor_store`,
+    as a shortcut for a `SQLiteCursorStore`.
+    """
+    if isinstance(cursor_store, six.string_types):
+        cursor_store = SQLiteCursorStore(cursor_store)
+    key = '/'.join(relative_path_parts)
+    params = dict(params or {})
+    if params.setdefault('order', 'desc') != 'desc':
+        raise ValueError('Incremental syncs walk listings newest first; `order` must be '
+                         "'desc', not %r." % (params['order'],))
+    params['limit'] = min(int(params.get('limit', None) or Paginator.MAX_LIMIT),
+                          Paginator.MAX_LIMIT)
+    return cursor_store, key, params
+
+
+def iter_new_items(client, cursor_store, model_type, *relative_path_parts, **kwargs):
+    """Yields the items of a listing that are newer than the cursor stored for it.
+
+    The cursor is keyed by the endpoint path. When no cursor has been stored yet,
+    the whole listing is walked (newest item first) and the id of its newest item
+    is stored once it has been consumed entirely. Later calls only request the
+    items created since, using `ending_before`, and yield them oldest first; the
+    cursor is advanced after each page has been consumed, so an interrupted sync
+    repeats at most one page.
+
+    Not intended for direct use by API consumers; see the `iter_new_*` methods of
+    `coinbase.wallet.client.Client`.
+    """
+    cursor_store, key, params = prepare_sync(
+        cursor_store, relative_path_parts, kwargs.pop('params', None))
+    raw = params.pop('raw', None)
+    cursor = cursor_store.get(key)
+    if cursor is None:
+        newest = None
+        paginator = Paginator(client, model_type, *relative_path_parts, params=params, **kwargs)
+        for response, blob in paginator.iter_pages():
+            if newest is None and blob['data']:
+                newest = blob['data'][0].get('id', None)
+            page = client._make_api_object(response, model_type, blob, raw=raw)
+            for item in page_items(page):
+                yield item
+        if newest is not None:
+            cursor_store.set(key, newest)
+        return
+
+    while True:
+        page_params = dict(params, ending_before=cursor)
+        response = client._request(
+            'get', *relative_path_parts, params=page_params, **kwargs)
+        blob = client._decode_response(response)
+        page = client._make_api_object(response, model_type, blob, raw=raw)
+        data = blob['data']
+        if not data:
+            return
+        # Pages come newest first; hand them out in the order they happened.
+        for item in reversed(page_items(page)):
+            yield item
+        cursor = data[0].get('id', cursor)
+        cursor_store.set(key, cursor)
+        if len(data) < params['limit']:
+            return
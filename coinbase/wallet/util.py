@@ -4,10 +4,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import json
+import calendar
+import re
 import six
 import warnings
 
+from coinbase.wallet.codec import default_codec
 from coinbase.wallet.compat import urlparse
 
 
@@ -28,10 +30,12 @@ def clean_params(params, drop_nones=True, recursive=True):
     return cleaned
 
 
-def encode_params(params, **kwargs):
-    """Clean and JSON-encode a dict of parameters."""
+def encode_params(params, codec=None, **kwargs):
+    """Clean and JSON-encode a dict of parameters, with `codec` if given and the
+    default one of `coinbase.wallet.codec` otherwise.
+    """
     cleaned = clean_params(params, **kwargs)
-    return json.dumps(cleaned)
+    return (codec or default_codec()).dumps(cleaned)
 
 
 def check_uri_security(uri):
@@ -44,3 +48,39 @@ def check_uri_security(uri):
             '  %s\n') % uri
         warnings.warn(warning_message, UserWarning)
     return uri
+
+
+_TIMESTAMP_RE = re.compile(
+    r'^(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(\.\d+)?(Z|[+-]\d\d:?\d\d)?$')
+
+
+def parse_timestamp(value):
+    """Converts an ISO 8601 timestamp, as found in API responses, to seconds since
+    the epoch. Returns None if `value` is not such a timestamp.
+    """
+    match = _TIMESTAMP_RE.match(value or '')
+    if not match:
+        return None
+    year, month, day, hour, minute, second = (int(g) for g in match.groups()[:6])
+    seconds = calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+    if match.group(7):
+        seconds += float(match.group(7))
+    offset = match.group(8)
+    if offset and offset != 'Z':
+        offset = offset.replace(':', '')
+        sign = -1 if offset[0] == '-' else 1
+        seconds -= sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+    return seconds
+
+
+def endpoint_group(relative_path_parts):
+    """Returns the group of API endpoints that a request path belongs to: the
+    top-level resource, such as 'accounts' for `('v2', 'accounts', id,
+    'transactions')`, or the first path segment outside of the versioned API
+    (e.g. 'oauth'). Parts may hold several segments, like the resource paths
+    that model methods pass: `('/v2/accounts/id/buys/id', 'commit')`.
+    """
+    parts = [segment for part in relative_path_parts for segment in part.split('/') if segment]
+    if len(parts) > 1 and parts[0] == 'v2':
+        return parts[1]
+    return parts[0] if parts else ''
@@ -21,6 +21,10 @@ setup(
         coinbase.wallet.__version__),
     keywords=['api', 'coinbase', 'bitcoin', 'oauth2', 'client'],
     install_requires=REQUIREMENTS,
+    extras_require={
+        'async': ['aiohttp>=3.0'],
+        'json': ['orjson'],
+    },
     author='Coinbase, Inc.',
     author_email='api@coinbase.com',
     classifiers=[
@@ -28,3 +28,45 @@ def mock_response(method, uri, data, errors=None, warnings=None, pagination=None
             return fn(*args, **kwargs)
         return inner
     return wrapper
+
+
+def mock_paginated_response(method, uri, pages, warnings=None):
+    """Serves each list in `pages` as one page of a cursor-paginated listing.
+
+    Every item must have an `id`; the page to serve is picked from the
+    `starting_after` query parameter, as it would be by the real API.
+    """
+    def wrapper(fn):
+        @six.wraps(fn)
+        @hp.activate
+        def inner(*args, **kwargs):
+            def server_response(request, url, headers):
+                cursor = request.querystring.get('starting_after', [None])[0]
+                index = 0
+                for i, page in enumerate(pages):
+                    if page and page[-1]['id'] == cursor:
+                        index = i + 1
+                page = pages[index]
+                next_uri = None
+                if index + 1 < len(pages):
+                    next_uri = '/%s?starting_after=%s&limit=%d' % (
+                        uri.strip('/'), page[-1]['id'], len(page))
+                body = {
+                    'data': page,
+                    'pagination': {
+                        'ending_before': None,
+                        'starting_after': cursor,
+                        'limit': len(page),
+                        'order': 'desc',
+                        'previous_uri': None,
+                        'next_uri': next_uri,
+                    },
+                }
+                if warnings is not None:
+                    body['warnings'] = warnings
+                return 200, headers, json.dumps(body)
+            hp.reset()
+            hp.register_uri(method, re.compile('.*' + uri + '$'), server_response)
+            return fn(*args, **kwargs)
+        return inner
+    return wrapper
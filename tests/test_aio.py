@@ -0,0 +1,336 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import hashlib
+import hmac
+import json
+import threading
+import time
+import unittest2
+import warnings
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+try:
+    import asyncio
+    from coinbase.wallet.aio import _AdaptiveSlot
+    from coinbase.wallet.aio import AsyncClient
+    from coinbase.wallet.aio import AsyncOAuthClient
+    from coinbase.wallet.aio import aiohttp
+except (ImportError, SyntaxError):
+    aiohttp = None
+from coinbase.wallet.batch import AdaptiveConcurrencyLimit
+from coinbase.wallet.cache import PriceCache
+from coinbase.wallet.error import AuthenticationError
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.hedging import HedgingPolicy
+from coinbase.wallet.model import Account
+from coinbase.wallet.model import APIObject
+from coinbase.wallet.model import Transaction
+
+
+# Hide all warning output.
+warnings.showwarning = lambda *a, **k: None
+
+api_key = 'fakeapikey'
+api_secret = 'fakeapisecret'
+
+accounts = [{'id': 'a%d' % i, 'resource': 'account'} for i in range(5)]
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    # Whether the next request to /v2/time should be slow.
+    slow_time = False
+
+    # Number of requests to /v2/time.
+    time_requests = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _authorized(self, body):
+        if self.headers.get('Authorization') == 'Bearer fakeaccesstoken':
+            return True
+        if 'CB-ACCESS-SIGN' not in self.headers:
+            return False
+        message = (self.headers['CB-ACCESS-TIMESTAMP'] + self.command + self.path +
+                   body.decode('utf-8')).encode('utf-8')
+        expected = hmac.new(api_secret.encode('utf-8'), message, hashlib.sha256).hexdigest()
+        return (self.headers['CB-ACCESS-KEY'] == api_key and
+                self.headers['CB-ACCESS-SIGN'] == expected)
+
+    def do_GET(self):
+        if not self._authorized(b''):
+            return self._reply(401, {'errors': [{'id': 'authentication_error'}]})
+        path, _, query = self.path.partition('?')
+        if path == '/v2/accounts':
+            start = 0
+            if 'starting_after=' in query:
+                cursor = query.split('starting_after=')[1].split('&')[0]
+                start = [a['id'] for a in accounts].index(cursor) + 1
+            page = accounts[start:start + 2]
+            next_uri = None
+            if start + 2 < len(accounts):
+                next_uri = '/v2/accounts?starting_after=%s' % page[-1]['id']
+            return self._reply(200, {'data': page, 'pagination': {'next_uri': next_uri}})
+        if path.startswith('/v2/accounts/') and path.endswith('/transactions'):
+            account_id = path.split('/')[3]
+            if account_id not in [a['id'] for a in accounts]:
+                return self._reply(404, {'errors': [{'id': 'not_found', 'message': 'Not found'}]})
+            created_at = '2015-01-0%sT00:00:00Z' % (int(account_id[1:]) + 1)
+            return self._reply(200, {'data': [{'id': 't' + account_id, 'created_at': created_at}]})
+        if path.startswith('/v2/accounts/a1/transactions/') and not path.endswith('/missing'):
+            return self._reply(200, {'data': {'id': path.split('/')[-1]}})
+        if path == '/v2/time':
+            Handler.time_requests += 1
+            if Handler.slow_time:
+                Handler.slow_time = False
+                time.sleep(1)
+            return self._reply(200, {'data': {'epoch': 1}})
+        if path == '/v2/prices/BTC-USD/spot':
+            return self._reply(200, {'data': {'amount': '1.00', 'currency': 'USD'}})
+        return self._reply(404, {'errors': [{'id': 'not_found', 'message': 'Not found'}]})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if not self._authorized(body):
+            return self._reply(401, {'errors': [{'id': 'authentication_error'}]})
+        if self.path.startswith('/oauth/token'):
+            return self._reply(200, {'access_token': 'new', 'refresh_token': 'newer'})
+        params = json.loads(body.decode('utf-8'))
+        return self._reply(201, {'data': dict(params, id='tx', resource='transaction')})
+
+    def do_DELETE(self):
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+@unittest2.skipIf(aiohttp is None, 'requires Python 3.6+ and aiohttp')
+class TestAsyncClient(unittest2.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = Server(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        cls.base_api_uri = 'http://127.0.0.1:%d/' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.client = AsyncClient(api_key, api_secret, self.base_api_uri)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.close()
+
+    def run_all(self, *coros):
+        tasks = [self.loop.create_task(coro) for coro in coros]
+        self.loop.run_until_complete(asyncio.wait(tasks))
+        return [task.result() for task in tasks]
+
+    def collect(self, async_iterator):
+        items = []
+        while True:
+            try:
+                items.append(self.loop.run_until_complete(async_iterator.__anext__()))
+            except StopAsyncIteration:
+                return items
+
+    def test_get_spot_price(self):
+        price, = self.run_all(self.client.get_spot_price())
+        self.assertIsInstance(price, APIObject)
+        self.assertEqual(price.amount, '1.00')
+
+    def test_get_accounts_merges_pages(self):
+        listing, = self.run_all(self.client.get_accounts())
+        self.assertEqual([a.id for a in listing.data], [a['id'] for a in accounts])
+        for account in listing.data:
+            self.assertIsInstance(account, Account)
+            self.assertIs(account.api_client, self.client)
+
+    def test_iter_accounts(self):
+        for prefetch in (0, 2):
+            iterator = self.client.iter_accounts(prefetch=prefetch)
+            with self.assertRaises(TypeError):
+                next(iterator)
+            ids = [a.id for a in self.collect(iterator)]
+            self.assertEqual(ids, [a['id'] for a in accounts])
+        iterator = self.client.get_accounts(iterator=True, max_items=3)
+        self.assertEqual([a.id for a in self.collect(iterator)], ['a0', 'a1', 'a2'])
+        self.assertEqual(iterator.cursor, 'a2')
+        # Like the results of other methods, iterators can be awaited.
+        async def get_iterator():
+            return await self.client.get_accounts(iterator=True, max_items=1)
+        iterator, = self.run_all(get_iterator())
+        self.assertEqual([a.id for a in self.collect(iterator)], ['a0'])
+
+    def test_iter_accounts_prefetch_abandoned(self):
+        # Breaking out of a loop without closing the iterator stops its task.
+        async def abandon():
+            for _ in range(5):
+                async for account in self.client.iter_accounts(prefetch=1, limit=2):
+                    break
+            gc.collect()
+            all_tasks = getattr(asyncio, 'all_tasks', None) or asyncio.Task.all_tasks
+            for _ in range(100):
+                if not [task for task in all_tasks()
+                        if '_prefetch_pages' in repr(task.get_coro())]:
+                    return True
+                await asyncio.sleep(0.02)
+            return False
+        self.assertEqual(self.run_all(abandon()), [True])
+
+    def test_post_is_signed(self):
+        tx, = self.run_all(
+            self.client.send_money('foo', to='bar', amount='1', currency='BTC'))
+        self.assertIsInstance(tx, Transaction)
+        self.assertEqual(tx.to, 'bar')
+
+    def test_model_methods(self):
+        account = Account(self.client)
+        account.id = 'foo'
+        tx, deleted = self.run_all(
+            account.send_money(to='bar', amount='1', currency='BTC'), account.delete())
+        self.assertIsInstance(tx, Transaction)
+        self.assertIsNone(deleted)
+
+    def test_errors(self):
+        with self.assertRaises(NotFoundError):
+            self.run_all(self.client.get_account('missing'))
+
+    def test_for_accounts(self):
+        results, = self.run_all(
+            self.client.get_for_accounts('transactions', max_workers=2))
+        self.assertEqual(list(results), [a['id'] for a in accounts])
+        self.assertEqual(results['a3'].data[0].id, 'ta3')
+        results, = self.run_all(self.client.get_for_accounts(
+            'transactions', ['a1', 'missing'], return_exceptions=True))
+        self.assertIsInstance(results['missing'], NotFoundError)
+        merged = self.collect(self.client.iter_for_accounts('transactions', ['a1', 'a4', 'a2']))
+        self.assertEqual([t.id for t in merged], ['ta4', 'ta2', 'ta1'])
+
+        self.client.concurrency_limit = AdaptiveConcurrencyLimit(initial=1, max_limit=2)
+        results, = self.run_all(self.client.get_for_accounts('transactions'))
+        self.assertEqual(len(results), len(accounts))
+        self.assertEqual(self.client.concurrency_limit.limit, 2)
+        self.assertEqual(self.client.concurrency_limit.in_flight, 0)
+
+        # The accounts are listed, and the items merged, whatever the raw mode.
+        self.client.raw = 'bytes'
+        results, = self.run_all(self.client.get_for_accounts('transactions'))
+        self.assertEqual(list(results), [a['id'] for a in accounts])
+        self.assertIsInstance(results['a3'], bytes)
+        merged = self.collect(self.client.iter_for_accounts('transactions'))
+        self.assertEqual([t['id'] for t in merged], ['ta4', 'ta3', 'ta2', 'ta1', 'ta0'])
+
+    def test_concurrency_limit_wakes_waiters(self):
+        limit = AdaptiveConcurrencyLimit(initial=1, max_limit=1)
+        token = limit.acquire()
+        acquired = []
+
+        async def use_slot(name):
+            async with _AdaptiveSlot(limit):
+                acquired.append(name)
+                await asyncio.sleep(0)
+
+        async def use_slots():
+            await asyncio.wait_for(asyncio.gather(use_slot('a'), use_slot('b')), 5)
+        # Another thread frees the slot while the tasks wait for it.
+        timer = threading.Timer(0.05, limit.release, (token,))
+        timer.start()
+        self.run_all(use_slots())
+        self.assertEqual(sorted(acquired), ['a', 'b'])
+        self.assertEqual(limit.in_flight, 0)
+
+    def test_get_by_ids(self):
+        results, = self.run_all(self.client.get_transactions_by_ids(
+            'a1', ['missing', 't1', 't1'], max_workers=2))
+        self.assertIsInstance(results[0], NotFoundError)
+        self.assertEqual(results[1].id, 't1')
+        self.assertIs(results[2], results[1])
+
+    def test_hedging(self):
+        self.client.hedging = HedgingPolicy(initial_delay=0.05)
+        Handler.slow_time = True
+        start = time.time()
+        result, = self.run_all(self.client.get_time())
+        self.assertEqual(result.epoch, 1)
+        self.assertLess(time.time() - start, 0.8)
+
+    def test_price_cache(self):
+        self.client.price_cache = PriceCache(max_age=0, max_stale=60)
+        first, = self.run_all(self.client.get_spot_price())
+        self.assertEqual(first.response.headers['Age'], '0')
+        # The stale quote is served while a task refreshes it.
+        second, = self.run_all(self.client.get_spot_price())
+        self.assertEqual(second.amount, '1.00')
+        self.assertEqual(len(self.client._background_tasks), 1)
+        self.loop.run_until_complete(asyncio.wait(list(self.client._background_tasks)))
+        self.assertEqual(len(self.client._background_tasks), 0)
+
+    def test_coalescing(self):
+        Handler.slow_time = True
+        before = Handler.time_requests
+        results = self.run_all(*[self.client.get_time() for _ in range(10)])
+        self.assertEqual(Handler.time_requests - before, 1)
+        self.assertTrue(all(r.epoch == 1 for r in results))
+
+    def test_raw(self):
+        listing, body, price = self.run_all(
+            self.client.get_accounts(raw=True), self.client.get_accounts(raw='bytes'),
+            self.client.get_spot_price(raw=True))
+        self.assertIs(type(listing), dict)
+        self.assertEqual([a['id'] for a in listing['data']], [a['id'] for a in accounts])
+        self.assertTrue(all(isinstance(page, bytes) for page in body))
+        self.assertGreater(len(body), 1)
+        self.assertEqual(price['data']['amount'], '1.00')
+        iterator = self.client.iter_accounts(raw=True)
+        self.assertEqual([type(a) for a in self.collect(iterator)], [dict] * len(accounts))
+
+    def test_many_concurrent_requests(self):
+        self.client.coalesce_gets = False
+        prices = self.run_all(*[self.client.get_spot_price() for _ in range(500)])
+        self.assertEqual(len(prices), 500)
+        self.assertTrue(all(p.amount == '1.00' for p in prices))
+
+
+@unittest2.skipIf(aiohttp is None, 'requires Python 3.6+ and aiohttp')
+class TestAsyncOAuthClient(TestAsyncClient):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.client = AsyncOAuthClient(
+            'fakeaccesstoken', 'fakerefreshtoken', self.base_api_uri)
+
+    def test_refresh(self):
+        self.run_all(self.client.refresh())
+        self.assertEqual(self.client.access_token, 'new')
+        self.assertEqual(self.client.refresh_token, 'newer')
+        # Later requests use the new access token.
+        with self.assertRaises(AuthenticationError):
+            self.run_all(self.client.get_spot_price())
@@ -12,7 +12,9 @@ import unittest2
 import warnings
 
 from coinbase.wallet.model import APIObject
+from coinbase.wallet.model import Money
 from coinbase.wallet.model import new_api_object
+from coinbase.wallet.model import new_lazy_api_object
 
 
 # Dummy API key values for use in tests
@@ -113,6 +115,40 @@ class TestNewApiObject(unittest2.TestCase):
             self.assertNotIsInstance(obj, Foo)
         coinbase.wallet.model._obj_keys_to_model = original
 
+    def test_new_api_object_guesses_based_on_modified_keys(self):
+        def api_client(x): return x
+
+        class Foo(APIObject):
+            pass
+        import coinbase.wallet.model
+        keys_to_model = coinbase.wallet.model._obj_keys_to_model
+        self.assertNotIsInstance(new_api_object(api_client, simple_data), Foo)
+        # Changes made in place are picked up too.
+        keys_to_model[frozenset(('str', 'foo'))] = Foo
+        try:
+            self.assertIsInstance(new_api_object(api_client, simple_data), Foo)
+        finally:
+            del keys_to_model[frozenset(('str', 'foo'))]
+        self.assertNotIsInstance(new_api_object(api_client, simple_data), Foo)
+
+    def test_new_api_object_calls_custom_init(self):
+        class Foo(APIObject):
+            def __init__(self, api_client, **kwargs):
+                super(Foo, self).__init__(api_client, **kwargs)
+                self._initialized = True
+        import coinbase.wallet.model
+        original = coinbase.wallet.model._resource_to_model
+        coinbase.wallet.model._resource_to_model = {'foo': Foo}
+        try:
+            obj = new_api_object(None, {'nested': {'resource': 'foo', 'str': 'bar'}})
+        finally:
+            coinbase.wallet.model._resource_to_model = original
+        self.assertIsInstance(obj.nested, Foo)
+        self.assertTrue(obj.nested._initialized)
+        self.assertEqual(obj.nested.str, 'bar')
+        self.assertIsNone(obj.api_client)
+        self.assertIsNone(obj.resource_path)
+
     def test_new_api_object_transforms_types_appropriately(self):
         def api_client(x): return x
         simple_obj = new_api_object(api_client, simple_data)
@@ -235,3 +271,25 @@ class TestNewApiObject(unittest2.TestCase):
         simple_obj2 = new_api_object(api_client, simple_data)
         with self.assertRaises(KeyError):
             simple_obj2[0]
+
+    def test_lazy(self):
+        def api_client(x): return x
+        data = dict(simple_data, money={'amount': '1', 'currency': 'USD'})
+        obj = new_lazy_api_object(api_client, data)
+        # Nested values stay as they were decoded until accessed.
+        self.assertIs(dict.__getitem__(obj, 'obj'), data['obj'])
+        nested = obj.obj
+        self.assertIsInstance(nested, APIObject)
+        self.assertIs(nested.api_client, api_client)
+        self.assertIs(obj.obj, nested)
+        self.assertIs(obj['obj'], nested)
+        self.assertIsInstance(nested.obj, APIObject)
+        self.assertIsInstance(obj.get('money'), Money)
+        self.assertIsNone(obj.get('missing'))
+        self.assertEqual([o.str for o in obj.list_of_objs], ['one', 'two', 'three'])
+        self.assertIs(obj.list_of_objs, obj.list_of_objs)
+        self.assertEqual(obj.list, [1, 2, 3])
+        self.assertEqual(obj, new_api_object(api_client, data))
+        self.assertEqual(json.loads(str(obj)), data)
+        # The decoded data is left untouched.
+        self.assertIs(type(data['obj']), dict)
@@ -0,0 +1,102 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+import time
+import unittest2
+
+import requests
+
+from coinbase.wallet.batch import AdaptiveConcurrencyLimit
+from coinbase.wallet.batch import map_concurrently
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.error import RateLimitExceededError
+
+
+def api_error(error_class, status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return error_class(response, '', '')
+
+
+class TestAdaptiveConcurrencyLimit(unittest2.TestCase):
+    def complete(self, limit, count, error=None, latency=0.0):
+        for _ in range(count):
+            token = limit.acquire()
+            limit.release(token - latency, error)
+
+    def test_additive_increase(self):
+        limit = AdaptiveConcurrencyLimit(initial=2, max_limit=4)
+        self.complete(limit, 2)
+        self.assertEqual(limit.limit, 3)
+        self.complete(limit, 3)
+        self.assertEqual(limit.limit, 4)
+        self.complete(limit, 20)
+        self.assertEqual(limit.limit, 4)
+        self.assertEqual(limit.in_flight, 0)
+
+    def test_multiplicative_decrease(self):
+        limit = AdaptiveConcurrencyLimit(initial=16)
+        tokens = [limit.acquire() for _ in range(3)]
+        error = api_error(RateLimitExceededError, 429)
+        for token in tokens:
+            limit.release(token, error)
+        # Requests started before the decrease do not cut the limit again.
+        self.assertEqual(limit.limit, 8)
+        self.complete(limit, 1, api_error(RateLimitExceededError, 429))
+        self.assertEqual(limit.limit, 4)
+        self.complete(limit, 1, requests.exceptions.ConnectionError())
+        self.assertEqual(limit.limit, 2)
+        # Errors that do not signal overload leave the limit alone.
+        self.complete(limit, 1, api_error(NotFoundError, 404))
+        self.assertEqual(limit.limit, 2)
+        self.complete(limit, 5, api_error(RateLimitExceededError, 429))
+        self.assertEqual(limit.limit, 1)
+
+    def test_release_callbacks(self):
+        limit = AdaptiveConcurrencyLimit(initial=1)
+        calls = []
+        limit.add_release_callback(lambda: calls.append(limit.in_flight))
+        self.complete(limit, 2)
+        self.assertEqual(calls, [0, 0])
+
+    def test_latency(self):
+        limit = AdaptiveConcurrencyLimit(initial=8, latency_tolerance=2)
+        self.complete(limit, 1, latency=0.1)
+        self.assertEqual(limit.limit, 8)
+        self.complete(limit, 1, latency=0.5)
+        self.assertEqual(limit.limit, 4)
+
+    def test_map_concurrently(self):
+        limit = AdaptiveConcurrencyLimit(initial=2, max_limit=3)
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def work(item):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return item * 2
+
+        self.assertEqual(map_concurrently(work, range(30), limit=limit), list(range(0, 60, 2)))
+        self.assertEqual(limit.limit, 3)
+        self.assertLessEqual(running[1], 3)
+        self.assertEqual(limit.in_flight, 0)
+
+    def test_map_concurrently_errors(self):
+        def work(item):
+            if item == 3:
+                raise ValueError(item)
+            return item
+
+        results = map_concurrently(work, range(5), max_workers=2, return_exceptions=True)
+        self.assertEqual(results[:3], [0, 1, 2])
+        self.assertIsInstance(results[3], ValueError)
+        with self.assertRaises(ValueError):
+            map_concurrently(work, range(5), max_workers=2)
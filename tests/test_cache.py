@@ -0,0 +1,294 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import unittest2
+
+import httpretty as hp
+import requests
+
+from coinbase.wallet.cache import MemoryCacheBackend
+from coinbase.wallet.cache import PriceCache
+from coinbase.wallet.cache import ResourceCache
+from coinbase.wallet.cache import ResponseCache
+from coinbase.wallet.cache import ValidatorCache
+from coinbase.wallet.client import Client
+from coinbase.wallet.model import APIObject
+from coinbase.wallet.model import PaymentMethod
+from coinbase.wallet.model import Transaction
+
+
+class TestMemoryCacheBackend(unittest2.TestCase):
+    def test_lru(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set('a', 1, 60)
+        backend.set('b', 2, 60)
+        self.assertEqual(backend.get('a'), 1)
+        backend.set('c', 3, 60)
+        # 'b' was the least recently used entry.
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('a'), 1)
+        self.assertEqual(backend.get('c'), 3)
+        self.assertEqual(len(backend), 2)
+
+    def test_ttl(self):
+        backend = MemoryCacheBackend()
+        backend.set('a', 1, 0.05)
+        self.assertEqual(backend.get('a'), 1)
+        time.sleep(0.06)
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(len(backend), 0)
+
+    def test_delete_prefix(self):
+        backend = MemoryCacheBackend()
+        backend.set('x|1', 1, 60)
+        backend.set('x|2', 2, 60)
+        backend.set('y|1', 3, 60)
+        backend.delete_prefix('x|')
+        self.assertIsNone(backend.get('x|1'))
+        self.assertEqual(backend.get('y|1'), 3)
+
+
+class TestResponseCache(unittest2.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(ttls={'time': 0, 'currencies': 10})
+        self.client = Client('fakeapikey', 'fakeapisecret', cache=self.cache)
+        hp.enable()
+        hp.register_uri(hp.GET, re.compile('.*/v2/currencies$'), lambda r, u, h: (
+            200, h, json.dumps({'data': [{'id': 'USD', 'name': 'US Dollar'}]})))
+        hp.register_uri(hp.GET, re.compile('.*/v2/time$'), lambda r, u, h: (
+            200, h, json.dumps({'data': {'epoch': 1}})))
+        hp.register_uri(hp.GET, re.compile('.*/v2/payment-methods$'), lambda r, u, h: (
+            200, h, json.dumps({'data': [{'id': 'pm', 'resource': 'payment_method'}]})))
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def test_hits(self):
+        first = self.client.get_currencies()
+        second = self.client.get_currencies()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 1)
+        self.assertIsInstance(second, APIObject)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second[0].name, 'US Dollar')
+        self.assertEqual(second.resource_path, '/v2/currencies')
+        # Changing a returned model does not change the cached data.
+        second.data[0].name = 'changed'
+        self.assertEqual(self.client.get_currencies()[0].name, 'US Dollar')
+        self.assertEqual(self.cache.stats(), {'hits': 2, 'misses': 1})
+        # Different parameters are cached separately.
+        self.client.get_currencies(foo='bar')
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 2)
+
+    def test_disabled_and_uncached_groups(self):
+        self.client.get_time()
+        self.client.get_time()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 2)
+        self.assertEqual(self.cache.stats(), {'hits': 0, 'misses': 0})
+
+    def test_invalidate(self):
+        self.client.get_currencies()
+        self.cache.invalidate('currencies')
+        self.client.get_currencies()
+        self.cache.invalidate()
+        self.client.get_currencies()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+
+    def test_private_groups_are_not_shared(self):
+        methods = self.client.get_payment_methods()
+        self.assertIsInstance(self.client.get_payment_methods()[0], PaymentMethod)
+        self.client.get_currencies()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 2)
+        other = Client('otherkey', 'othersecret', cache=self.cache)
+        other.get_payment_methods()
+        # Currencies are the same for everyone.
+        other.get_currencies()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+        self.assertEqual(methods[0].id, 'pm')
+
+
+class TestValidatorCache(unittest2.TestCase):
+    def setUp(self):
+        self.cache = ValidatorCache()
+        self.client = Client('fakeapikey', 'fakeapisecret', validator_cache=self.cache)
+        self.requests = []
+        hp.enable()
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/a1$'), self.respond)
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def respond(self, request, uri, headers):
+        self.requests.append(request)
+        if request.headers.get('If-None-Match', None) == '"v1"':
+            return 304, {}, ''
+        headers = dict(headers, ETag='"v1"', **{'Last-Modified': 'Mon, 01 Jan 2018 00:00:00 GMT'})
+        return 200, headers, json.dumps({'data': {'id': 'a1', 'resource': 'account'}})
+
+    def test_not_modified(self):
+        first = self.client.get_account('a1')
+        second = self.client.get_account('a1')
+        self.assertEqual(len(self.requests), 2)
+        self.assertIsNone(self.requests[0].headers.get('If-None-Match', None))
+        self.assertEqual(self.requests[1].headers['If-None-Match'], '"v1"')
+        self.assertEqual(
+            self.requests[1].headers['If-Modified-Since'], 'Mon, 01 Jan 2018 00:00:00 GMT')
+        self.assertEqual(second, first)
+        self.assertEqual(second.resource_path, '/v2/accounts/a1')
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_eviction(self):
+        cache = ValidatorCache(max_entries=1)
+        response = requests.Response()
+        response.headers['ETag'] = '"x"'
+        response._content = b'{}'
+        cache.set('a', response, {})
+        cache.set('b', response, {})
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b').etag, '"x"')
+        cache = ValidatorCache(max_bytes=1)
+        cache.set('a', response, {})
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+class TestPriceCache(unittest2.TestCase):
+    def setUp(self):
+        self.cache = PriceCache(max_age=0.05, max_stale=0.5)
+        self.client = Client('fakeapikey', 'fakeapisecret', price_cache=self.cache)
+        self.calls = 0
+        hp.enable()
+        hp.register_uri(hp.GET, re.compile('.*/v2/prices/.*'), self.respond)
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def respond(self, request, uri, headers):
+        self.calls += 1
+        amount = '%d.00' % self.calls
+        return 200, headers, json.dumps({'data': {'amount': amount, 'currency': 'USD'}})
+
+    def wait_for_calls(self, calls):
+        deadline = time.time() + 2
+        while self.calls < calls and time.time() < deadline:
+            time.sleep(0.01)
+        # Let the refresh store its result.
+        time.sleep(0.02)
+
+    def test_stale_while_revalidate(self):
+        self.assertEqual(self.client.get_spot_price().amount, '1.00')
+        fresh = self.client.get_spot_price()
+        self.assertEqual(fresh.amount, '1.00')
+        self.assertEqual(fresh.response.headers['Age'], '0')
+        self.assertEqual(self.calls, 1)
+        # Each pair and price type is cached separately.
+        self.assertEqual(self.client.get_buy_price().amount, '2.00')
+        self.assertEqual(self.client.get_spot_price(currency_pair='ETH-USD').amount, '3.00')
+        time.sleep(0.06)
+        # Stale quotes are served while a single refresh runs.
+        self.assertEqual(self.client.get_spot_price().amount, '1.00')
+        self.assertEqual(self.client.get_spot_price().amount, '1.00')
+        self.wait_for_calls(4)
+        self.assertEqual(self.calls, 4)
+        self.assertEqual(self.client.get_spot_price().amount, '4.00')
+
+    def test_expired(self):
+        self.client.get_spot_price()
+        time.sleep(0.6)
+        self.assertEqual(self.client.get_spot_price().amount, '2.00')
+        self.assertEqual(self.calls, 2)
+
+
+class TestResourceCache(unittest2.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'resources.db')
+        self.statuses = {'t1': 'completed', 't2': 'pending'}
+        self.calls = 0
+        hp.enable()
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/a1/transactions/.*'), self.respond)
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+        shutil.rmtree(self.directory)
+
+    def respond(self, request, uri, headers):
+        self.calls += 1
+        id_ = uri.split('?')[0].split('/')[-1]
+        return 200, headers, json.dumps({'data': {
+            'id': id_, 'resource': 'transaction', 'status': self.statuses[id_]}})
+
+    def test_terminal_resources(self):
+        client = Client('fakeapikey', 'fakeapisecret', resource_cache=ResourceCache(self.path))
+        first = client.get_transaction('a1', 't1')
+        # A new cache on the same file stands for another process, or a restart.
+        client.resource_cache = ResourceCache(self.path)
+        second = client.get_transaction('a1', 't1')
+        self.assertEqual(self.calls, 1)
+        self.assertIsInstance(second, Transaction)
+        self.assertEqual(second, first)
+        self.assertEqual(second.resource_path, '/v2/accounts/a1/transactions/t1')
+        # Resources that may still change, and requests with parameters, are
+        # not cached.
+        client.get_transaction('a1', 't2')
+        client.get_transaction('a1', 't2')
+        client.get_transaction('a1', 't1', expand='all')
+        self.assertEqual(self.calls, 4)
+        self.assertEqual(len(client.resource_cache), 1)
+
+    def test_eviction(self):
+        cache = ResourceCache(self.path, max_entries=2)
+        cache.ACCESS_RESOLUTION = 0
+        cache.set('/a', {'data': 1})
+        cache.set('/b', {'data': 2})
+        time.sleep(0.01)
+        self.assertEqual(cache.get('/a'), {'data': 1})
+        cache.set('/c', {'data': 3})
+        # '/b' was the least recently used entry.
+        self.assertIsNone(cache.get('/b'))
+        self.assertEqual(len(cache), 2)
+        cache = ResourceCache(self.path, max_bytes=30)
+        cache.set('/d', {'data': 'x' * 10})
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get('/a'))
+
+    def test_batch_eviction(self):
+        cache = ResourceCache(self.path, max_entries=10)
+        for i in range(10):
+            cache.set('/%d' % i, i)
+        # Replacing a resource does not count it twice.
+        cache.set('/9', 9)
+        self.assertEqual(len(cache), 10)
+        # Exceeding the limit evicts the oldest resources down to 90% of it.
+        cache.set('/10', 10)
+        self.assertEqual(len(cache), 9)
+        self.assertIsNone(cache.get('/1'))
+        self.assertEqual(cache.get('/2'), 2)
+        # The totals survive reopening the database.
+        self.assertEqual(len(ResourceCache(self.path)), 9)
+
+    def test_access_resolution(self):
+        cache = ResourceCache(self.path)
+        cache.set('/a', 1)
+        accessed = cache._connection().execute('SELECT accessed FROM resources').fetchone()
+        time.sleep(0.01)
+        # Recent reads do not write to the database.
+        self.assertEqual(cache.get('/a'), 1)
+        self.assertEqual(
+            cache._connection().execute('SELECT accessed FROM resources').fetchone(), accessed)
+        cache.ACCESS_RESOLUTION = 0
+        self.assertEqual(cache.get('/a'), 1)
+        self.assertNotEqual(
+            cache._connection().execute('SELECT accessed FROM resources').fetchone(), accessed)
@@ -0,0 +1,87 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import time
+import unittest2
+
+import httpretty as hp
+import requests
+
+from coinbase.wallet.circuit import CircuitBreaker
+from coinbase.wallet.client import Client
+from coinbase.wallet.error import CircuitOpenError
+from coinbase.wallet.error import CoinbaseError
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.error import ServiceUnavailableError
+
+
+def api_error(status_code, error_class=ServiceUnavailableError):
+    response = requests.Response()
+    response.status_code = status_code
+    return error_class(response, '', '')
+
+
+class TestCircuitBreaker(unittest2.TestCase):
+    def test_trips_and_recovers(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.1)
+        for _ in range(2):
+            breaker.before_request('prices')
+            breaker.after_request('prices', api_error(503))
+        # A success resets the count of consecutive failures.
+        breaker.after_request('prices')
+        for _ in range(3):
+            self.assertEqual(breaker.state('prices'), 'closed')
+            breaker.before_request('prices')
+            breaker.after_request('prices', requests.exceptions.Timeout())
+        self.assertEqual(breaker.state('prices'), 'open')
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.before_request('prices')
+        self.assertIsInstance(context.exception, CoinbaseError)
+        self.assertEqual(context.exception.group, 'prices')
+        # Other groups are not affected.
+        breaker.before_request('accounts')
+
+        time.sleep(0.1)
+        breaker.before_request('prices')
+        self.assertEqual(breaker.state('prices'), 'half-open')
+        # Only one probe at a time.
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request('prices')
+        breaker.after_request('prices', api_error(502))
+        self.assertEqual(breaker.state('prices'), 'open')
+
+        time.sleep(0.1)
+        breaker.before_request('prices')
+        breaker.after_request('prices', api_error(404, NotFoundError))
+        self.assertEqual(breaker.state('prices'), 'closed')
+
+    def test_ignores_other_errors(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.before_request('prices')
+        breaker.after_request('prices', KeyboardInterrupt())
+        breaker.after_request('prices', api_error(422, NotFoundError))
+        self.assertEqual(breaker.state('prices'), 'closed')
+
+
+class TestClientCircuitBreaker(unittest2.TestCase):
+    @hp.activate
+    def test_fails_fast(self):
+        hp.register_uri(hp.GET, re.compile('.*/v2/prices/BTC-USD/spot$'), responses=[
+            hp.Response(json.dumps({'errors': [{'id': 'service_unavailable'}]}), status=503)])
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        client = Client('fakeapikey', 'fakeapisecret', circuit_breaker=breaker)
+        # The first two failures trip the breaker.
+        for _ in range(2):
+            with self.assertRaises(ServiceUnavailableError):
+                client.get_spot_price()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 2)
+        with self.assertRaises(CircuitOpenError):
+            client.get_spot_price()
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 2)
+        self.assertEqual(breaker.state('prices'), 'open')
+        self.assertEqual(breaker.state('accounts'), 'closed')
@@ -4,9 +4,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import gc
 import json
 import re
 import six
+import threading
+import time
 import unittest2
 import warnings
 try:
@@ -24,6 +27,7 @@ from coinbase.wallet.error import InvalidTokenError
 from coinbase.wallet.error import TwoFactorRequiredError
 from coinbase.wallet.error import ExpiredTokenError
 from coinbase.wallet.error import RevokedTokenError
+from coinbase.wallet.error import ServiceUnavailableError
 from coinbase.wallet.model import APIObject
 from coinbase.wallet.model import Account
 from coinbase.wallet.model import Merchant
@@ -39,6 +43,7 @@ from coinbase.wallet.model import Transaction
 from coinbase.wallet.model import User
 from coinbase.wallet.model import Withdrawal
 from coinbase.wallet.model import Report
+from tests.helpers import mock_paginated_response
 from tests.helpers import mock_response
 
 
@@ -55,6 +60,11 @@ refresh_token = 'fakerefreshtoken'
 
 mock_item = {'key1': 'val1', 'key2': 'val2'}
 mock_collection = [mock_item, mock_item]
+mock_pages = [
+    [{'id': 'a'}, {'id': 'b'}],
+    [{'id': 'c'}, {'id': 'd'}],
+    [{'id': 'e'}],
+]
 
 
 class TestClient(unittest2.TestCase):
@@ -155,6 +165,45 @@ class TestClient(unittest2.TestCase):
         with self.assertRaises(APIError):
             client._get('test')
 
+    def test_connection_pool_options(self):
+        client = Client(api_key, api_secret)
+        adapter = client.session.get_adapter(Client.BASE_API_URI)
+        self.assertEqual(adapter._pool_maxsize, Client.POOL_MAXSIZE)
+        self.assertFalse(adapter._pool_block)
+
+        client = Client(api_key, api_secret, pool_connections=2, pool_maxsize=64,
+                        pool_block=True)
+        adapter = client.session.get_adapter(Client.BASE_API_URI)
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertTrue(adapter._pool_block)
+
+        client = OAuthClient(access_token, refresh_token, pool_maxsize=64)
+        adapter = client.session.get_adapter(Client.BASE_API_URI)
+        self.assertEqual(adapter._pool_maxsize, 64)
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_shared_between_threads(self):
+        client = Client(api_key, api_secret, pool_maxsize=16, pool_block=True)
+        results = []
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(10):
+                    results.append([t.id for t in client.get_transactions('foo').data])
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 160)
+        for ids in results:
+            self.assertEqual(ids, ['a', 'b', 'c', 'd', 'e'])
+
     @hp.activate
     def test_request_helper_automatically_encodes_data(self):
         client = Client(api_key, api_secret)
@@ -364,6 +413,205 @@ class TestClient(unittest2.TestCase):
         for transaction in transactions.data:
             self.assertIsInstance(transaction, Transaction)
 
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_get_transactions_merges_pages(self):
+        client = Client(api_key, api_secret)
+        transactions = client.get_transactions('foo')
+        self.assertEqual(
+            [t.id for t in transactions.data], ['a', 'b', 'c', 'd', 'e'])
+        self.assertIsNone(transactions.pagination.next_uri)
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_iter_transactions(self):
+        client = Client(api_key, api_secret)
+        transactions = client.iter_transactions('foo')
+        self.assertNotIsInstance(transactions, (list, APIObject))
+        first = next(transactions)
+        self.assertIsInstance(first, Transaction)
+        self.assertEqual(first.id, 'a')
+        # Only the first page has been requested so far.
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 1)
+        ids = [first.id] + [t.id for t in transactions]
+        self.assertEqual(ids, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_iter_transactions_page_size(self):
+        client = Client(api_key, api_secret)
+        list(client.iter_transactions('foo'))
+        self.assertEqual(hp.last_request().querystring['limit'], ['100'])
+        list(client.iter_transactions('foo', limit=1000))
+        self.assertEqual(hp.last_request().querystring['limit'], ['100'])
+        list(client.iter_transactions('foo', limit=2))
+        self.assertEqual(hp.last_request().querystring['limit'], ['2'])
+        self.assertEqual(
+            hp.last_request().querystring['starting_after'], ['d'])
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_iter_transactions_budgets(self):
+        client = Client(api_key, api_secret)
+        transactions = client.iter_transactions('foo', max_items=3)
+        self.assertEqual([t.id for t in transactions], ['a', 'b', 'c'])
+        self.assertEqual(transactions.cursor, 'c')
+        self.assertTrue(transactions.has_more)
+        self.assertEqual(hp.last_request().querystring['limit'], ['3'])
+
+        transactions = client.iter_transactions('foo', max_pages=2)
+        self.assertEqual([t.id for t in transactions], ['a', 'b', 'c', 'd'])
+        self.assertEqual(transactions.cursor, 'd')
+        self.assertEqual(transactions.pages_fetched, 2)
+
+        # The cursor can be used to carry on where iteration stopped.
+        rest = client.iter_transactions('foo', starting_after=transactions.cursor)
+        self.assertEqual([t.id for t in rest], ['e'])
+        self.assertIsNone(rest.cursor)
+        self.assertFalse(rest.has_more)
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_iter_transactions_prefetch(self):
+        client = Client(api_key, api_secret)
+        transactions = client.iter_transactions('foo', prefetch=2)
+        self.assertEqual(next(transactions).id, 'a')
+        # The remaining pages are fetched in the background while the first one
+        # is still being consumed.
+        for _ in range(100):
+            if len(hp.HTTPretty.latest_requests) == 3:
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+        self.assertEqual([t.id for t in transactions], ['b', 'c', 'd', 'e'])
+        self.assertIsNone(transactions.cursor)
+
+        with client.iter_transactions('foo', prefetch=1, max_items=3) as transactions:
+            self.assertEqual([t.id for t in transactions], ['a', 'b', 'c'])
+        self.assertEqual(transactions.cursor, 'c')
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_iter_transactions_prefetch_abandoned(self):
+        # Breaking out of a loop without closing the iterator stops its thread.
+        client = Client(api_key, api_secret)
+        baseline = threading.active_count()
+        for _ in range(5):
+            for transaction in client.iter_transactions('foo', prefetch=1, limit=2):
+                break
+        gc.collect()
+        for _ in range(100):
+            if threading.active_count() <= baseline:
+                break
+            time.sleep(0.02)
+        self.assertLessEqual(threading.active_count(), baseline)
+
+    @hp.activate
+    def test_iter_transactions_prefetch_error(self):
+        client = Client(api_key, api_secret)
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/foo/transactions$'),
+            lambda r, u, h: (503, h, '{}'))
+        with self.assertRaises(ServiceUnavailableError):
+            next(client.iter_transactions('foo', prefetch=2, page_retries=0))
+
+    @hp.activate
+    def test_iter_transactions_resumes_after_failure(self):
+        pages = {
+            None: {'data': [{'id': 'a'}], 'pagination': {'next_uri': '/x?starting_after=a'}},
+            'a': {'data': [{'id': 'b'}], 'pagination': {'next_uri': '/x?starting_after=b'}},
+            'b': {'data': [{'id': 'c'}], 'pagination': {'next_uri': None}},
+        }
+        failures = []
+
+        def server_response(request, uri, headers):
+            cursor = request.querystring.get('starting_after', [None])[0]
+            if cursor in failures:
+                failures.remove(cursor)
+                return 503, headers, '{}'
+            return 200, headers, json.dumps(pages[cursor])
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/foo/transactions$'), server_response)
+        client = Client(api_key, api_secret)
+
+        # A transient failure is retried transparently.
+        failures[:] = ['a']
+        transactions = client.iter_transactions('foo')
+        transactions.RETRY_BACKOFF = 0
+        self.assertEqual([t.id for t in transactions], ['a', 'b', 'c'])
+
+        # Other requests are not retried without a retry policy.
+        failures[:] = [None, None]
+        with self.assertRaises(ServiceUnavailableError):
+            client.get_transactions('foo')
+        self.assertEqual(failures, [None])
+
+        # Once the retries are used up the error is raised, but iteration can
+        # carry on from the last good page.
+        for prefetch in (0, 2):
+            failures[:] = ['a', 'a']
+            transactions = client.iter_transactions(
+                'foo', page_retries=1, prefetch=prefetch)
+            transactions.RETRY_BACKOFF = 0
+            self.assertEqual(next(transactions).id, 'a')
+            with self.assertRaises(ServiceUnavailableError):
+                next(transactions)
+            self.assertEqual(transactions.cursor, 'a')
+            self.assertEqual([t.id for t in transactions], ['b', 'c'])
+
+        # The position can be saved and restored elsewhere.
+        transactions = client.iter_transactions('foo')
+        self.assertEqual(next(transactions).id, 'a')
+        state = json.dumps(transactions.get_state())
+        resumed = client.iter_transactions('foo', resume_from=state)
+        self.assertEqual([t.id for t in resumed], ['b', 'c'])
+        self.assertEqual(resumed.items_yielded, 3)
+        done = client.iter_transactions('foo', resume_from=resumed.get_state())
+        self.assertEqual(list(done), [])
+        with self.assertRaises(ValueError):
+            client.iter_buys('foo', resume_from=state)
+
+    @mock_paginated_response(hp.GET, '/v2/accounts/foo/transactions', mock_pages)
+    def test_get_transactions_iterator(self):
+        client = Client(api_key, api_secret)
+        transactions = client.get_transactions('foo', iterator=True)
+        self.assertEqual([t.id for t in transactions], ['a', 'b', 'c', 'd', 'e'])
+        # The option itself is never sent to the API.
+        self.assertNotIn('iterator', hp.last_request().querystring)
+
+    @hp.activate
+    def test_get_for_accounts(self):
+        account_transactions = {
+            'a1': [{'id': 't1', 'created_at': '2015-03-11T13:00:00-07:00'}],
+            'a2': [{'id': 't2', 'created_at': '2015-03-11T21:00:00Z'}],
+        }
+
+        def server_response(request, uri, headers):
+            account_id = urlparse(uri).path.split('/')[3]
+            if account_id not in account_transactions:
+                return 404, headers, json.dumps({'errors': [{'id': 'not_found'}]})
+            return 200, headers, json.dumps({'data': account_transactions[account_id]})
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/[^/]+/transactions$'), server_response)
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts$'), lambda r, u, h: (
+            200, h, json.dumps({'data': [{'id': 'a1'}, {'id': 'a2'}]})))
+        client = Client(api_key, api_secret)
+
+        results = client.get_for_accounts('transactions')
+        self.assertEqual(list(results), ['a1', 'a2'])
+        self.assertEqual([t.id for t in results['a2'].data], ['t2'])
+        self.assertIsInstance(results['a1'].data[0], Transaction)
+
+        account = Account(client)
+        account.update({'id': 'a2'})
+        results = client.get_for_accounts('transactions', [account, 'a3'], return_exceptions=True)
+        self.assertEqual(results['a2'].data[0].id, 't2')
+        self.assertIsInstance(results['a3'], APIError)
+        with self.assertRaises(APIError):
+            client.get_for_accounts('transactions', ['a1', 'a3'], max_workers=1)
+        with self.assertRaises(ValueError):
+            client.get_for_accounts('accounts', ['a1'])
+
+        # Merged by creation time, newest first unless asked otherwise.
+        self.assertEqual([t.id for t in client.iter_for_accounts('transactions')], ['t2', 't1'])
+        self.assertEqual(
+            [t.id for t in client.iter_for_accounts('transactions', order='asc')], ['t1', 't2'])
+
     @mock_response(hp.GET, '/v2/accounts/foo/transactions/bar', mock_item)
     def test_get_transaction(self):
         client = Client(api_key, api_secret)
@@ -371,6 +619,27 @@ class TestClient(unittest2.TestCase):
         self.assertIsInstance(transaction, Transaction)
         self.assertEqual(transaction, mock_item)
 
+    @hp.activate
+    def test_get_transactions_by_ids(self):
+        def server_response(request, uri, headers):
+            transaction_id = urlparse(uri).path.split('/')[-1]
+            if transaction_id == 'missing':
+                return 404, headers, json.dumps({'errors': [{'id': 'not_found'}]})
+            return 200, headers, json.dumps({'data': {'id': transaction_id}})
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/foo/transactions/[^/]+$'), server_response)
+        client = Client(api_key, api_secret)
+        results = client.get_transactions_by_ids(
+            'foo', ['t1', 'missing', 't2', 't1'], max_workers=2)
+        self.assertEqual(len(results), 4)
+        self.assertIsInstance(results[0], Transaction)
+        self.assertEqual(results[0].id, 't1')
+        self.assertIsInstance(results[1], APIError)
+        self.assertEqual(results[2].id, 't2')
+        self.assertIs(results[3], results[0])
+        # Duplicate ids are only requested once.
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+
     @mock_response(hp.POST, '/v2/accounts/foo/transactions', mock_item)
     def test_send_money(self):
         client = Client(api_key, api_secret)
@@ -0,0 +1,102 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import threading
+import time
+import unittest2
+
+import httpretty as hp
+
+from coinbase.wallet.batch import map_concurrently
+from coinbase.wallet.client import Client
+from coinbase.wallet.coalesce import SingleFlight
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.model import Account
+
+
+class TestSingleFlight(unittest2.TestCase):
+    def test_shares_outcome(self):
+        single_flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait()
+            return object()
+
+        def call(key):
+            return single_flight.do(key, slow)
+
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        results = map_concurrently(call, ['a'] * 5 + ['b'], max_workers=6)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(set(map(id, results[:5]))), 1)
+        self.assertIsNot(results[5], results[0])
+        self.assertEqual(len(single_flight), 0)
+
+    def test_shares_exception(self):
+        single_flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.05)
+            raise ValueError('boom')
+
+        results = map_concurrently(
+            lambda _: single_flight.do('a', fail), range(3), return_exceptions=True)
+        self.assertIsInstance(results[0], ValueError)
+        self.assertTrue(all(r is results[0] for r in results))
+
+
+class TestClientCoalescing(unittest2.TestCase):
+    def setUp(self):
+        self.calls = 0
+        hp.enable()
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/.*'), self.respond)
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def respond(self, request, uri, headers):
+        self.calls += 1
+        time.sleep(0.1)
+        if uri.endswith('missing'):
+            return 404, headers, json.dumps({'errors': [{'id': 'not_found'}]})
+        return 200, headers, json.dumps({'data': {'id': 'a1', 'resource': 'account'}})
+
+    def test_identical_gets(self):
+        client = Client('fakeapikey', 'fakeapisecret')
+        accounts = map_concurrently(lambda _: client.get_account('a1'), range(10), 10)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(a.id == 'a1' for a in accounts))
+        # Each caller gets a model of its own.
+        self.assertEqual(len(set(map(id, accounts))), 10)
+
+        errors = map_concurrently(
+            lambda _: client.get_account('missing'), range(5), 5, return_exceptions=True)
+        self.assertIsInstance(errors[0], NotFoundError)
+        self.assertTrue(all(e is errors[0] for e in errors))
+        self.assertEqual(self.calls, 2)
+
+    def test_disabled(self):
+        client = Client('fakeapikey', 'fakeapisecret', coalesce_gets=False)
+        map_concurrently(lambda _: client.get_account('a1'), range(3), 3)
+        self.assertEqual(self.calls, 3)
+
+    def test_raw_mode(self):
+        client = Client('fakeapikey', 'fakeapisecret')
+        modes = [True, None, True, None, 'bytes', False]
+        results = map_concurrently(
+            lambda raw: client.get_account('a1', raw=raw), modes, len(modes))
+        # Calls only share a request with those of the same raw mode.
+        self.assertEqual(self.calls, 3)
+        self.assertEqual([type(r) for r in results[:4]], [dict, Account, dict, Account])
+        self.assertIsInstance(results[4], bytes)
+        self.assertIsInstance(results[5], Account)
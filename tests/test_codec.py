@@ -0,0 +1,138 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import unittest2
+
+import httpretty as hp
+
+from coinbase.wallet import codec
+from coinbase.wallet.client import Client
+from coinbase.wallet.client import OAuthClient
+from coinbase.wallet.codec import JSONCodec
+from coinbase.wallet.codec import available_codecs
+from coinbase.wallet.codec import default_codec
+from coinbase.wallet.codec import get_codec
+from coinbase.wallet.error import APIError
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.util import encode_params
+
+page = {
+    'pagination': {'next_uri': None, 'limit': 25},
+    'data': [{
+        'id': 't%d' % i,
+        'amount': {'amount': '-0.0%d' % i, 'currency': 'BTC'},
+        'description': 'Caf\xe9 ☕',
+        'instant_exchange': False,
+        'fee': 0.5,
+        'resource_path': '/v2/accounts/a1/transactions/t%d' % i,
+    } for i in range(3)],
+}
+
+
+class TestCodecs(unittest2.TestCase):
+    def test_available_codecs(self):
+        names = available_codecs()
+        self.assertEqual(names[-1], 'json')
+        self.assertEqual(default_codec().name, names[0])
+        self.assertIs(default_codec(), default_codec())
+
+    def test_round_trip(self):
+        for name in available_codecs():
+            json_codec = get_codec(name)
+            encoded = json_codec.dumps(page)
+            self.assertIsInstance(encoded, type(''))
+            self.assertEqual(json.loads(encoded), page)
+            self.assertEqual(json_codec.loads(encoded), page)
+            self.assertEqual(json_codec.loads(encoded.encode('utf-8')), page)
+            with self.assertRaises(ValueError):
+                json_codec.loads(b'{"data": ')
+
+    def test_get_codec(self):
+        with self.assertRaises(ValueError):
+            get_codec('yaml')
+        missing = [cls.name for cls, module in codec._CODECS if module() is None]
+        for name in missing:
+            with self.assertRaises(ValueError):
+                get_codec(name)
+
+    def test_encode_params(self):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return 'encoded'
+        self.assertEqual(json.loads(encode_params({'a': 1, 'b': None})), {'a': 1})
+        self.assertEqual(encode_params({'a': 1}, codec=Codec()), 'encoded')
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super(RecordingCodec, self).dumps(obj)
+
+    def loads(self, data):
+        self.calls.append('loads')
+        return super(RecordingCodec, self).loads(data)
+
+
+class TestClientCodec(unittest2.TestCase):
+    def setUp(self):
+        self.codec = RecordingCodec()
+        self.client = Client('fakeapikey', 'fakeapisecret', json_codec=self.codec)
+        hp.enable()
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def test_default(self):
+        self.assertIs(Client('fakeapikey', 'fakeapisecret').json_codec, default_codec())
+
+    def test_requests_and_responses(self):
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/a1/transactions$'),
+            body=json.dumps(page))
+        transactions = self.client.get_transactions('a1')
+        self.assertEqual(self.codec.calls, ['loads'])
+        self.assertEqual(transactions.data[0].description, 'Caf\xe9 ☕')
+
+        bodies = []
+
+        def create(request, uri, headers):
+            bodies.append(json.loads(request.body.decode('utf-8')))
+            return 201, headers, json.dumps({'data': {'id': 'n1', 'name': 'New'}})
+        hp.register_uri(hp.POST, re.compile('.*/v2/accounts$'), create)
+        self.codec.calls = []
+        account = self.client.create_account(name='New')
+        self.assertEqual(self.codec.calls, ['dumps', 'loads'])
+        self.assertEqual(bodies, [{'name': 'New'}])
+        self.assertEqual(account.id, 'n1')
+
+    def test_errors(self):
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/missing$'), status=404,
+            body=json.dumps({'errors': [{'id': 'not_found', 'message': 'Not found'}]}))
+        with self.assertRaises(NotFoundError) as context:
+            self.client.get_account('missing')
+        self.assertEqual(context.exception.message, 'Not found')
+        self.assertEqual(self.codec.calls, ['loads'])
+
+    def test_invalid_responses(self):
+        # Bodies without data (or tokens) are decoded again to build the error,
+        # with the same codec.
+        hp.register_uri(hp.GET, re.compile('.*/v2/time$'), body='{}')
+        with self.assertRaises(APIError):
+            self.client.get_time()
+        self.assertEqual(self.codec.calls, ['loads', 'loads'])
+        hp.register_uri(hp.POST, re.compile('.*/oauth/token$'), body='{}')
+        client = OAuthClient('fakeaccesstoken', 'fakerefreshtoken', json_codec=self.codec)
+        self.codec.calls = []
+        with self.assertRaises(APIError):
+            client.refresh()
+        self.assertEqual(self.codec.calls[-2:], ['loads', 'loads'])
@@ -0,0 +1,139 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import unittest2
+
+import httpretty as hp
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.compact import CompactObject
+from coinbase.wallet.compact import compact_model
+from coinbase.wallet.compact import new_compact_object
+from coinbase.wallet.model import Money
+from coinbase.wallet.model import Transaction
+from coinbase.wallet.model import new_api_object
+
+transaction_data = {
+    'id': 't1',
+    'type': 'send',
+    'status': 'pending',
+    'amount': {'amount': '-0.1', 'currency': 'BTC'},
+    'resource': 'transaction',
+    'resource_path': '/v2/accounts/a1/transactions/t1',
+    'network': {'status': 'unconfirmed', 'hash': 'abc'},
+    'from': {'id': 'u1', 'resource': 'user'},
+    'unknown': [{'key': 'value'}, 1],
+}
+
+
+class TestCompactObject(unittest2.TestCase):
+    def test_fields(self):
+        tx = new_compact_object('client', transaction_data)
+        self.assertIsInstance(tx, compact_model(Transaction))
+        self.assertIs(tx.model, Transaction)
+        self.assertIs(tx.api_client, 'client')
+        self.assertEqual(tx.id, 't1')
+        self.assertEqual(getattr(tx, 'from').id, 'u1')
+        self.assertIs(tx.amount.model, Money)
+        self.assertEqual(str(tx.amount), 'BTC -0.1')
+        self.assertEqual(tx.network.status, 'unconfirmed')
+        self.assertEqual(tx.unknown[0].key, 'value')
+        self.assertEqual(tx['unknown'][1], 1)
+        self.assertEqual(tx.resource_path, '/v2/accounts/a1/transactions/t1')
+        # Missing fields behave as with `APIObject`.
+        self.assertFalse(hasattr(tx, 'description'))
+        self.assertNotIn('description', tx)
+        with self.assertRaises(KeyError):
+            tx['description']
+        self.assertIsNone(tx.get('description'))
+        # Methods are not fields.
+        self.assertTrue(callable(tx.complete))
+        self.assertNotIn('complete', tx)
+
+    def test_no_instance_dict(self):
+        tx = new_compact_object(None, transaction_data)
+        for obj in (tx, tx.amount, tx.network):
+            self.assertFalse(hasattr(obj, '__dict__'))
+        # Known fields are all in slots.
+        self.assertEqual(tx._extra, {'unknown': tx.unknown})
+        with self.assertRaises(AttributeError):
+            tx.network._extra
+
+    def test_to_dict(self):
+        tx = new_compact_object(None, transaction_data)
+        plain = tx.to_dict()
+        self.assertEqual(plain, transaction_data)
+        self.assertIs(type(plain['network']), dict)
+        self.assertEqual(json.loads(str(tx)), transaction_data)
+        self.assertEqual(tx, new_api_object(None, transaction_data))
+        self.assertEqual(tx, new_compact_object(None, transaction_data))
+
+    def test_set_and_delete(self):
+        tx = new_compact_object(None, transaction_data)
+        tx.status = 'completed'
+        tx.extra_field = 1
+        tx['other'] = 2
+        self.assertEqual(tx['status'], 'completed')
+        self.assertEqual(tx.extra_field, 1)
+        self.assertEqual(tx.other, 2)
+        del tx.status
+        del tx['other']
+        self.assertNotIn('status', tx)
+        self.assertNotIn('other', tx)
+        with self.assertRaises(AttributeError):
+            del tx.status
+        tx.update({'status': 'canceled'}, description='x')
+        self.assertEqual((tx.status, tx.description), ('canceled', 'x'))
+        self.assertIn('extra_field', tx.keys())
+
+    def test_generic_objects(self):
+        obj = new_compact_object(None, {'data': [{'a': 1}, {'a': 2}], 'keys': 'x'})
+        self.assertIsInstance(obj, CompactObject)
+        self.assertEqual(obj[1].a, 2)
+        self.assertEqual(obj['keys'], 'x')
+        self.assertEqual(sorted(obj.keys()), ['data', 'keys'])
+
+
+class TestCompactClient(unittest2.TestCase):
+    def setUp(self):
+        self.client = Client('fakeapikey', 'fakeapisecret', compact_models=True)
+        self.status = 'pending'
+        hp.enable()
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/a1/transactions/t1$'), lambda r, u, h: (
+                200, h, json.dumps({'data': dict(transaction_data, status=self.status)})))
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/a1/transactions$'), lambda r, u, h: (
+                200, h, json.dumps({'data': [transaction_data], 'pagination': {}})))
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def test_models(self):
+        tx = self.client.get_transaction('a1', 't1')
+        self.assertIs(tx.model, Transaction)
+        self.assertIs(tx.api_client, self.client)
+        self.assertEqual(tx.resource_path, '/v2/accounts/a1/transactions/t1')
+        self.assertIsNotNone(tx.response)
+        self.status = 'completed'
+        tx.refresh()
+        self.assertEqual(tx.status, 'completed')
+
+        listing = self.client.get_transactions('a1')
+        self.assertIs(listing.data[0].model, Transaction)
+        self.assertEqual([t.id for t in self.client.iter_transactions('a1')], ['t1'])
+
+    def test_lazy_models(self):
+        self.client.compact_models = False
+        self.client.lazy_models = True
+        tx = self.client.get_transaction('a1', 't1')
+        self.assertIsInstance(tx, Transaction)
+        self.assertIs(type(dict.__getitem__(tx, 'amount')), dict)
+        self.assertIsInstance(tx.amount, Money)
+        self.assertEqual(tx.resource_path, '/v2/accounts/a1/transactions/t1')
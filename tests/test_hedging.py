@@ -0,0 +1,88 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import threading
+import time
+import unittest2
+
+import httpretty as hp
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.error import InternalServerError
+from coinbase.wallet.hedging import HedgingPolicy
+from coinbase.wallet.ratelimit import RateLimiter
+
+
+class TestHedgingPolicy(unittest2.TestCase):
+    def test_delay(self):
+        policy = HedgingPolicy(percentile=90, min_samples=10, initial_delay=0.5)
+        self.assertEqual(policy.delay('prices'), 0.5)
+        for latency in range(1, 11):
+            policy.record('prices', latency / 100)
+        self.assertEqual(policy.delay('prices'), 0.09)
+        self.assertEqual(policy.delay('accounts'), 0.5)
+        policy.max_delay = 0.05
+        self.assertEqual(policy.delay('prices'), 0.05)
+
+    def test_window(self):
+        policy = HedgingPolicy(percentile=100, window=5, min_samples=1)
+        for latency in (9, 1, 1, 1, 1, 1):
+            policy.record('prices', latency)
+        self.assertEqual(policy.delay('prices'), 1)
+
+
+class TestHedgedRequests(unittest2.TestCase):
+    def setUp(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def register(self, first_delay, status=200):
+        def server_response(request, uri, headers):
+            with self.lock:
+                self.calls += 1
+                call = self.calls
+            if call == 1:
+                time.sleep(first_delay)
+            body = {'data': {'amount': str(call)}}
+            if status != 200:
+                body = {'errors': [{'id': 'internal_server_error'}]}
+            return status, headers, json.dumps(body)
+        hp.register_uri(hp.GET, re.compile('.*/v2/prices/BTC-USD/spot$'), server_response)
+
+    @hp.activate
+    def test_slow_request_is_hedged(self):
+        self.register(first_delay=1)
+        limiter = RateLimiter(default=(1, 100))
+        client = Client('fakeapikey', 'fakeapisecret', rate_limiter=limiter,
+                        hedging=HedgingPolicy(initial_delay=0.05))
+        start = time.time()
+        price = client.get_spot_price()
+        self.assertLess(time.time() - start, 0.8)
+        # The answer came from the hedge.
+        self.assertEqual(price.amount, '2')
+        self.assertEqual(self.calls, 2)
+        # Both requests were counted by the rate limiter.
+        self.assertLess(limiter.default_bucket.tokens, 99)
+
+    @hp.activate
+    def test_fast_request_is_not_hedged(self):
+        self.register(first_delay=0)
+        policy = HedgingPolicy(initial_delay=0.5)
+        client = Client('fakeapikey', 'fakeapisecret', hedging=policy)
+        self.assertEqual(client.get_spot_price().amount, '1')
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(policy._latencies['prices']), 1)
+
+    @hp.activate
+    def test_errors(self):
+        self.register(first_delay=0.2, status=500)
+        client = Client('fakeapikey', 'fakeapisecret',
+                        hedging=HedgingPolicy(initial_delay=0.05))
+        with self.assertRaises(InternalServerError):
+            client._request('get', 'v2', 'prices', 'BTC-USD', 'spot')
+        self.assertEqual(self.calls, 2)
@@ -24,6 +24,7 @@ from coinbase.wallet.model import Buy
 from coinbase.wallet.model import Address
 from coinbase.wallet.model import Transaction
 from coinbase.wallet.model import Report
+from tests.helpers import mock_paginated_response
 from tests.helpers import mock_response
 
 
@@ -157,6 +158,16 @@ class TestAccount(unittest2.TestCase):
         for transaction in transactions.data:
             self.assertIsInstance(transaction, Transaction)
 
+    @mock_paginated_response(
+        hp.GET, '/v2/accounts/foo/transactions', [[{'id': 'a'}], [{'id': 'b'}]])
+    def test_iter_transactions(self):
+        client = Client(api_key, api_secret)
+        account = new_api_object(client, mock_account, Account)
+        transactions = list(account.iter_transactions())
+        self.assertEqual([t.id for t in transactions], ['a', 'b'])
+        for transaction in transactions:
+            self.assertIsInstance(transaction, Transaction)
+
     @mock_response(hp.GET, '/v2/accounts/foo/transactions/bar', mock_item)
     def test_get_transaction(self):
         client = Client(api_key, api_secret)
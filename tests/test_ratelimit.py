@@ -0,0 +1,114 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import time
+import unittest2
+
+import httpretty as hp
+import requests
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.error import RateLimitExceededError
+from coinbase.wallet.model import Buy
+from coinbase.wallet.model import Transaction
+from coinbase.wallet.model import new_api_object
+from coinbase.wallet.ratelimit import RateLimiter
+from coinbase.wallet.ratelimit import TokenBucket
+from coinbase.wallet.ratelimit import retry_after
+
+
+def make_response(status_code=200, **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(dict((k.replace('_', '-'), str(v)) for k, v in headers.items()))
+    return response
+
+
+class TestTokenBucket(unittest2.TestCase):
+    def test_reserve(self):
+        bucket = TokenBucket(10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        # Once the burst is spent, callers queue up at the configured rate.
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_adapts_to_429(self):
+        bucket = TokenBucket(10)
+        bucket.update(make_response(429, Retry_After=3))
+        self.assertEqual(bucket.rate, 5)
+        self.assertAlmostEqual(bucket.reserve(), 3, places=1)
+        for _ in range(5):
+            bucket.update(make_response(200))
+        self.assertEqual(bucket.rate, 7.5)
+        for _ in range(20):
+            bucket.update(make_response(200))
+        self.assertEqual(bucket.rate, 10)
+
+    def test_adapts_to_rate_limit_headers(self):
+        bucket = TokenBucket(10)
+        bucket.update(make_response(200, X_RateLimit_Remaining=20, X_RateLimit_Reset=10))
+        self.assertAlmostEqual(bucket.rate, 2, places=2)
+        bucket.update(make_response(
+            200, X_RateLimit_Remaining=0, X_RateLimit_Reset=int(time.time()) + 5))
+        self.assertGreater(bucket.reserve(), 4)
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after(make_response(429, Retry_After=2)), 2)
+        self.assertIsNone(retry_after(make_response(429)))
+        self.assertEqual(retry_after(make_response(429, Retry_After='soon'), 1), 1)
+        self.assertEqual(retry_after(
+            make_response(429, Retry_After='Wed, 21 Oct 2015 07:28:00 GMT')), 0)
+
+
+class TestRateLimiter(unittest2.TestCase):
+    def test_groups(self):
+        limiter = RateLimiter({'prices': (5, 1)}, default=100)
+        self.assertEqual(limiter.bucket('prices').rate, 5)
+        self.assertIs(limiter.bucket('accounts'), limiter.bucket('orders'))
+        self.assertIsNone(RateLimiter({'prices': 5}).bucket('accounts'))
+        self.assertEqual(RateLimiter().reserve('accounts'), 0)
+
+    @hp.activate
+    def test_client(self):
+        hp.register_uri(hp.GET, re.compile('.*/v2/prices/BTC-USD/spot$'), responses=[
+            hp.Response(json.dumps({'errors': [{'id': 'rate_limit_exceeded'}]}),
+                        status=429, adding_headers={'Retry-After': '0.2'}),
+            hp.Response(json.dumps({'data': {'amount': '1.00'}}), status=200),
+        ])
+        limiter = RateLimiter({'prices': (100, 1)})
+        client = Client('fakeapikey', 'fakeapisecret', rate_limiter=limiter)
+        with self.assertRaises(RateLimitExceededError):
+            client.get_spot_price()
+        self.assertEqual(limiter.bucket('prices').rate, 50)
+        start = time.time()
+        self.assertEqual(client.get_spot_price().amount, '1.00')
+        # The second request was held back for as long as the API asked.
+        self.assertGreaterEqual(time.time() - start, 0.15)
+
+    @hp.activate
+    def test_model_methods(self):
+        # Model methods request resource paths; they count against the group of
+        # the resource, like the client methods.
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/a1/transactions/t1$'),
+                        body=json.dumps({'data': {'id': 't1'}}))
+        hp.register_uri(hp.POST, re.compile('.*/v2/accounts/a1/buys/b1/commit$'),
+                        body=json.dumps({'data': {'id': 'b1'}}))
+        groups = []
+
+        class RecordingLimiter(RateLimiter):
+            def acquire(self, group):
+                groups.append(group)
+                return super(RecordingLimiter, self).acquire(group)
+        client = Client('fakeapikey', 'fakeapisecret', rate_limiter=RecordingLimiter())
+        for path, cls, method in [('/v2/accounts/a1/transactions/t1', Transaction, 'refresh'),
+                                  ('/v2/accounts/a1/buys/b1', Buy, 'commit')]:
+            response = make_response()
+            response.url = 'https://api.coinbase.com' + path
+            getattr(new_api_object(client, {}, cls, response=response), method)()
+        self.assertEqual(groups, ['accounts', 'accounts'])
@@ -0,0 +1,138 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import os
+import re
+import tempfile
+import unittest2
+import warnings
+
+import httpretty as hp
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.error import APIError
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.model import APIObject
+from coinbase.wallet.model import Transaction
+
+
+def page_body(ids, next_id=None):
+    next_uri = None
+    if next_id is not None:
+        next_uri = '/v2/accounts/a1/transactions?starting_after=%s' % next_id
+    return json.dumps({
+        'pagination': {'next_uri': next_uri, 'limit': 2},
+        'data': [{'id': id_, 'resource': 'transaction',
+                  'amount': {'amount': '1.0', 'currency': 'BTC'}} for id_ in ids],
+    }).encode('utf-8')
+
+
+pages = [page_body(['t1', 't2'], 't2'), page_body(['t3'])]
+transaction_body = json.dumps({
+    'data': {'id': 't1', 'resource': 'transaction', 'status': 'completed'},
+    'warnings': [{'message': 'deprecated', 'url': 'docs'}],
+}).encode('utf-8')
+
+
+class TestRawMode(unittest2.TestCase):
+    def setUp(self):
+        self.client = Client('fakeapikey', 'fakeapisecret')
+        self.queries = []
+        hp.enable()
+
+        def listing(request, uri, headers):
+            self.queries.append(request.querystring)
+            after = request.querystring.get('starting_after', [None])[0]
+            return 200, headers, pages[1 if after == 't2' else 0]
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/a1/transactions$'), listing)
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/a1/transactions/t1$'), body=transaction_body)
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/accounts/a1/transactions/missing$'), status=404,
+            body=json.dumps({'errors': [{'id': 'not_found', 'message': 'Not found'}]}))
+
+    def tearDown(self):
+        hp.disable()
+        hp.reset()
+
+    def test_dicts(self):
+        listing = self.client.get_transactions('a1', raw=True)
+        self.assertIs(type(listing), dict)
+        self.assertEqual([t['id'] for t in listing['data']], ['t1', 't2', 't3'])
+        self.assertIs(type(listing['data'][0]['amount']), dict)
+        self.assertEqual(listing['pagination']['next_uri'], None)
+        # The option is not sent to the API.
+        self.assertTrue(all('raw' not in query for query in self.queries))
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            tx = self.client.get_transaction('a1', 't1', raw='dicts')
+        self.assertEqual(tx['data']['status'], 'completed')
+        self.assertEqual([str(w.message) for w in caught], ['deprecated (docs)'])
+
+    def test_bytes(self):
+        self.assertEqual(self.client.get_transactions('a1', raw='bytes'), pages)
+        self.assertEqual(self.client.get_transaction('a1', 't1', raw='bytes'), transaction_body)
+
+    def test_per_client(self):
+        client = Client('fakeapikey', 'fakeapisecret', raw='dicts')
+        self.assertIs(type(client.get_transactions('a1')), dict)
+        self.assertEqual(client.get_transaction('a1', 't1', raw='bytes'), transaction_body)
+        self.assertIsInstance(client.get_transaction('a1', 't1', raw=False), Transaction)
+        # Methods of models still update them with models.
+        tx = client.get_transaction('a1', 't1', raw=False)
+        tx.refresh()
+        self.assertIsInstance(tx, Transaction)
+
+    def test_iterators(self):
+        items = list(self.client.iter_transactions('a1', raw=True, limit=2))
+        self.assertEqual([type(t) for t in items], [dict] * 3)
+        self.assertEqual([t['id'] for t in items], ['t1', 't2', 't3'])
+        paginator = self.client.iter_transactions('a1', raw='bytes', limit=2)
+        self.assertEqual(list(paginator), pages)
+        self.assertIsNone(paginator.cursor)
+
+    def test_for_accounts(self):
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts$'), body=json.dumps({
+            'pagination': {'next_uri': None}, 'data': [{'id': 'a1', 'resource': 'account'}]}))
+        client = Client('fakeapikey', 'fakeapisecret', raw='bytes')
+        self.assertEqual(client.get_for_accounts('transactions'), {'a1': pages})
+        merged = client.iter_for_accounts('transactions', limit=2)
+        self.assertEqual([t['id'] for t in merged], ['t1', 't2', 't3'])
+
+    def test_sync(self):
+        path = os.path.join(tempfile.mkdtemp(), 'cursors.db')
+        new = self.client.iter_new_transactions('a1', path, raw='bytes')
+        self.assertEqual(list(new), pages)
+        self.assertTrue(all('raw' not in query for query in self.queries))
+        # The cursor is the id of the first (newest) transaction; this fake API
+        # ignores it and serves the first page again, oldest item first.
+        new = self.client.iter_new_transactions('a1', path, raw=True)
+        self.assertEqual([t['id'] for t in new], ['t2', 't1'])
+        self.assertEqual(self.queries[-1]['ending_before'], ['t1'])
+
+    def test_errors(self):
+        with self.assertRaises(NotFoundError):
+            self.client.get_transaction('a1', 'missing', raw='bytes')
+        with self.assertRaises(ValueError):
+            self.client.get_transactions('a1', raw='models')
+        hp.register_uri(hp.GET, re.compile('.*/v2/time$'), body='{"errors": []}')
+        with self.assertRaises(APIError):
+            self.client.get_time(raw=True)
+
+    def test_cached_responses(self):
+        from coinbase.wallet.cache import ResponseCache
+        self.client.cache = ResponseCache(ttls={'currencies': 60})
+        hp.register_uri(
+            hp.GET, re.compile('.*/v2/currencies$'), body=json.dumps({'data': [{'id': 'USD'}]}))
+        self.assertIsInstance(self.client.get_currencies(), APIObject)
+        body = self.client.get_currencies(raw='bytes')
+        self.assertEqual(json.loads(body.decode('utf-8')), {'data': [{'id': 'USD'}]})
+        # Changing a result does not change the cached entry.
+        self.client.get_currencies(raw=True)['data'].append('changed')
+        self.assertEqual(self.client.get_currencies(raw=True), {'data': [{'id': 'USD'}]})
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 1)
@@ -0,0 +1,108 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import re
+import unittest2
+
+import httpretty as hp
+import requests
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.error import BadGatewayError
+from coinbase.wallet.error import InternalServerError
+from coinbase.wallet.error import NotFoundError
+from coinbase.wallet.error import RateLimitExceededError
+from coinbase.wallet.retry import RetryPolicy
+
+
+def error_response(status, error_id, **headers):
+    body = json.dumps({'errors': [{'id': error_id, 'message': error_id}]})
+    return hp.Response(body, status=status, adding_headers=headers)
+
+
+class TestRetryPolicy(unittest2.TestCase):
+    def test_allows(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.allows('get'))
+        self.assertFalse(policy.allows('post', {'to': 'foo'}))
+        self.assertTrue(policy.allows('post', {'to': 'foo', 'idem': 'key'}))
+        self.assertFalse(policy.allows('put', {'idem': 'key'}))
+        self.assertFalse(policy.allows('delete'))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5, jitter=0)
+        self.assertEqual([policy.backoff_delay(n) for n in range(1, 5)], [1, 2, 4, 5])
+        policy.jitter = 0.5
+        for _ in range(100):
+            self.assertTrue(1 <= policy.backoff_delay(2) <= 2)
+
+    def test_next_delay(self):
+        policy = RetryPolicy(max_attempts=3, backoff=1, jitter=0, deadline=10)
+        error = requests.exceptions.ConnectionError()
+        self.assertEqual(policy.next_delay(error, 1, 0), 1)
+        self.assertEqual(policy.next_delay(error, 2, 0), 2)
+        self.assertIsNone(policy.next_delay(error, 3, 0))
+        self.assertIsNone(policy.next_delay(error, 2, 9))
+        self.assertIsNone(policy.next_delay(ValueError(), 1, 0))
+        response = requests.Response()
+        response.status_code = 429
+        response.headers['Retry-After'] = '7'
+        error = RateLimitExceededError(response, 'rate_limit_exceeded', '')
+        self.assertEqual(policy.next_delay(error, 1, 0), 7)
+
+
+class TestClientRetries(unittest2.TestCase):
+    def setUp(self):
+        self.client = Client('fakeapikey', 'fakeapisecret',
+                             retry_policy=RetryPolicy(backoff=0.01))
+
+    @hp.activate
+    def test_get_is_retried(self):
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/foo$'), responses=[
+            error_response(500, 'internal_server_error'),
+            error_response(503, 'service_unavailable'),
+            hp.Response(json.dumps({'data': {'id': 'foo'}})),
+        ])
+        self.assertEqual(self.client.get_account('foo').id, 'foo')
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+
+    @hp.activate
+    def test_gives_up(self):
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/foo$'), responses=[
+            error_response(500, 'internal_server_error')])
+        with self.assertRaises(InternalServerError):
+            self.client.get_account('foo')
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 3)
+
+    @hp.activate
+    def test_client_errors_are_not_retried(self):
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/foo$'), responses=[
+            error_response(404, 'not_found')])
+        with self.assertRaises(NotFoundError):
+            self.client.get_account('foo')
+        self.assertEqual(len(hp.HTTPretty.latest_requests), 1)
+
+    @hp.activate
+    def test_post_needs_idempotency_key(self):
+        bodies = []
+
+        def server_response(request, uri, headers):
+            bodies.append(json.loads(request.body.decode('utf-8')))
+            if len(bodies) == 1:
+                return 502, headers, json.dumps({'errors': [{'id': 'bad_gateway'}]})
+            return 201, headers, json.dumps({'data': {'id': 'tx'}})
+        hp.register_uri(
+            hp.POST, re.compile('.*/v2/accounts/foo/transactions$'), server_response)
+        with self.assertRaises(BadGatewayError):
+            self.client.send_money('foo', to='bar', amount='1', currency='BTC')
+        self.assertEqual(len(bodies), 1)
+
+        del bodies[:]
+        tx = self.client.send_money('foo', to='bar', amount='1', currency='BTC', idem='k1')
+        self.assertEqual(tx.id, 'tx')
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(bodies[0], bodies[1])
@@ -0,0 +1,140 @@
+# coding: utf-8
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest2
+
+import httpretty as hp
+
+from coinbase.wallet.client import Client
+from coinbase.wallet.model import Transaction
+from coinbase.wallet.sync import FileCursorStore
+from coinbase.wallet.sync import MemoryCursorStore
+from coinbase.wallet.sync import SQLiteCursorStore
+
+
+api_key = 'fakeapikey'
+api_secret = 'fakeapisecret'
+
+
+class FakeListing(object):
+    """Serves a newest-first listing, honoring `starting_after` and `ending_before`."""
+
+    def __init__(self, ids):
+        self.ids = list(ids)
+
+    def __call__(self, request, uri, headers):
+        query = request.querystring
+        limit = int(query.get('limit', ['25'])[0])
+        if 'ending_before' in query:
+            end = self.ids.index(query['ending_before'][0])
+            page = self.ids[max(0, end - limit):end]
+        else:
+            start = 0
+            if 'starting_after' in query:
+                start = self.ids.index(query['starting_after'][0]) + 1
+            page = self.ids[start:start + limit]
+        next_uri = None
+        if page and page[-1] != self.ids[-1] and 'ending_before' not in query:
+            next_uri = '/v2/accounts/foo/transactions?starting_after=%s' % page[-1]
+        body = {
+            'data': [{'id': i, 'resource': 'transaction'} for i in page],
+            'pagination': {'next_uri': next_uri},
+        }
+        return 200, headers, json.dumps(body)
+
+
+class TestCursorStores(unittest2.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_stores(self):
+        stores = [
+            MemoryCursorStore(),
+            FileCursorStore(os.path.join(self.tmpdir, 'cursors.json')),
+            SQLiteCursorStore(os.path.join(self.tmpdir, 'cursors.db')),
+        ]
+        for store in stores:
+            self.assertIsNone(store.get('a'))
+            store.set('a', 'x')
+            store.set('b', 'y')
+            store.set('a', 'z')
+            self.assertEqual(store.get('a'), 'z')
+            self.assertEqual(store.get('b'), 'y')
+            store.delete('a')
+            self.assertIsNone(store.get('a'))
+
+    def test_persistent_stores_survive_reopening(self):
+        path = os.path.join(self.tmpdir, 'cursors.json')
+        FileCursorStore(path).set('a', 'x')
+        self.assertEqual(FileCursorStore(path).get('a'), 'x')
+        path = os.path.join(self.tmpdir, 'cursors.db')
+        SQLiteCursorStore(path).set('a', 'x')
+        self.assertEqual(SQLiteCursorStore(path).get('a'), 'x')
+
+    def test_corrupt_file(self):
+        path = os.path.join(self.tmpdir, 'cursors.json')
+        with open(path, 'w') as f:
+            f.write('{"a": "x", "b')
+        store = FileCursorStore(path)
+        self.assertIsNone(store.get('a'))
+        store.set('b', 'y')
+        self.assertEqual(FileCursorStore(path).get('b'), 'y')
+
+
+class TestIncrementalSync(unittest2.TestCase):
+    @hp.activate
+    def test_iter_new_transactions(self):
+        listing = FakeListing(['t5', 't4', 't3', 't2', 't1'])
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/foo/transactions$'), listing)
+        client = Client(api_key, api_secret)
+        store = MemoryCursorStore()
+
+        # The first sync walks the full history.
+        txs = list(client.iter_new_transactions('foo', store, limit=2))
+        self.assertEqual([t.id for t in txs], ['t5', 't4', 't3', 't2', 't1'])
+        self.assertIsInstance(txs[0], Transaction)
+        self.assertEqual(store.get('v2/accounts/foo/transactions'), 't5')
+
+        # Nothing new: a single request, nothing yielded.
+        request_count = len(hp.HTTPretty.latest_requests)
+        self.assertEqual(list(client.iter_new_transactions('foo', store, limit=2)), [])
+        self.assertEqual(len(hp.HTTPretty.latest_requests), request_count + 1)
+        self.assertEqual(hp.last_request().querystring['ending_before'], ['t5'])
+
+        # Only the new items are fetched, oldest first.
+        listing.ids[:0] = ['t8', 't7', 't6']
+        txs = list(client.iter_new_transactions('foo', store, limit=2))
+        self.assertEqual([t.id for t in txs], ['t6', 't7', 't8'])
+        self.assertEqual(store.get('v2/accounts/foo/transactions'), 't8')
+
+    @hp.activate
+    def test_interrupted_sync_resumes(self):
+        listing = FakeListing(['t3', 't2', 't1'])
+        hp.register_uri(hp.GET, re.compile('.*/v2/accounts/foo/transactions$'), listing)
+        client = Client(api_key, api_secret)
+        store = MemoryCursorStore()
+        store.set('v2/accounts/foo/transactions', 't1')
+
+        txs = client.iter_new_transactions('foo', store, limit=1)
+        self.assertEqual(next(txs).id, 't2')
+        # The cursor only moves once the page has been consumed.
+        self.assertEqual(store.get('v2/accounts/foo/transactions'), 't1')
+        txs.close()
+        self.assertEqual(
+            [t.id for t in client.iter_new_transactions('foo', store)], ['t2', 't3'])
+
+    def test_order(self):
+        client = Client(api_key, api_secret)
+        with self.assertRaises(ValueError):
+            next(client.iter_new_transactions('foo', MemoryCursorStore(), order='asc'))
@@ -7,6 +7,8 @@ from __future__ import unicode_literals
 import unittest2
 
 from coinbase.wallet.util import clean_params
+from coinbase.wallet.util import endpoint_group
+from coinbase.wallet.util import parse_timestamp
 
 
 class TestUtils(unittest2.TestCase):
@@ -57,3 +59,19 @@ class TestUtils(unittest2.TestCase):
                 'bool': 0,
             },
         })
+
+    def test_parse_timestamp(self):
+        self.assertEqual(parse_timestamp('2015-03-11T20:13:35Z'), 1426104815)
+        self.assertEqual(parse_timestamp('2015-03-11T13:13:35-07:00'), 1426104815)
+        self.assertEqual(parse_timestamp('2015-03-11T20:13:35.5+00:00'), 1426104815.5)
+        self.assertIsNone(parse_timestamp('yesterday'))
+        self.assertIsNone(parse_timestamp(None))
+
+    def test_endpoint_group(self):
+        self.assertEqual(endpoint_group(('v2', 'accounts', 'id', 'transactions')), 'accounts')
+        self.assertEqual(endpoint_group(('v2', 'prices', 'BTC-USD', 'spot')), 'prices')
+        self.assertEqual(endpoint_group(('oauth', 'token')), 'oauth')
+        # Resource paths, as passed by model methods.
+        self.assertEqual(endpoint_group(('/v2/accounts/a/transactions/t1',)), 'accounts')
+        self.assertEqual(endpoint_group(('/v2/accounts/a/buys/b1', 'commit')), 'accounts')
+        self.assertEqual(endpoint_group(('', '/v2/', 'prices')), 'prices')